@@ -0,0 +1,76 @@
+"""Measure event loop stalls while writing status frames to a slow stream.
+
+A ticker task measures the longest delay between its wake-ups while a
+producer writes 200 status frames to a stream whose writes take 5 ms each,
+once directly with print() and once through AsyncAnsiWriter.
+
+Usage: python benchmarks/bench_async_writer.py
+"""
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import asyncio
+import time
+import pyansiescapes.commands as ansi
+from pyansiescapes.async_writer import AsyncAnsiWriter
+
+FRAMES = 200
+
+
+class SlowStream:
+    """Text stream blocking 5 ms on each write."""
+    writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        time.sleep(0.005)
+
+    def flush(self):
+        pass
+
+
+async def ticker(lags, done):
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+def _frame(i):
+    return ansi.format("progress", "bold") + " {}/{}".format(i, FRAMES)
+
+
+async def with_print(stream):
+    for i in range(FRAMES):
+        print(ansi.clear_lines(1) + _frame(i), file=stream)
+        await asyncio.sleep(0.001)
+
+
+async def with_writer(stream):
+    async with AsyncAnsiWriter(stream) as writer:
+        for i in range(FRAMES):
+            writer.status([_frame(i)])
+            await asyncio.sleep(0.001)
+
+
+async def measure(producer):
+    lags, done, stream = [], asyncio.Event(), SlowStream()
+    task = asyncio.ensure_future(ticker(lags, done))
+    start = time.perf_counter()
+    await producer(stream)
+    seconds = time.perf_counter() - start
+    done.set()
+    await task
+    return max(lags), stream.writes, seconds
+
+
+def main():
+    for name, producer in (("print()", with_print),
+                           ("AsyncAnsiWriter", with_writer)):
+        lag, writes, seconds = asyncio.run(measure(producer))
+        print("{:<16} max loop stall {:>7.2f} ms {:>5d} writes {:>6.2f} s".format(
+            name, lag * 1000, writes, seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Compare quantizing 1M pixels with the scalar and the vectorized functions.
+
+The scalar and perceptual timings are measured on a sample and scaled to the
+full size. Random pixels are (almost) all distinct, which is the worst case
+for the perceptual matching.
+
+Usage: python benchmarks/bench_batch.py [number_of_pixels]
+"""
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import timeit
+import numpy as np
+import pyansiescapes.commands as ansi
+from pyansiescapes import batch, palette
+
+SAMPLE = 20000
+
+
+def main(pixels=1000000):
+    rng = np.random.default_rng(0)
+    rgb = rng.integers(0, 256, (pixels, 3), dtype=np.uint8)
+    hexes = np.array(["#{:02x}{:02x}{:02x}".format(*pixel)
+                      for pixel in rgb.tolist()])
+    sample_array = rgb[:SAMPLE]
+    sample = sample_array.tolist()
+    scale = pixels / SAMPLE
+
+    results = (
+        ("color(rgb=...) per pixel", scale * min(timeit.repeat(
+            lambda: [ansi.color(rgb=pixel) for pixel in sample],
+            number=1, repeat=3))),
+        ("nearest_color_id per pixel", scale * min(timeit.repeat(
+            lambda: [palette.nearest_color_id(*pixel) for pixel in sample],
+            number=1, repeat=3))),
+        ("batch.nearest_color_ids", min(timeit.repeat(
+            lambda: batch.nearest_color_ids(rgb), number=1, repeat=3))),
+        ("batch ids + sequences", min(timeit.repeat(
+            lambda: batch.color_sequences(batch.nearest_color_ids(rgb)),
+            number=1, repeat=3))),
+        ("batch.nearest_color_ids_from_hex", min(timeit.repeat(
+            lambda: batch.nearest_color_ids_from_hex(hexes),
+            number=1, repeat=3))),
+        ("batch.nearest_color_ids cie76", scale * min(timeit.repeat(
+            lambda: batch.nearest_color_ids(sample_array, "cie76"),
+            number=1, repeat=3))),
+        ("batch.nearest_color_ids ciede2000", scale * min(timeit.repeat(
+            lambda: batch.nearest_color_ids(sample_array, "ciede2000"),
+            number=1, repeat=3))),
+    )
+    for name, seconds in results:
+        print("{:<34} {:>9.3f} s for {:,d} pixels".format(name, seconds, pixels))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
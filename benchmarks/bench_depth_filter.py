@@ -0,0 +1,35 @@
+"""Measure the throughput of DepthFilter on a generated 256-color log.
+
+Usage: python benchmarks/bench_depth_filter.py [number_of_lines] [chunk_size]
+"""
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import timeit
+import pyansiescapes.commands as ansi
+from pyansiescapes.depth_filter import reduce_depth
+
+
+def _log(lines):
+    level = ansi.Style('bold', color='red1', emoji=False)
+    dim = ansi.Style(color='grey50', emoji=False)
+    return "".join(
+        dim("2020-06-01 12:00:{:02d} service.worker ".format(i % 60))
+        + level("ERROR") + " request failed id={}\n".format(i)
+        for i in range(lines))
+
+
+def main(lines=200000, chunk_size=65536):
+    log = _log(lines)
+    chunks = [log[i:i + chunk_size] for i in range(0, len(log), chunk_size)]
+    megabytes = len(log.encode()) / 1e6
+    for depth in (16, 8, 0):
+        seconds = min(timeit.repeat(
+            lambda: sum(1 for _ in reduce_depth(chunks, depth)),
+            number=1, repeat=3))
+        print("depth {:<8} {:.1f} MB in {:.3f} s: {:.1f} MB/s".format(
+            depth, megabytes, seconds, megabytes / seconds))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
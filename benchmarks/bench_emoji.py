@@ -0,0 +1,36 @@
+"""Time emoji shortcode handling when formatting plain and emoji-heavy texts.
+
+Usage: python benchmarks/bench_emoji.py
+"""
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import timeit
+import emojis
+import pyansiescapes.commands as ansi
+
+PLAIN = "GET /api/v1/items 200 OK in 12ms"
+EMOJI = "deploy :rocket: done :tada: checks :white_check_mark: :+1:"
+
+
+def _report(name, seconds, number):
+    print("{:<36} {:>8.3f} us/call".format(name, seconds / number * 1e6))
+
+
+def main(number=200000):
+    style = ansi.Style('bold', color='green')
+    plain_style = ansi.Style('bold', color='green', emoji=False)
+    for label, text in (("plain-ASCII", PLAIN), ("emoji-heavy", EMOJI)):
+        always = min(timeit.repeat(
+            lambda: style.prefix + emojis.encode(text) + style.suffix,
+            number=number, repeat=3))
+        _report(label + ", always encode", always, number)
+        fast = min(timeit.repeat(lambda: style(text), number=number, repeat=3))
+        _report(label + ", Style (fast path)", fast, number)
+        disabled = min(timeit.repeat(lambda: plain_style(text),
+                                     number=number, repeat=3))
+        _report(label + ", Style(emoji=False)", disabled, number)
+
+
+if __name__ == '__main__':
+    main()
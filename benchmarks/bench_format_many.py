@@ -0,0 +1,42 @@
+"""Compare cells/second of format_many against looping over format.
+
+Usage: python benchmarks/bench_format_many.py [number_of_cells]
+"""
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import timeit
+import pyansiescapes.commands as ansi
+
+
+def _report(name, seconds, cells):
+    print("{:<28} {:>12,.0f} cells/s".format(name, cells / seconds))
+
+
+def main(cells=100000):
+    texts = ["cell {}".format(i) for i in range(cells)]
+    styles = [{'color': 'red'}, ('bold',), {'background': 'blue'}] * (cells // 3)
+    styles += [('bold',)] * (cells - len(styles))
+
+    loop = min(timeit.repeat(
+        lambda: [ansi.format(text, 'bold', color='red') for text in texts],
+        number=1, repeat=3))
+    _report("format loop", loop, cells)
+    batch = min(timeit.repeat(
+        lambda: ansi.format_many(texts, 'bold', color='red'),
+        number=1, repeat=3))
+    _report("format_many (one style)", batch, cells)
+
+    loop = min(timeit.repeat(
+        lambda: [ansi.format(text, *style) if isinstance(style, tuple)
+                 else ansi.format(text, **style)
+                 for text, style in zip(texts, styles)],
+        number=1, repeat=3))
+    _report("format loop (3 styles)", loop, cells)
+    batch = min(timeit.repeat(
+        lambda: ansi.format_many(texts, styles=styles), number=1, repeat=3))
+    _report("format_many (3 styles)", batch, cells)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,48 @@
+"""Compare output size and time of the half-block renderer with one
+background(...) + space per pixel.
+
+Usage: python benchmarks/bench_image.py [height] [width]
+"""
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import math
+import timeit
+import pyansiescapes.commands as ansi
+from pyansiescapes import image
+
+
+def _image(height, width):
+    """A plot-like test image: smooth gradient with a flat colored box."""
+    pixels = []
+    for y in range(height):
+        row = []
+        for x in range(width):
+            if height // 4 <= y < height // 2 and width // 4 <= x < width // 2:
+                row.append((215, 0, 0))
+            else:
+                shade = int(127 + 127 * math.sin(x / 10))
+                row.append((shade, 255 * y // height, 95))
+        pixels.append(row)
+    return pixels
+
+
+def per_pixel(pixels):
+    return "".join("".join(ansi.color(rgb=pixel, drawing_level="background")
+                           + " " for pixel in row) + ansi.reset() + "\n"
+                   for row in pixels)
+
+
+def main(height=120, width=160):
+    pixels = _image(height, width)
+    for name, func in (("background() per pixel", lambda: per_pixel(pixels)),
+                       ("image.render 256", lambda: image.render(pixels)),
+                       ("image.render truecolor",
+                        lambda: image.render(pixels, "truecolor"))):
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print("{:<24} {:>9,d} bytes {:>8.3f} s".format(
+            name, len(func().encode()), seconds))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
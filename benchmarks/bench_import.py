@@ -0,0 +1,43 @@
+"""Measure the import time of pyansiescapes modules with ``python -X importtime``.
+
+Prints the median cumulative import time (in ms) of each pyansiescapes module
+(and emojis) over several fresh interpreter runs.
+
+Usage: python benchmarks/bench_import.py [module] [runs]
+"""
+import sys, os
+import statistics
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def measure(module="pyansiescapes.commands", runs=15):
+    """Return dict of module name to median cumulative import time in ms."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    samples = {}
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import " + module],
+            env=env, stderr=subprocess.PIPE, universal_newlines=True,
+            check=True).stderr
+        for line in output.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            name = name.strip()
+            if name.startswith(("pyansiescapes", "emojis")):
+                try:
+                    samples.setdefault(name, []).append(int(cumulative) / 1000)
+                except ValueError: # header line
+                    continue
+    return {name: statistics.median(times) for name, times in samples.items()}
+
+
+def main(module="pyansiescapes.commands", runs=15):
+    for name, milliseconds in sorted(measure(module, int(runs)).items()):
+        print("{:<32} {:>8.2f} ms".format(name, milliseconds))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
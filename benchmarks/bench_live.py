@@ -0,0 +1,49 @@
+"""Bytes emitted per frame by LiveRegion versus a full repaint.
+
+Renders a 50-line display where one value changes per frame.
+
+Usage: python benchmarks/bench_live.py [number_of_frames]
+"""
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import pyansiescapes.commands as ansi
+from pyansiescapes.live import LiveRegion
+
+LINES = 50
+
+
+def _frames(count):
+    values = [0] * LINES
+    for frame in range(count):
+        values[frame % LINES] += 1
+        yield ["worker {:02d}  processed {:>8d} items".format(i, value)
+               for i, value in enumerate(values)]
+
+
+def full_repaint(frames):
+    """Clear the block with clear_lines and print every line again."""
+    sizes = []
+    previous = 0
+    for lines in frames:
+        output = ansi.clear_lines(previous) + "".join(
+            line + "\n" for line in lines)
+        previous = len(lines)
+        sizes.append(len(output.encode()))
+    return sizes
+
+
+def live_region(frames):
+    region = LiveRegion()
+    return [len(region.render(lines).encode()) for lines in frames]
+
+
+def main(count=1000):
+    for name, func in (("full repaint", full_repaint),
+                       ("LiveRegion", live_region)):
+        sizes = func(_frames(count))[1:] # skip the initial frame
+        print("{:<14} {:>8.1f} bytes/frame".format(name, sum(sizes) / len(sizes)))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,57 @@
+"""Compare the throughput (records/second) of log formatters.
+
+    - logging.Formatter: plain, uncolored output
+    - format() per record: a formatter calling format() for the level name
+    - ColorFormatter: precompiled per-level format strings
+    - ColorFormatter (no tty): color disabled because the stream is no tty
+
+Usage: python benchmarks/bench_logging.py [number_of_records]
+"""
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import io
+import logging
+import timeit
+import pyansiescapes.commands as ansi
+from pyansiescapes.log_formatter import ColorFormatter
+
+FMT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+LEVEL_COLORS = {logging.DEBUG: "blue", logging.INFO: "green",
+                logging.WARNING: "yellow", logging.ERROR: "red",
+                logging.CRITICAL: "red"}
+
+
+class FormatPerRecord(logging.Formatter):
+    """The usual hand-written colored formatter."""
+
+    def format(self, record):
+        record = logging.makeLogRecord(record.__dict__)
+        record.levelname = ansi.format(record.levelname,
+                                       color=LEVEL_COLORS[record.levelno])
+        return super().format(record)
+
+
+def _records(number):
+    levels = list(LEVEL_COLORS)
+    return [logging.LogRecord("service.worker", levels[i % len(levels)],
+                              __file__, 1, "request %d failed", (i,), None)
+            for i in range(number)]
+
+
+def main(number=100000):
+    records = _records(number)
+    no_tty = ColorFormatter(FMT)
+    no_tty.stream = io.StringIO()
+    for name, formatter in (("logging.Formatter", logging.Formatter(FMT)),
+                            ("format() per record", FormatPerRecord(FMT)),
+                            ("ColorFormatter", ColorFormatter(FMT, use_color=True)),
+                            ("ColorFormatter (no tty)", no_tty)):
+        seconds = min(timeit.repeat(
+            lambda: [formatter.format(record) for record in records],
+            number=1, repeat=7))
+        print("{:<24} {:>12,.0f} records/s".format(name, number / seconds))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
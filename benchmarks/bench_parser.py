@@ -0,0 +1,48 @@
+"""Measure the throughput of AnsiParser and HtmlConverter on a generated log.
+
+Usage: python benchmarks/bench_parser.py [number_of_lines] [chunk_size]
+"""
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import timeit
+import pyansiescapes.commands as ansi
+from pyansiescapes.html_converter import HtmlConverter
+from pyansiescapes.parser import parse
+
+
+def _log(lines):
+    level = ansi.Style('bold', color='red', emoji=False)
+    dim = ansi.Style(color='blue', emoji=False)
+    return "".join(
+        dim("2020-06-01 12:00:{:02d} service.worker ".format(i % 60))
+        + level("ERROR") + " request failed id={}\n".format(i)
+        for i in range(lines))
+
+
+class NullStream:
+    """Stream discarding everything written to it."""
+
+    def write(self, text):
+        pass
+
+
+def to_html(chunks):
+    with HtmlConverter(NullStream()) as converter:
+        for chunk in chunks:
+            converter.feed(chunk)
+
+
+def main(lines=200000, chunk_size=65536):
+    log = _log(lines)
+    chunks = [log[i:i + chunk_size] for i in range(0, len(log), chunk_size)]
+    megabytes = len(log.encode()) / 1e6
+    for name, func in (("parse", lambda: sum(1 for _ in parse(chunks))),
+                       ("HtmlConverter", lambda: to_html(chunks))):
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print("{:<14} {:.1f} MB in {:.3f} s: {:.1f} MB/s".format(
+            name, megabytes, seconds, megabytes / seconds))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,57 @@
+"""Compare bytes and write calls of AnsiWriter against writing format() output.
+
+Simulates a log tail where each line consists of several styled fragments.
+
+Usage: python benchmarks/bench_writer.py [number_of_lines]
+"""
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import io
+import timeit
+import pyansiescapes.commands as ansi
+from pyansiescapes.writer import AnsiWriter
+
+
+class CountingStream(io.StringIO):
+    """StringIO counting the number of write calls."""
+    writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+def _fragments(lines):
+    level = ansi.Style('bold', color='red', emoji=False)
+    dim = ansi.Style(color='blue', emoji=False)
+    for i in range(lines):
+        yield "2020-06-01 12:00:{:02d} ".format(i % 60), dim
+        yield "service.worker ", dim
+        yield "ERROR ", level
+        yield "request failed ", level
+        yield "id={}\n".format(i), None
+
+
+def with_format(stream, fragments):
+    for text, style in fragments:
+        stream.write(style(text) if style is not None else text)
+
+
+def with_writer(stream, fragments):
+    with AnsiWriter(stream) as writer:
+        writer.writelines(fragments)
+
+
+def main(lines=100000):
+    fragments = list(_fragments(lines))
+    for name, func in (("format per fragment", with_format),
+                       ("AnsiWriter", with_writer)):
+        stream = CountingStream()
+        seconds = timeit.timeit(lambda: func(stream, fragments), number=1)
+        print("{:<20} {:>12,d} bytes {:>9,d} writes {:>8.3f} s".format(
+            name, len(stream.getvalue().encode()), stream.writes, seconds))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
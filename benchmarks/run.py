@@ -0,0 +1,171 @@
+"""Micro-benchmark suite for the formatting and color resolution hot paths.
+
+Runs every benchmark, prints the results and optionally saves them as JSON or
+compares them against a saved baseline.
+
+Usage:
+    python benchmarks/run.py [-o results.json] [-c baseline.json]
+                             [-t threshold] [-k substring]
+
+Result format (JSON)::
+
+    {
+        "format": 1,
+        "python": "3.11.7",
+        "platform": "Linux-...",
+        "results": {
+            "<benchmark>": {"seconds": <best time per call>, "number": <calls>}
+        }
+    }
+
+With ``--compare`` every benchmark slower than the baseline by more than the
+threshold (default: 0.25, i.e. 25%) is flagged and the exit code is 1.
+"""
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import json
+import platform
+import timeit
+
+import pyansiescapes.commands as ansi
+from pyansiescapes import markup, text, utils
+import bench_import
+
+RESULT_FORMAT = 1
+PLAIN = "GET /api/v1/items 200 OK in 12ms"
+EMOJI = "deploy :rocket: done :tada:"
+
+
+def _without_color_cache(func):
+    """Return func wrapped to run with a disabled color cache."""
+    def wrapper():
+        ansi.set_cache_size(0)
+        try:
+            return func()
+        finally:
+            ansi.set_cache_size()
+    return wrapper
+
+
+def _benchmarks():
+    """Return dict of benchmark name to (statement, number of calls)."""
+    return {
+        "format.attributes": (
+            lambda: ansi.format(PLAIN, 'bold', 'underline'), 20000),
+        "format.color8": (
+            lambda: ansi.format(PLAIN, color='red', background='white'), 20000),
+        "format.color16": (
+            lambda: ansi.format(PLAIN, color={'name': 'red', 'bold': True}), 20000),
+        "format.color256": (
+            lambda: ansi.format(PLAIN, color='mediumspringgreen'), 20000),
+        "format.emoji_on": (
+            lambda: ansi.format(EMOJI, 'bold', emoji=True), 2000),
+        "format.emoji_off": (
+            lambda: ansi.format(EMOJI, 'bold', emoji=False), 20000),
+        "style.apply": (
+            lambda style=ansi.Style('bold', color='red'): style(PLAIN), 100000),
+        "style.apply_no_color": (
+            lambda style=ansi.Style('bold', color='red', depth=0):
+            style(PLAIN), 100000),
+        "style.depth16": (
+            lambda: ansi.Style('bold', color='mediumspringgreen', depth=16),
+            20000),
+        "markup.template": (
+            lambda template=markup.compile("[bold red]{}[/] {}"):
+            template("ERROR", PLAIN), 100000),
+        "markup.render": (
+            lambda: markup.render("[bold red]{}[/] {}", "ERROR", PLAIN), 100000),
+        "color.name": (lambda: ansi.color('mediumspringgreen'), 50000),
+        "color.id": (lambda: ansi.color(color_id=208), 50000),
+        "color.hex": (lambda: ansi.color('#ff8700'), 50000),
+        "color.name_uncached": (
+            _without_color_cache(
+                lambda: [ansi.color('mediumspringgreen') for _ in range(100)]),
+            200),
+        "utils.parse_color_name": (
+            lambda: utils.parse_color_name('mediumspringgreen'), 100000),
+        "text.visible_width": (
+            lambda styled=ansi.format(PLAIN, 'bold', color='red'):
+            text.visible_width(styled), 50000),
+        "text.visible_width_wide": (
+            lambda: text.visible_width("\u90e8\u7f72 \U0001f680 " + PLAIN), 50000),
+        "clear_lines.10": (lambda: ansi.clear_lines(10), 100000),
+        "clear_lines.100": (lambda: ansi.clear_lines(100), 100000),
+    }
+
+
+def run(selection=""):
+    """Run all benchmarks whose name contains selection.
+
+    Returns:
+        The results dict in the JSON result format.
+    """
+    results = {}
+    for name, (statement, number) in sorted(_benchmarks().items()):
+        if selection not in name:
+            continue
+        statement() # warm up caches and lazy imports
+        best = min(timeit.repeat(statement, number=number, repeat=5))
+        results[name] = {"seconds": best / number, "number": number}
+    if selection in "import.commands":
+        milliseconds = bench_import.measure("pyansiescapes.commands", 15)
+        results["import.commands"] = {
+            "seconds": milliseconds["pyansiescapes.commands"] / 1000, "number": 1}
+
+    return {"format": RESULT_FORMAT,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results}
+
+
+def compare(results, baseline, threshold):
+    """Return names of benchmarks that regressed by more than threshold."""
+    regressions = []
+    for name, result in sorted(results["results"].items()):
+        try:
+            before = baseline["results"][name]["seconds"]
+        except KeyError:
+            print("{:<28} {:>12}".format(name, "new"))
+            continue
+        change = result["seconds"] / before - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "REGRESSION"
+        print("{:<28} {:>+11.1%} {}".format(name, change, flag))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="save results as JSON")
+    parser.add_argument("-c", "--compare", help="compare against baseline JSON")
+    parser.add_argument("-t", "--threshold", type=float, default=0.25,
+                        help="allowed slowdown before flagging (default: 0.25)")
+    parser.add_argument("-k", "--select", default="",
+                        help="only run benchmarks containing this substring")
+    args = parser.parse_args(argv)
+
+    results = run(args.select)
+    for name, result in sorted(results["results"].items()):
+        print("{:<28} {:>12.3f} us".format(name, result["seconds"] * 1e6))
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(results, fh, indent=4, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)
+        print("\ncompared to {}:".format(args.compare))
+        if compare(results, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -26,15 +26,28 @@ Types declared here:
         - bool --> e.g. False/0
         - str --> "foreground"
         - ColorDrawingLevel --> see :class:`.ColorDrawingLevel`
+    - **ParsedColor**: color of a span returned by :class:`.AnsiParser`
+        - Colors --> 8-bit color
+        - int --> Colors256 id
+        - ColorValueTuple --> truecolor rgb value
+    - **TraceHook**: callback for :func:`.set_trace_hook` receiving the event
+      name and a dict of event data
 """
-from typing import List, Dict, Tuple, Callable, Any, Optional, Iterator, Union
-from pyansiescapes.enums import *
+from typing import (List, Dict, Tuple, Callable, Any, Optional, Iterable,
+                    Iterator, Deque, Mapping, Sequence, Union, FrozenSet, NamedTuple,
+                    TYPE_CHECKING)
+from pyansiescapes.enums import ANSICommands, TextAttributes, Colors, ColorDrawingLevel
+
+if TYPE_CHECKING: # Colors256 is built lazily, see pyansiescapes.enums
+    from pyansiescapes.enums import Colors256
 
 ColorBins = List[int]
 ColorValueTuple = Tuple[int, int, int]
 ColorValueList = List[int]
 ColorValue = Union[ColorValueTuple, ColorValueList]
-ColorArg = Union[int, Colors, Colors256, str, ColorValue]
+ColorArg = Union[int, Colors, "Colors256", str, ColorValue]
 ColorArgTuple = Tuple[int, ColorArg]
-ColorEnum = Union[Colors, Colors256]
+ColorEnum = Union[Colors, "Colors256"]
 DrawingLevelArg = Union[int, bool, str, ColorDrawingLevel]
+ParsedColor = Union[Colors, int, ColorValueTuple]
+TraceHook = Callable[[str, Dict[str, Any]], None]
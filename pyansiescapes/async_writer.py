@@ -0,0 +1,253 @@
+"""Non-blocking output of styled text for asyncio programs.
+
+:class:`.AsyncAnsiWriter` queues styled fragments and status frames and
+writes them from a background task, so producers never block the event loop
+on a slow pipe or network connection.
+
+Examples:
+    >>> import asyncio, io
+    >>> from pyansiescapes.commands import Style
+    >>> out = io.StringIO()
+    >>> async def main():
+    ...     async with AsyncAnsiWriter(out) as writer:
+    ...         await writer.write("Error: ", Style('bold', color='red'))
+    ...         await writer.write("disk full\\n")
+    >>> asyncio.run(main())
+    >>> out.getvalue()
+    '\\x1b[1;31mError: \\x1b[0mdisk full\\n'
+"""
+import asyncio
+import io
+import sys
+from pyansiescapes.live import LiveRegion
+from pyansiescapes.writer import AnsiWriter
+import pyansiescapes._types as t
+
+_STATUS = object() # wakes up the writer task for a new status frame
+_CLOSE = object() # stops the writer task
+
+
+class AsyncAnsiWriter:
+    """Write styled text and status frames to a stream from a background task.
+
+    Fragments written with :meth:`write` are kept in a bounded queue. The
+    writer task takes all queued fragments at once, coalesces them into one
+    string (emitting only the SGR changes between fragments, see
+    :class:`.AnsiWriter`), writes it and awaits :py:`drain()` before it takes
+    the next batch. A full queue makes :meth:`write` wait, so a slow consumer
+    slows down the producers instead of filling the memory.
+
+    Status frames (see :meth:`status`) are displayed at the bottom of the
+    output as a :class:`.LiveRegion`. Only the latest frame is kept: frames
+    that are replaced before the writer task gets to them are dropped and
+    counted in :attr:`dropped_frames`. Text written while a status is shown
+    is written above it and should end with a line break.
+
+    Args:
+        stream: An :py:`asyncio.StreamWriter` (or any object with
+            :py:`write(bytes)` and a coroutine :py:`drain()`), or a text file
+            object such as :py:`sys.stdout`, which is written to in the
+            default executor so the event loop never blocks.
+            Default: sys.stdout
+        max_queue: Maximum number of queued fragments.
+            Default: 1024
+        encoding: Encoding for :py:`asyncio.StreamWriter` streams.
+            Default: "utf-8"
+
+    Attributes:
+        dropped_frames: Number of status frames that were never written.
+    """
+
+    def __init__(self, stream: t.Any = None, max_queue: int = 1024,
+                 encoding: str = "utf-8") -> None:
+        self.stream = sys.stdout if stream is None else stream
+        self.encoding = encoding
+        self.dropped_frames = 0
+        self._drains = callable(getattr(self.stream, "drain", None))
+        self._queue = None # type: t.Optional[asyncio.Queue]
+        self._max_queue = max_queue
+        self._task = None # type: t.Optional[asyncio.Task]
+        self._closing = False
+        self._output = io.StringIO()
+        self._writer = AnsiWriter(self._output, buffer_size=sys.maxsize)
+        self._region = LiveRegion()
+        self._status = None # type: t.Optional[t.List[str]]
+        self._status_queued = False
+
+    def start(self) -> None:
+        """Start the writer task. Must be called from a running event loop."""
+        if self._task is None:
+            self._queue = asyncio.Queue(self._max_queue)
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def write(self, text: str, style: t.Any = None) -> None:
+        """Queue text with style, waiting while the queue is full.
+
+        Args:
+            text: The text.
+            style: A :class:`.Style`, any style accepted by
+                :func:`.format_many` or :py:`None` for unstyled text.
+
+        Raises:
+            RuntimeError: If the writer is being closed.
+            Exception: The error of the writer task if it failed.
+        """
+        self._check_open()
+        self.start()
+        await self._put((text, style))
+
+    def write_nowait(self, text: str, style: t.Any = None) -> None:
+        """Queue text with style without waiting.
+
+        Raises:
+            asyncio.QueueFull: If the queue is full.
+            RuntimeError: If the writer is being closed.
+            Exception: The error of the writer task if it failed.
+        """
+        self._check_open()
+        self.start()
+        self._check_task(self._task)
+        self._queue.put_nowait((text, style))
+
+    def status(self, lines: t.Sequence[str]) -> None:
+        """Replace the status frame with lines. Never waits.
+
+        A pending frame that was not written yet is dropped.
+        """
+        self.start()
+        if self._status is not None:
+            self.dropped_frames += 1
+        self._status = list(lines)
+        if not self._status_queued:
+            try:
+                self._queue.put_nowait(_STATUS)
+                self._status_queued = True
+            except asyncio.QueueFull:
+                pass # the writer task checks the status after each batch
+
+    async def close(self) -> None:
+        """Write everything queued, reset the text style and stop the task.
+
+        The stream itself is not closed. Errors of the writer task (e.g. a
+        lost connection) are raised here. Writes started while the writer is
+        being closed raise :py:`RuntimeError`; afterwards, writing starts the
+        writer again.
+        """
+        if self._task is None:
+            return
+        if self._closing:
+            # the first close() raises the errors
+            await asyncio.wait((self._task,))
+            return
+        self._closing = True
+        try:
+            if not self._task.done():
+                await self._put(_CLOSE)
+            await self._task
+        finally:
+            self._task = None
+            self._closing = False
+
+    async def __aenter__(self) -> "AsyncAnsiWriter":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: t.Any) -> None:
+        await self.close()
+
+    def _check_open(self) -> None:
+        """Raise RuntimeError if the writer is being closed."""
+        if self._closing:
+            raise RuntimeError("the writer is closed")
+
+    @staticmethod
+    def _check_task(task: asyncio.Task) -> None:
+        """Raise the error of the writer task if it has stopped."""
+        if task.done():
+            if not task.cancelled() and task.exception():
+                raise task.exception()
+            raise RuntimeError("the writer is closed")
+
+    async def _put(self, item: t.Any) -> None:
+        """Queue item, waiting while the queue is full and the writer task is
+        running."""
+        # close() may stop the task and reset self._task while waiting
+        task, queue = self._task, self._queue
+        self._check_task(task)
+        if not queue.full():
+            queue.put_nowait(item)
+            return
+        put = asyncio.ensure_future(queue.put(item))
+        try:
+            await asyncio.wait((put, task), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not put.done():
+                put.cancel()
+        if not put.done():
+            self._check_task(task)
+        await put
+
+    async def _run(self) -> None:
+        """Write batches of queued fragments and status frames until closed."""
+        queue = self._queue
+        closing = False
+        while not closing:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+
+            fragments = []
+            for item in batch:
+                if item is _CLOSE:
+                    closing = True
+                elif item is _STATUS:
+                    self._status_queued = False
+                else:
+                    fragments.append(item)
+            await self._write(self._render(fragments, closing))
+
+    def _render(self, fragments: t.List[t.Tuple[str, t.Any]],
+                closing: bool) -> str:
+        """Return the output for fragments and the pending status frame."""
+        output = []
+        frame = self._region.frame
+        if fragments and frame:
+            # write the text in place of the status and redraw it below
+            output.append(self._region.clear())
+            if self._status is None:
+                self._status = frame
+        for text, style in fragments:
+            self._writer.write(text, style)
+        if closing or self._status is not None:
+            self._writer.reset()
+        self._writer.flush()
+        output.append(self._output.getvalue())
+        self._output.seek(0)
+        self._output.truncate()
+
+        if self._status is not None:
+            output.append(self._region.render(self._status))
+            self._status = None
+        return "".join(output)
+
+    async def _write(self, output: str) -> None:
+        """Write output to the stream without blocking the event loop."""
+        if not output:
+            return
+        if self._drains:
+            self.stream.write(output.encode(self.encoding))
+            await self.stream.drain()
+        else:
+            await asyncio.get_running_loop().run_in_executor(
+                None, _write_and_flush, self.stream, output)
+
+
+def _write_and_flush(stream: t.Any, output: str) -> None:
+    """Write output to a (blocking) text stream and flush it."""
+    stream.write(output)
+    stream.flush()
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
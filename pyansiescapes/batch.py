@@ -0,0 +1,206 @@
+"""Vectorized color quantization of whole arrays (requires NumPy).
+
+The functions take arrays of colors and return arrays of :class:`.Colors256`
+ids or escape sequences in one call. They use the tables of
+:mod:`.palette` and return the same color ids as
+:func:`.palette.nearest_color_id`.
+
+NumPy is an optional dependency (:py:`pip install pyansiescapes[numpy]`)
+and only needed for this module.
+
+Examples:
+    >>> import numpy as np
+    >>> pixels = np.array([[255, 135, 0], [250, 130, 10], [100, 102, 101]],
+    ...                   dtype=np.uint8)
+    >>> nearest_color_ids(pixels)
+    array([208, 208, 241], dtype=uint8)
+    >>> color_sequences(nearest_color_ids(pixels)).tolist()
+    [\'\\x1b[38;5;208m\', \'\\x1b[38;5;208m\', \'\\x1b[38;5;241m\']
+"""
+from pyansiescapes import commands, conversions, palette
+import pyansiescapes._types as t
+
+try:
+    import numpy as np
+except ImportError: # pragma: no cover
+    np = None # pylint: disable=invalid-name
+
+_tables = {} # type: t.Dict[str, t.Any]
+_DELTA_E_MANY = {
+    "cie76": conversions.delta_e_cie76_many,
+    "ciede2000": conversions.delta_e_ciede2000_many,
+}
+# number of colors compared to all palette colors at once
+_CHUNK_SIZE = 1024
+
+
+def nearest_color_ids(rgb: t.Any, metric: str = "rgb") -> t.Any:
+    """Return the ids of the palette colors closest to the rgb-values.
+
+    See :func:`.palette.nearest_color_id` for the matching rules.
+
+    Args:
+        rgb: Array-like of shape :py:`(..., 3)` with channel values in
+            :py:`range(256)`, preferably of dtype :py:`uint8`.
+        metric: :py:`"rgb"`, or :py:`"cie76"`/:py:`"ciede2000"` for the
+            perceptual matching of :func:`.palette.nearest_color_id_perceptual`.
+            Default: "rgb"
+
+    Returns:
+        A :py:`uint8` array of color ids of shape :py:`rgb.shape[:-1]`.
+
+    Raises:
+        ValueError: If the last axis is not of size 3 or a channel value is out
+            of range or the metric is not supported.
+
+    Examples:
+        >>> nearest_color_ids([[30, 30, 60], [255, 135, 0]], metric="ciede2000")
+        array([ 17, 208], dtype=uint8)
+    """
+    rgb = _as_rgb_array(rgb)
+    return _nearest_color_ids(rgb[..., 0], rgb[..., 1], rgb[..., 2], metric)
+
+
+def nearest_color_ids_from_hex(hexes: t.Any, metric: str = "rgb") -> t.Any:
+    """Return the ids of the palette colors closest to the hexadecimal values.
+
+    Args:
+        hexes: Array-like of hexadecimal color values of format
+            :py:`"#rrggbb"`.
+        metric: The matching metric, see :func:`.nearest_color_ids`.
+            Default: "rgb"
+
+    Returns:
+        A :py:`uint8` array of color ids of the same shape as hexes.
+
+    Raises:
+        ValueError: If a value is not of format :py:`"#rrggbb"` or the metric
+            is not supported.
+
+    Examples:
+        >>> nearest_color_ids_from_hex(["#ff8700", "#fa820a", "#000000"])
+        array([208, 208,   0], dtype=uint8)
+    """
+    _get_tables()
+    channels = conversions.hex_to_rgb_many(np.asarray(hexes))
+    return _nearest_color_ids(channels[..., 0], channels[..., 1],
+                              channels[..., 2], metric)
+
+
+def color_sequences(color_ids: t.Any,
+                    drawing_level: t.DrawingLevelArg = "foreground") -> t.Any:
+    """Return the 256-bit color escape sequences for an array of color ids.
+
+    Each sequence equals :py:`color(color_id=id, colormode=256,
+    drawing_level=drawing_level)`.
+
+    Returns:
+        A str array of the same shape as color_ids.
+    """
+    key = "sequences_" + str(drawing_level)
+    tables = _get_tables()
+    if key not in tables:
+        tables[key] = np.array([
+            commands.color(color_id=color_id, colormode=256,
+                           drawing_level=drawing_level)
+            for color_id in range(256)])
+    return tables[key][np.asarray(color_ids, dtype=np.uint8)]
+
+
+def _as_rgb_array(rgb: t.Any) -> t.Any:
+    """Return rgb as array of dtype uint8 after checking shape and range."""
+    _get_tables()
+    rgb = np.asarray(rgb)
+    if rgb.ndim == 0 or rgb.shape[-1] != 3:
+        raise ValueError("rgb-values must be of shape (..., 3), got {}!"
+                         .format(rgb.shape))
+    if rgb.dtype != np.uint8:
+        if rgb.size and (rgb.min() < 0 or rgb.max() > 255):
+            raise ValueError("rgb-values must be in range(256)!")
+        rgb = rgb.astype(np.uint8)
+    return rgb
+
+
+def _nearest_color_ids(red: t.Any, green: t.Any, blue: t.Any,
+                       metric: str = "rgb") -> t.Any:
+    """Vectorized :func:`.palette.nearest_color_id` for uint8 channel arrays."""
+    if metric != "rgb":
+        return _nearest_color_ids_perceptual(red, green, blue, metric)
+    tables = _get_tables()
+    cube_index, cube_error = tables["cube_index"], tables["cube_error"]
+    cube_ids = (16 + 36 * cube_index[red] + 6 * cube_index[green]
+                + cube_index[blue])
+    total = red.astype(np.int32) + green + blue
+    grey_index = tables["grey_index"][total]
+    grey = tables["grey_levels"][grey_index]
+    grey_error = ((red - grey) ** 2 + (green - grey) ** 2
+                  + (blue - grey) ** 2)
+    ids = np.where(grey_error < cube_error[red] + cube_error[green]
+                   + cube_error[blue], 232 + grey_index, cube_ids)
+
+    # exact matches return the lowest id with the same color value
+    packed = ((red.astype(np.int32) << 16) | (green.astype(np.int32) << 8)
+              | blue)
+    keys, exact_ids = tables["exact_keys"], tables["exact_ids"]
+    position = np.searchsorted(keys, packed).clip(max=len(keys) - 1)
+    exact = keys[position] == packed
+    return np.where(exact, exact_ids[position], ids).astype(np.uint8)
+
+
+def _nearest_color_ids_perceptual(red: t.Any, green: t.Any, blue: t.Any,
+                                  metric: str) -> t.Any:
+    """Vectorized :func:`.palette.nearest_color_id_perceptual` for uint8
+    channel arrays."""
+    try:
+        delta_e = _DELTA_E_MANY[metric]
+    except KeyError:
+        raise ValueError("{} is not a supported metric! Use one of {}."
+                         .format(metric, palette.METRICS))
+    tables = _get_tables()
+    packed = ((red.astype(np.int32) << 16) | (green.astype(np.int32) << 8)
+              | blue)
+    # every distinct color is matched only once
+    colors, inverse = np.unique(packed, return_inverse=True)
+    lab = conversions.rgb_to_lab_many(np.stack(
+        [colors >> 16, (colors >> 8) & 0xff, colors & 0xff], axis=-1))
+    candidates = tables["candidate_lab"]
+    ids = np.empty(len(colors), dtype=np.int32)
+    for start in range(0, len(colors), _CHUNK_SIZE):
+        chunk = lab[start:start + _CHUNK_SIZE, None, :]
+        ids[start:start + _CHUNK_SIZE] = delta_e(chunk, candidates).argmin(axis=-1)
+    ids += 16
+
+    keys, exact_ids = tables["exact_keys"], tables["exact_ids"]
+    position = np.searchsorted(keys, colors).clip(max=len(keys) - 1)
+    exact = keys[position] == colors
+    ids = np.where(exact, exact_ids[position], ids).astype(np.uint8)
+    return ids[inverse.reshape(packed.shape)]
+
+
+def _get_tables() -> t.Dict[str, t.Any]:
+    """Return the palette lookup tables as arrays, built on first use.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError("pyansiescapes.batch requires numpy "
+                          "(pip install pyansiescapes[numpy])")
+    if not _tables:
+        keys = sorted(palette.ID_BY_RGB)
+        _tables.update(
+            cube_index=np.array(palette.CUBE_INDEX, dtype=np.int32),
+            cube_error=np.array(palette.CUBE_ERROR, dtype=np.int32),
+            grey_index=np.array(palette.GREY_INDEX, dtype=np.int32),
+            grey_levels=np.array(palette.GREY_LEVELS, dtype=np.int32),
+            exact_keys=np.array(keys, dtype=np.int32),
+            exact_ids=np.array([palette.ID_BY_RGB[key] for key in keys],
+                               dtype=np.int32),
+            candidate_lab=np.array(palette.LAB[16:]),
+        )
+    return _tables
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -1,13 +1,15 @@
 """API for console manipulation using ANSI Escape sequences in Python.
 """
-import logging
+from functools import lru_cache
 from itertools import chain
+from time import perf_counter
 from pyansiescapes.enums import ANSICommands, TextAttributes, ColorDrawingLevel, Colors
-from pyansiescapes import utils
+from pyansiescapes import terminal, utils
 import pyansiescapes._types as t
-import emojis
 
-_logger = logging.getLogger(__file__)
+_DEFAULT_CACHE_SIZE = 1024
+_emoji_encoding = True # pylint: disable=invalid-name
+_trace_hook = None # type: t.Optional[t.TraceHook]
 
 
 # Curser controls:
@@ -21,6 +23,21 @@ def cursor_down(number_of_lines: int = 1) -> str:
     return ANSICommands.start + "{:d}B".format(number_of_lines)
 
 
+def cursor_forward(number_of_columns: int = 1) -> str:
+    """Moves cursor forward (right) number_of_columns columns."""
+    return ANSICommands.start + "{:d}C".format(number_of_columns)
+
+
+def cursor_back(number_of_columns: int = 1) -> str:
+    """Moves cursor back (left) number_of_columns columns."""
+    return ANSICommands.start + "{:d}D".format(number_of_columns)
+
+
+def cursor_to_column(column: int = 1) -> str:
+    """Moves cursor to column (starting at 1) in the current line."""
+    return ANSICommands.start + "{:d}G".format(column)
+
+
 # Clearers:
 def clear_to_end_of_line() -> str:
     """Clears line from current cursor position to the end."""
@@ -64,7 +81,8 @@ def format(text: str, *args: t.Any, **kwargs: t.Any) -> str: # pylint: disable=r
 
     Uses the formatting attributes given in `*args` or `**kwargs`.
     Postional arguments or keywordarguments that are not supported
-    will be ignored.
+    will be ignored. Use :class:`.Style` to compile the formatting
+    attributes once if the same style is applied repeatedly.
 
     Args:
         text: The text/string that should be formatted.
@@ -72,7 +90,12 @@ def format(text: str, *args: t.Any, **kwargs: t.Any) -> str: # pylint: disable=r
             ignored. See "supported arguments" section for futher details.
         **kwargs: Any number of keyword arguments. Unsupported keyword arguments
             will be ignored. See "supported keywords" section for further
-            details.
+            details. The keyword :py:`emoji` (:py:`True`/:py:`False`)
+            overrides :func:`.set_emoji_encoding` for this call. The keyword
+            :py:`metric` selects how color values are matched to the
+            256-bit palette (see :func:`._color`). The keywords
+            :py:`stream` and :py:`depth` adapt the output to a terminal,
+            see :class:`.Style`.
 
     Returns:
         The text with leading ANSI Escape sequence "rich text"
@@ -95,6 +118,256 @@ def format(text: str, *args: t.Any, **kwargs: t.Any) -> str: # pylint: disable=r
         >>> # Or provide a keyword argument dict
         >>> format('Hello ANSI!', color={'name':'blue', 'colormode':256}, background='white')
         \'\\x1b[38;5;12;47mHello ANSI!\\x1b[0m\'
+
+        >>> # Match color values by perceptual color difference
+        >>> format('Hello ANSI!', color={'rgb': (30, 30, 60)}, metric='ciede2000')
+        \'\\x1b[38;5;17mHello ANSI!\\x1b[0m\'
+
+        >>> # No escape sequences for streams that are no terminal
+        >>> import io
+        >>> format('Hello ANSI!', 'bold', color='blue', stream=io.StringIO())
+        'Hello ANSI!'
+    """
+    return Style(*args, **kwargs)(text)
+
+
+def format_many(texts: t.Iterable[str], *args: t.Any,
+                styles: t.Optional[t.Iterable[t.Any]] = None,
+                **kwargs: t.Any) -> t.List[str]:
+    """Return a list of formatted texts.
+
+    Batch version of :func:`.format`. Either applies one style, given by
+    `*args` and `**kwargs` just like for :func:`.format`, to all texts or
+    applies the style at the same position in `styles` to each text. Each
+    distinct style is compiled only once.
+
+    Args:
+        texts: Any iterable of texts.
+        *args: Any postional argument accepted by :func:`.format`.
+        styles: Optional iterable of styles parallel to texts. A style can be
+            a :class:`.Style`, a dict of keyword arguments, a tuple/list of
+            postional arguments or a single postional argument (e.g.
+            :py:`"bold"`) accepted by :func:`.format`. If given, `*args`
+            and `**kwargs` are ignored.
+        **kwargs: Any keyword argument accepted by :func:`.format`.
+
+    Returns:
+        The formatted texts in the order of texts.
+
+    Raises:
+        ValueError: If styles and texts differ in length.
+
+    Examples:
+        >>> format_many(['a', 'b'], 'bold')
+        [\'\\x1b[1ma\\x1b[0m\', \'\\x1b[1mb\\x1b[0m\']
+
+        >>> format_many(['a', 'b'], styles=[{'color': 'red'}, 'underline'])
+        [\'\\x1b[31ma\\x1b[0m\', \'\\x1b[4mb\\x1b[0m\']
+    """
+    if styles is None:
+        style = Style(*args, **kwargs)
+        prefix, suffix = style.prefix, style.suffix
+        if not _encodes_emojis(style.emoji):
+            return [prefix + text + suffix for text in texts]
+        encode = _encode_emojis
+        return [prefix + (encode(text) if ":" in text else text) + suffix
+                for text in texts]
+
+    texts, styles = list(texts), list(styles)
+    if len(texts) != len(styles):
+        raise ValueError("Got {} styles for {} texts!".format(
+            len(styles), len(texts)))
+    compiled = {} # type: t.Dict[t.Any, Style]
+    formatted = []
+    for text, spec in zip(texts, styles):
+        if isinstance(spec, Style):
+            style = spec
+        else:
+            key = style_key(spec)
+            try:
+                style = compiled[key]
+            except KeyError:
+                style = compiled[key] = compile_style(spec)
+            except TypeError:
+                # unhashable (e.g. array-like) color values cannot be cached
+                style = compile_style(spec)
+        formatted.append(style.apply(text))
+
+    return formatted
+
+
+def compile_style(spec: t.Any,
+                  depth: t.Optional[int] = None) -> "Style":
+    """Return a :class:`.Style` for a style spec of :func:`.format_many`.
+
+    Args:
+        spec: A dict of keyword arguments, a tuple/list of postional
+            arguments or a single postional argument accepted by
+            :func:`.format`.
+        depth: The color depth colors are resolved to unless the spec sets a
+            depth itself, see :class:`.Style`.
+            Default: None
+
+    Examples:
+        >>> compile_style({'color': 'red1'}, depth=16)('hot')
+        \'\\x1b[31;1mhot\\x1b[0m\'
+    """
+    if isinstance(spec, dict):
+        return Style(**dict({"depth": depth}, **spec))
+    if isinstance(spec, (tuple, list)):
+        return Style(*spec, depth=depth)
+    return Style(spec, depth=depth)
+
+
+def style_key(spec: t.Any) -> t.Any:
+    """Return a hashable key for a (possibly nested) style spec, e.g. to
+    cache the results of :func:`.compile_style`.
+
+    Specs with unhashable values (e.g. array-like color values) give
+    unhashable keys.
+
+    Examples:
+        >>> style_key({'color': [255, 0, 0], 'bold': True})
+        (<class 'dict'>, (('bold', True), ('color', (<class 'tuple'>, (255, 0, 0)))))
+    """
+    if isinstance(spec, dict):
+        return (dict, tuple(sorted((key, style_key(value))
+                                   for key, value in spec.items())))
+    if isinstance(spec, (tuple, list)):
+        return (tuple, tuple(style_key(value) for value in spec))
+    return spec
+
+
+class Style:
+    """A precompiled, reusable text style.
+
+    Resolves the formatting arguments accepted by :func:`.format` once into a
+    leading ANSI Escape sequence (:attr:`prefix`) and a trailing "reset"
+    sequence (:attr:`suffix`). Applying the style afterwards is little more
+    than string concatenation.
+
+    Colors are resolved to the best color depth the output supports: either
+    the given `depth` or the depth probed for `stream` (see
+    :func:`.terminal.color_depth`). At depth 0 (e.g. a stream that is no
+    terminal or :envvar:`NO_COLOR`) the style emits no escape sequences at
+    all and applying it returns the text itself.
+
+    Args:
+        *args: Any postional argument accepted by :func:`.format`.
+        emoji: Encode emoji shortcodes (e.g. \\:smile\\:). :py:`None` follows
+            :func:`.set_emoji_encoding`.
+            Default: None
+        stream: The output stream to probe the color depth of.
+            Default: None
+        depth: The color depth (any in :py:`(0, 8, 16, 256, 24,
+            "truecolor")`), takes precedence over stream. :py:`None`
+            without stream emits all colors unchanged.
+            Default: None
+        **kwargs: Any keyword argument accepted by :func:`.format`.
+
+    Attributes:
+        codes: The ANSI formatting commands in the order they are emitted.
+        prefix: The leading ANSI Escape sequence.
+        suffix: The trailing ANSI Escape sequence "reset" command.
+        emoji: The emoji encoding setting.
+        depth: The color depth the colors were resolved to (:py:`None` if
+            unrestricted).
+
+    Examples:
+        >>> # Compile the style once...
+        >>> warning = Style('bold', color='yellow')
+        >>> # ... and apply it as often as you like.
+        >>> warning('Careful!')
+        \'\\x1b[1;33mCareful!\\x1b[0m\'
+
+        >>> warning.apply('Careful!') == format('Careful!', 'bold', color='yellow')
+        True
+
+        >>> # Resolve colors for a 16 color terminal
+        >>> Style(color='red1', depth=16)('Careful!')
+        \'\\x1b[31;1mCareful!\\x1b[0m\'
+    """
+    __slots__ = ("codes", "prefix", "suffix", "emoji", "depth")
+
+    def __init__(self, *args: t.Any, emoji: t.Optional[bool] = None,
+                 stream: t.Any = None,
+                 depth: t.Optional[t.Union[int, str]] = None,
+                 **kwargs: t.Any) -> None:
+        if depth is None and stream is not None:
+            depth = terminal.color_depth(stream)
+        self.depth = None if depth is None else utils.parse_color_depth(depth)
+        self.emoji = emoji
+        # resolve the colors even at depth 0, so invalid arguments raise
+        codes = _parse_format_arguments(
+            *args, depth=None if self.depth == 0 else self.depth, **kwargs)
+        if self.depth == 0:
+            self.codes = () # type: t.Tuple[str, ...]
+            self.prefix = self.suffix = ""
+            return
+        self.codes = codes
+        self.prefix = _format_rich_text(*self.codes)
+        self.suffix = reset()
+
+    def apply(self, text: str) -> str:
+        """Return text formatted with this style.
+
+        Emoji shortcodes (e.g. \\:smile\\:) in text are encoded before the
+        precompiled prefix and suffix are added. Texts without a ``:`` are
+        never passed to the emoji encoder.
+        """
+        text = self.encode_emojis(text)
+        if not self.prefix:
+            return text
+        return self.prefix + text + self.suffix
+
+    def encode_emojis(self, text: str) -> str:
+        """Return text with emoji shortcodes encoded if this style encodes
+        them (see :attr:`emoji`), but without the prefix and suffix."""
+        if ":" in text and _encodes_emojis(self.emoji):
+            return _encode_emojis(text)
+        return text
+
+    __call__ = apply
+
+    def __repr__(self) -> str:
+        return "{}(codes={!r})".format(type(self).__name__, self.codes)
+
+
+def set_emoji_encoding(enabled: bool) -> None:
+    """Globally enable or disable encoding of emoji shortcodes.
+
+    Applies to :func:`.format`, :func:`.format_many` and every :class:`.Style`
+    that was not created with an explicit :py:`emoji` argument.
+
+    Examples:
+        >>> set_emoji_encoding(False)
+        >>> format(':smile:', 'bold')
+        \'\\x1b[1m:smile:\\x1b[0m\'
+
+        >>> set_emoji_encoding(True)
+    """
+    global _emoji_encoding # pylint: disable=global-statement,invalid-name
+    _emoji_encoding = bool(enabled)
+
+
+def _encodes_emojis(emoji: t.Optional[bool]) -> bool:
+    """Return whether emoji shortcodes get encoded for the emoji setting."""
+    return _emoji_encoding if emoji is None else emoji
+
+
+def _encode_emojis(text: str) -> str:
+    """Return text with encoded emoji shortcodes.
+
+    The emojis package (and its emoji database) is imported on first use.
+    """
+    import emojis # pylint: disable=import-outside-toplevel
+    return emojis.encode(text)
+
+
+def _parse_format_arguments(*args: t.Any, **kwargs: t.Any) -> t.Tuple[str, ...]:
+    """Return the ANSI formatting commands for :func:`.format` arguments.
+
+    Unsupported postional or keyword arguments are ignored.
     """
     # parse positional text attributes
     text_attribute_arguments = (arg for arg in args
@@ -107,6 +380,8 @@ def format(text: str, *args: t.Any, **kwargs: t.Any) -> str: # pylint: disable=r
         TextAttributes[key]
         for key in chain(text_attribute_arguments, text_attribute_keywords))
     # parse positional
+    options = {"metric": kwargs.get("metric", "rgb"),
+               "depth": kwargs.get("depth")}
     color_attributes = []
     for i, key in enumerate(["color", "background"]):
         try:
@@ -114,19 +389,17 @@ def format(text: str, *args: t.Any, **kwargs: t.Any) -> str: # pylint: disable=r
         except KeyError:
             continue
         if isinstance(value, (tuple, list)):
-            attribute = _color(*value, drawing_level=i)
+            attribute = _color(*value, drawing_level=i, **options)
         elif isinstance(value, dict):
-            attribute = _color(**value, drawing_level=i)
+            attribute = _color(**dict(options, **value), drawing_level=i)
         else:
-            attribute = _color(value, drawing_level=i)
+            attribute = _color(value, drawing_level=i, **options)
 
-        color_attributes.append(attribute)
+        if attribute:
+            color_attributes.append(attribute)
 
-    # encode emojis:
-    text = emojis.encode(text)
+    return tuple(chain(text_attributes, color_attributes))
 
-    return _format_rich_text(*text_attributes,
-                             *color_attributes) + text + reset()
 
 
 # TextAttributes:
@@ -195,8 +468,17 @@ def color(*args: t.Any, **kwargs: t.Any) -> str:
         >>> color(name="mediumspringgreen")
         \'\\x1b[38;5;49m\'
 
+        >>> # Get string for a truecolor background.
+        >>> color(hexa="#123456", colormode="truecolor", drawing_level="background")
+        \'\\x1b[48;2;18;52;86m\'
+
+        >>> # Get the closest color a 16 color terminal can display.
+        >>> color(name="red1", depth=16)
+        \'\\x1b[31;1m\'
+
     """
-    return _format_rich_text(_color(*args, **kwargs))
+    color_string = _color(*args, **kwargs)
+    return _format_rich_text(color_string) if color_string else ""
 
 
 def _color(name: t.Optional[t.ColorArg] = None, # pylint: disable=too-many-arguments
@@ -208,7 +490,9 @@ def _color(name: t.Optional[t.ColorArg] = None, # pylint: disable=too-many-argum
            bold: bool = False, # pylint: disable=redefined-outer-name
            blink: bool = False, # pylint: disable=redefined-outer-name
            bright: bool = False, # pylint: disable=redefined-outer-name
-           colormode: int = 8) -> str:
+           colormode: t.Union[int, str] = 8,
+           metric: str = "rgb",
+           depth: t.Optional[t.Union[int, str]] = None) -> str:
     """Returns ANSI color-string for specified color.
 
     Color value argument get parsed in this order:
@@ -231,6 +515,11 @@ def _color(name: t.Optional[t.ColorArg] = None, # pylint: disable=too-many-argum
     - If none of the above conditions are true, fallback to default
         8-bit colormode.
 
+    Truecolor (24-bit) colormode is only used if requested with
+    :py:`colormode=24` or :py:`colormode="truecolor"` and is never overridden.
+    Hexadecimal, rgb- and hsl-values are emitted directly as rgb-value, color
+    ids and names as the rgb-value of the palette color.
+
     Args:
         name: A color name.
             Can be of format:
@@ -268,25 +557,171 @@ def _color(name: t.Optional[t.ColorArg] = None, # pylint: disable=too-many-argum
             Deafault: False
         bright: Triggers "blink/birght" colors (256-bit).
             Default: False
-        colormode: Triggers 8-, 16-, or 256-bit colors. Any in (8, 16, 256).
+        colormode: Triggers 8-, 16-, 256-bit or truecolor colors. Any in
+            (8, 16, 256, 24, "truecolor").
             Default: 8
+        metric: How hexadecimal, rgb- and hsl-values are matched to the
+            256-bit palette. :py:`"rgb"` (distance in rgb space, see
+            :func:`.palette.nearest_color_id`) or :py:`"cie76"`/
+            :py:`"ciede2000"` (perceptual color difference, see
+            :func:`.palette.nearest_color_id_perceptual`).
+            Default: "rgb"
+        depth: The color depth of the terminal (see :mod:`.terminal`). Colors
+            of a higher colormode are replaced by the closest color the
+            terminal can display; depth 0 returns an empty string.
+            :py:`None` emits the colormode unchanged.
+            Default: None
+
+    Resolved colors are memoized. See :func:`.set_cache_size`,
+    :func:`.cache_info` and :func:`.clear_cache`.
 
     Raises:
         TypeError: If all color arguments are None.
+        ValueError: If metric or depth is not supported.
+    """
+    key = (_freeze(name), color_id, hexa, _freeze(rgb), _freeze(hsl),
+           drawing_level, bold, blink, bright, colormode, metric, depth)
+    try:
+        hash(key)
+    except TypeError:
+        # unhashable (e.g. array-like) color values cannot be cached
+        resolve = _resolve_color
+    else:
+        resolve = _cached_resolve_color
+
+    if _trace_hook is None:
+        return resolve(*key)[0]
+
+    start = perf_counter()
+    color_string, resolved_id, resolved_colormode = resolve(*key)
+    _trace_hook("color", {"color_id": resolved_id,
+                          "colormode": resolved_colormode,
+                          "sequence": color_string,
+                          "duration": perf_counter() - start})
+    return color_string
+
+
+def _resolve_color(name: t.Optional[t.ColorArg], # pylint: disable=too-many-arguments
+                   color_id: t.Optional[t.Union[int, str]],
+                   hexa: t.Optional[str],
+                   rgb: t.Optional[t.ColorValue],
+                   hsl: t.Optional[t.ColorValue],
+                   drawing_level: t.DrawingLevelArg,
+                   bold: bool, # pylint: disable=redefined-outer-name
+                   blink: bool, # pylint: disable=redefined-outer-name
+                   bright: bool, # pylint: disable=redefined-outer-name
+                   colormode: t.Union[int, str],
+                   metric: str,
+                   depth: t.Optional[t.Union[int, str]]) -> t.Tuple[str, t.Any, int]:
+    """Resolve color arguments into an ANSI color-string. See :func:`._color`.
+
+    Returns:
+        A tuple of the ANSI color-string, the color id (the rgb-value in
+        truecolor colormode) and the colormode.
     """
     # Parse drawing level
     drawing_level = utils.parse_drawing_level(drawing_level)
     colormode = utils.parse_colormode(colormode, blink, bright, bold)
-    _logger.debug("%d", colormode)
+    metric = utils.parse_metric(metric)
+    depth = 24 if depth is None else utils.parse_color_depth(depth)
     # Check if a valid color was provided
     argc, arg = utils.get_first_color_argument(color_id, name, hexa, rgb, hsl)
-    # Look-up correct get color id function
-    get_color_id = utils.parsing_switcher(argc, arg)
-    color_id, colormode = get_color_id(arg, colormode)
-    _logger.debug("%s, %d", color_id, colormode)
+    if depth == 0:
+        return "", None, 0
+    if colormode == 24:
+        rgb = utils.get_rgb(argc, arg)
+        if depth == 24:
+            return drawing_level + utils.get_color_string_24_bit(rgb), rgb, colormode
+        color_id, colormode = utils.get_color_id_from_color_value(
+            rgb, colormode, "rgb", metric)
+    else:
+        # Look-up correct get color id function
+        get_color_id = utils.parsing_switcher(argc, arg, metric)
+        color_id, colormode = get_color_id(arg, colormode)
+    color_id, colormode = utils.reduce_color_depth(color_id, colormode, depth)
     color_string = utils.get_color_string(color_id, colormode)
 
-    return drawing_level + color_string
+    return drawing_level + color_string, color_id, colormode
+
+
+_cached_resolve_color = lru_cache(maxsize=_DEFAULT_CACHE_SIZE)(_resolve_color)
+
+
+def _freeze(value: t.Any) -> t.Any:
+    """Return lists (e.g. rgb- or hsl-values) as tuple so they can be hashed."""
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+# Tracing:
+def set_trace_hook(hook: t.Optional[t.TraceHook]) -> None:
+    """Install a callback receiving tracing events.
+
+    Without a hook (the default) tracing costs a single :py:`None` check;
+    no event data is built.
+
+    The hook is called as :py:`hook(event, data)` with either
+
+    - :py:`"color"` and the keys :py:`"color_id"`, :py:`"colormode"`,
+      :py:`"sequence"` (the ANSI color-string) and :py:`"duration"` (time
+      spent resolving in seconds) for every resolved color (the color id is
+      the rgb-value in truecolor colormode), or
+    - :py:`"rich_text"` and the keys :py:`"commands"` and :py:`"sequence"`
+      (the ANSI Escape sequence) for every emitted rich text sequence.
+
+    Args:
+        hook: The callback. :py:`None` removes the current hook.
+
+    Examples:
+        >>> events = []
+        >>> set_trace_hook(lambda event, data: events.append((event, data)))
+        >>> _ = color("mediumspringgreen")
+        >>> set_trace_hook(None)
+        >>> [(event, data["sequence"]) for event, data in events]
+        [(\'color\', \'38;5;49\'), (\'rich_text\', \'\\x1b[38;5;49m\')]
+        >>> events[0][1]["color_id"], events[0][1]["colormode"]
+        (\'49\', 256)
+    """
+    global _trace_hook # pylint: disable=global-statement,invalid-name
+    _trace_hook = hook
+
+
+# Color cache:
+def set_cache_size(maxsize: t.Optional[int] = _DEFAULT_CACHE_SIZE) -> None:
+    """Set the maximum number of cached color resolutions.
+
+    Resolved color arguments are kept in a least-recently-used cache. Changing
+    the size clears the cache.
+
+    Args:
+        maxsize: Maximum number of cached entries. :py:`None` means unbounded,
+            :py:`0` disables caching.
+            Default: 1024
+    """
+    global _cached_resolve_color # pylint: disable=global-statement,invalid-name
+    _cached_resolve_color = lru_cache(maxsize=maxsize)(_resolve_color)
+
+
+def cache_info() -> t.Any:
+    """Return the color cache statistics.
+
+    Returns:
+        A named tuple with the fields hits, misses, maxsize and currsize
+        (see :func:`functools.lru_cache`).
+
+    Examples:
+        >>> clear_cache()
+        >>> _ = color("red"), color("red"), color("#ff0000")
+        >>> cache_info()
+        CacheInfo(hits=1, misses=2, maxsize=1024, currsize=2)
+    """
+    return _cached_resolve_color.cache_info()
+
+
+def clear_cache() -> None:
+    """Remove all entries and reset the statistics of the color cache."""
+    _cached_resolve_color.cache_clear()
 
 
 # convenience functions:
@@ -412,11 +847,11 @@ def _format_rich_text(*formatting_commands: str) -> str:
     Mutiple formatting commands are chained using the ANSI command seperator.
     """
     ansi_command = ANSICommands.start
-    logging.debug("_format_rich_text received: %s",
-                  (", ".join(formatting_commands)))
     ansi_command += ANSICommands.separator.join(formatting_commands)
     ansi_command += ANSICommands.stop
-    logging.debug("%s", ANSICommands._debug_esc + ansi_command[1:]) # pylint: disable=protected-access
+    if _trace_hook is not None:
+        _trace_hook("rich_text", {"commands": formatting_commands,
+                                  "sequence": ansi_command})
     return ansi_command
 
 
@@ -0,0 +1,446 @@
+"""Conversions between the rgb, hsl, hexadecimal and CIELAB color formats.
+
+Formats:
+    - **rgb**: (red, green, blue), each channel in :py:`range(256)`
+    - **hsl**: (hue, saturation, lightness), hue in degrees, saturation and
+      lightness in percent
+    - **hex**: :py:`"#rrggbb"`
+    - **lab**: CIELAB (L*, a*, b*) of the sRGB value (D65 white point)
+
+The perceptual difference of two lab-values is measured by
+:func:`.delta_e_cie76` (euclidean distance) or the more accurate
+:func:`.delta_e_ciede2000`.
+
+The scalar functions convert a single color. The ``*_many`` functions
+convert a sequence of colors; NumPy arrays (of shape :py:`(..., 3)` or of
+hex strings) are converted vectorized and returned as arrays. NumPy is
+optional (:py:`pip install pyansiescapes[numpy]`).
+
+Examples:
+    >>> rgb_to_hsl(255, 135, 0)
+    (31.764705882352942, 100.0, 50.0)
+    >>> hsl_to_rgb(31.76, 100, 50)
+    (255, 135, 0)
+    >>> hex_to_rgb("#ff8700")
+    (255, 135, 0)
+"""
+import math
+import re
+import sys
+import pyansiescapes._types as t
+
+_HEX = re.compile(r"#[0-9a-fA-F]{6}")
+_tables = {} # type: t.Dict[str, t.Any]
+
+# sRGB (D65) to CIE XYZ, scaled by the reference white so that white is (1, 1, 1)
+_XYZ_MATRIX = tuple(
+    tuple(value / white for value in row)
+    for row, white in zip(((0.4124564, 0.3575761, 0.1804375),
+                           (0.2126729, 0.7151522, 0.0721750),
+                           (0.0193339, 0.1191920, 0.9503041)),
+                          (0.95047, 1.0, 1.08883)))
+_LAB_EPSILON = (6 / 29) ** 3
+# linear light of every channel value
+_LINEAR = tuple(value / 255 / 12.92 if value / 255 <= 0.04045
+                else ((value / 255 + 0.055) / 1.055) ** 2.4
+                for value in range(256))
+_POW25_7 = 25 ** 7
+
+
+def rgb_to_hsl(red: float, green: float,
+               blue: float) -> t.Tuple[float, float, float]:
+    """Return the hsl-value of an rgb-value."""
+    red, green, blue = red / 255, green / 255, blue / 255
+    high, low = max(red, green, blue), min(red, green, blue)
+    lightness = (high + low) / 2
+    if high == low:
+        return 0.0, 0.0, lightness * 100
+
+    delta = high - low
+    if lightness > 0.5:
+        saturation = delta / (2 - high - low)
+    else:
+        saturation = delta / (high + low)
+    if high == red:
+        hue = (green - blue) / delta + (6 if green < blue else 0)
+    elif high == green:
+        hue = (blue - red) / delta + 2
+    else:
+        hue = (red - green) / delta + 4
+
+    return hue * 60, saturation * 100, lightness * 100
+
+
+def hsl_to_rgb(hue: float, saturation: float,
+               lightness: float) -> t.ColorValueTuple:
+    """Return the rgb-value (rounded to int) of an hsl-value.
+
+    Hues outside of :py:`range(360)` wrap around.
+
+    Examples:
+        >>> hsl_to_rgb(240, 100, 50)
+        (0, 0, 255)
+
+        >>> # tiny negative hues wrap around to (almost) 360
+        >>> hsl_to_rgb(-1e-20, 100, 50)
+        (255, 0, 0)
+    """
+    saturation, lightness = saturation / 100, lightness / 100
+    chroma = (1 - abs(2 * lightness - 1)) * saturation
+    hue = (hue % 360) / 60
+    second = chroma * (1 - abs(hue % 2 - 1))
+    offset = lightness - chroma / 2
+    # hue % 360 can round to 360.0 for tiny negative hues
+    sector = min(int(hue), 5)
+    red, green, blue = ((chroma, second, 0), (second, chroma, 0),
+                        (0, chroma, second), (0, second, chroma),
+                        (second, 0, chroma), (chroma, 0, second))[sector]
+    return (int(round((red + offset) * 255)),
+            int(round((green + offset) * 255)),
+            int(round((blue + offset) * 255)))
+
+
+def rgb_to_hex(red: int, green: int, blue: int) -> str:
+    """Return the hexadecimal color value of an rgb-value.
+
+    Raises:
+        ValueError: {value} is not a valid rgb-value!
+            If a channel value is out of range.
+
+    Examples:
+        >>> rgb_to_hex(255, 135, 0)
+        '#ff8700'
+    """
+    if (red | green | blue) >> 8:
+        raise ValueError(
+            "{} is not a valid rgb-value!".format((red, green, blue)))
+    return "#{:02x}{:02x}{:02x}".format(red, green, blue)
+
+
+def hex_to_rgb(hex: str) -> t.ColorValueTuple: # pylint: disable=redefined-builtin
+    """Return the rgb-value of a hexadecimal color value.
+
+    Raises:
+        ValueError: {hex} is not a valid hexadecimal color value!
+            If hex is not of format :py:`"#rrggbb"`.
+    """
+    if not _HEX.fullmatch(hex):
+        raise ValueError("{} is not a valid hexadecimal color value!".format(hex))
+    packed = int(hex[1:], 16)
+    return (packed >> 16) & 0xff, (packed >> 8) & 0xff, packed & 0xff
+
+
+def hsl_to_hex(hue: float, saturation: float, lightness: float) -> str:
+    """Return the hexadecimal color value of an hsl-value."""
+    return rgb_to_hex(*hsl_to_rgb(hue, saturation, lightness))
+
+
+def hex_to_hsl(hex: str) -> t.Tuple[float, float, float]: # pylint: disable=redefined-builtin
+    """Return the hsl-value of a hexadecimal color value."""
+    return rgb_to_hsl(*hex_to_rgb(hex))
+
+
+def rgb_to_lab(red: int, green: int,
+               blue: int) -> t.Tuple[float, float, float]:
+    """Return the CIELAB value (D65) of an rgb-value.
+
+    Examples:
+        >>> [round(value, 2) for value in rgb_to_lab(255, 135, 0)]
+        [68.46, 39.35, 74.86]
+    """
+    channels = _LINEAR[red], _LINEAR[green], _LINEAR[blue]
+    x, y, z = (_lab_f(row[0] * channels[0] + row[1] * channels[1]
+                      + row[2] * channels[2]) for row in _XYZ_MATRIX)
+    return 116 * y - 16, 500 * (x - y), 200 * (y - z)
+
+
+def _lab_f(value: float) -> float:
+    """The nonlinear compression of the CIELAB transform."""
+    if value > _LAB_EPSILON:
+        return value ** (1 / 3)
+    return value / (3 * (6 / 29) ** 2) + 4 / 29
+
+
+def delta_e_cie76(lab1: t.Sequence[float], lab2: t.Sequence[float]) -> float:
+    """Return the CIE76 color difference (euclidean distance) of two
+    lab-values."""
+    return math.sqrt((lab1[0] - lab2[0]) ** 2 + (lab1[1] - lab2[1]) ** 2
+                     + (lab1[2] - lab2[2]) ** 2)
+
+
+def delta_e_ciede2000(lab1: t.Sequence[float], # pylint: disable=too-many-locals
+                      lab2: t.Sequence[float]) -> float:
+    """Return the CIEDE2000 color difference of two lab-values.
+
+    Examples:
+        >>> round(delta_e_ciede2000((50, 2.6772, -79.7751), (50, 0, -82.7485)), 4)
+        2.0425
+    """
+    lightness1, a1, b1 = lab1
+    lightness2, a2, b2 = lab2
+    chroma_mean = (math.hypot(a1, b1) + math.hypot(a2, b2)) / 2
+    g = 0.5 * (1 - math.sqrt(chroma_mean ** 7 / (chroma_mean ** 7 + _POW25_7)))
+    a1, a2 = (1 + g) * a1, (1 + g) * a2
+    chroma1, chroma2 = math.hypot(a1, b1), math.hypot(a2, b2)
+    hue1 = math.degrees(math.atan2(b1, a1)) % 360 if chroma1 else 0.0
+    hue2 = math.degrees(math.atan2(b2, a2)) % 360 if chroma2 else 0.0
+
+    hue_delta = hue2 - hue1
+    hue_mean = hue1 + hue2
+    if chroma1 and chroma2:
+        if hue_delta > 180:
+            hue_delta -= 360
+        elif hue_delta < -180:
+            hue_delta += 360
+        if abs(hue1 - hue2) <= 180:
+            hue_mean /= 2
+        else:
+            hue_mean = (hue_mean + (360 if hue_mean < 360 else -360)) / 2
+    else:
+        hue_delta = 0
+
+    lightness_delta = lightness2 - lightness1
+    chroma_delta = chroma2 - chroma1
+    hue_delta = (2 * math.sqrt(chroma1 * chroma2)
+                 * math.sin(math.radians(hue_delta) / 2))
+    lightness_mean = (lightness1 + lightness2) / 2 - 50
+    chroma_mean = (chroma1 + chroma2) / 2
+    weight = (1 - 0.17 * math.cos(math.radians(hue_mean - 30))
+              + 0.24 * math.cos(math.radians(2 * hue_mean))
+              + 0.32 * math.cos(math.radians(3 * hue_mean + 6))
+              - 0.20 * math.cos(math.radians(4 * hue_mean - 63)))
+    rotation = (-2 * math.sqrt(chroma_mean ** 7 / (chroma_mean ** 7 + _POW25_7))
+                * math.sin(math.radians(
+                    60 * math.exp(-((hue_mean - 275) / 25) ** 2))))
+    lightness_term = lightness_delta / (
+        1 + 0.015 * lightness_mean ** 2 / math.sqrt(20 + lightness_mean ** 2))
+    chroma_term = chroma_delta / (1 + 0.045 * chroma_mean)
+    hue_term = hue_delta / (1 + 0.015 * chroma_mean * weight)
+    return math.sqrt(lightness_term ** 2 + chroma_term ** 2 + hue_term ** 2
+                     + rotation * chroma_term * hue_term)
+
+
+def rgb_to_hsl_many(values: t.Any) -> t.Any:
+    """Return the hsl-values of a sequence or an array of rgb-values.
+
+    Examples:
+        >>> rgb_to_hsl_many([(0, 0, 255), (255, 255, 255)])
+        [(240.0, 100.0, 50.0), (0.0, 0.0, 100.0)]
+    """
+    if not _is_array(values):
+        return [rgb_to_hsl(*value) for value in values]
+
+    np = _numpy()
+    rgb = np.asarray(values, dtype=np.float64) / 255
+    red, green, blue = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    high, low = rgb.max(axis=-1), rgb.min(axis=-1)
+    lightness = (high + low) / 2
+    delta = high - low
+    grey = delta == 0
+    safe_delta = np.where(grey, 1, delta)
+    saturation = np.where(
+        grey, 0, safe_delta / np.where(lightness > 0.5, 2 - high - low,
+                                       np.where(grey, 1, high + low)))
+    hue = np.where(
+        high == red, (green - blue) / safe_delta + np.where(green < blue, 6, 0),
+        np.where(high == green, (blue - red) / safe_delta + 2,
+                 (red - green) / safe_delta + 4))
+    hue = np.where(grey, 0, hue)
+    return np.stack([hue * 60, saturation * 100, lightness * 100], axis=-1)
+
+
+def hsl_to_rgb_many(values: t.Any) -> t.Any:
+    """Return the rgb-values of a sequence or an array of hsl-values.
+
+    Arrays are returned as :py:`uint8` arrays.
+
+    Examples:
+        >>> hsl_to_rgb_many([(240, 100, 50), (0, 0, 100)])
+        [(0, 0, 255), (255, 255, 255)]
+
+        >>> import numpy as np
+        >>> hsl_to_rgb_many(np.array([(-1e-20, 100, 50)])).tolist()
+        [[255, 0, 0]]
+    """
+    if not _is_array(values):
+        return [hsl_to_rgb(*value) for value in values]
+
+    np = _numpy()
+    hsl = np.asarray(values, dtype=np.float64)
+    saturation, lightness = hsl[..., 1] / 100, hsl[..., 2] / 100
+    chroma = (1 - np.abs(2 * lightness - 1)) * saturation
+    hue = (hsl[..., 0] % 360) / 60
+    second = chroma * (1 - np.abs(hue % 2 - 1))
+    offset = lightness - chroma / 2
+    sector = np.minimum(hue.astype(np.int64), 5) # see hsl_to_rgb
+    zero = np.zeros_like(chroma)
+    # channel values per sector, see hsl_to_rgb
+    red = np.choose(sector, [chroma, second, zero, zero, second, chroma])
+    green = np.choose(sector, [second, chroma, chroma, second, zero, zero])
+    blue = np.choose(sector, [zero, zero, second, chroma, chroma, second])
+    rgb = np.stack([red, green, blue], axis=-1) + offset[..., None]
+    # round half away from zero just as round() for non-negative values
+    return np.floor(rgb * 255 + 0.5).astype(np.uint8)
+
+
+def rgb_to_hex_many(values: t.Any) -> t.Any:
+    """Return the hexadecimal color values of a sequence or an array of
+    rgb-values."""
+    if not _is_array(values):
+        return [rgb_to_hex(*value) for value in values]
+
+    np = _numpy()
+    rgb = np.asarray(values)
+    if rgb.size and (rgb.min() < 0 or rgb.max() > 255):
+        raise ValueError("rgb-values must be in range(256)!")
+    packed = ((rgb[..., 0].astype(np.int64) << 16)
+              | (rgb[..., 1].astype(np.int64) << 8) | rgb[..., 2])
+    return np.char.add("#", np.char.zfill(np.char.mod("%x", packed), 6))
+
+
+def hex_to_rgb_many(hexes: t.Any) -> t.Any:
+    """Return the rgb-values of a sequence or an array of hexadecimal color
+    values.
+
+    Arrays are returned as :py:`uint8` arrays of shape :py:`hexes.shape + (3,)`.
+
+    Raises:
+        ValueError: If a value is not of format :py:`"#rrggbb"`.
+    """
+    if not _is_array(hexes):
+        return [hex_to_rgb(hex) for hex in hexes]
+
+    np = _numpy()
+    hexes = np.asarray(hexes)
+    if hexes.dtype.kind == "U":
+        width = hexes.dtype.itemsize // 4
+        chars = np.ascontiguousarray(hexes).view(np.uint32)
+    elif hexes.dtype.kind == "S":
+        width = hexes.dtype.itemsize
+        chars = np.ascontiguousarray(hexes).view(np.uint8)
+    else:
+        raise ValueError("Hexadecimal color values must be strings!")
+    chars = chars.reshape(hexes.shape + (width,))
+    # shorter values are padded with 0, which is no hexadecimal digit
+    if width < 7 or chars[..., 7:].any() or (chars[..., 0] != ord("#")).any():
+        raise ValueError("Hexadecimal color values must be of format #rrggbb!")
+    digits = _hex_digits()[np.minimum(chars[..., 1:7], 255)]
+    if (digits > 15).any():
+        raise ValueError("Hexadecimal color values must be of format #rrggbb!")
+    return ((digits[..., 0::2] << 4) | digits[..., 1::2]).astype(np.uint8)
+
+
+def rgb_to_lab_many(values: t.Any) -> t.Any:
+    """Return the lab-values of a sequence or an array of rgb-values."""
+    if not _is_array(values):
+        return [rgb_to_lab(*value) for value in values]
+
+    np = _numpy()
+    rgb = np.asarray(values)
+    if rgb.size and (rgb.min() < 0 or rgb.max() > 255):
+        raise ValueError("rgb-values must be in range(256)!")
+    linear = np.array(_LINEAR)[rgb.astype(np.intp)]
+    xyz = linear @ np.array(_XYZ_MATRIX).T
+    xyz = np.where(xyz > _LAB_EPSILON, np.cbrt(xyz),
+                   xyz / (3 * (6 / 29) ** 2) + 4 / 29)
+    x, y, z = xyz[..., 0], xyz[..., 1], xyz[..., 2]
+    return np.stack([116 * y - 16, 500 * (x - y), 200 * (y - z)], axis=-1)
+
+
+def delta_e_cie76_many(lab1: t.Any, lab2: t.Any) -> t.Any:
+    """Return the CIE76 color differences of two sequences of lab-values.
+
+    Arrays of shape :py:`(..., 3)` are broadcast against each other.
+    """
+    if not (_is_array(lab1) or _is_array(lab2)):
+        return [delta_e_cie76(first, second)
+                for first, second in zip(lab1, lab2)]
+
+    np = _numpy()
+    return np.sqrt(((np.asarray(lab1) - lab2) ** 2).sum(axis=-1))
+
+
+def delta_e_ciede2000_many(lab1: t.Any, lab2: t.Any) -> t.Any: # pylint: disable=too-many-locals
+    """Return the CIEDE2000 color differences of two sequences of lab-values.
+
+    Arrays of shape :py:`(..., 3)` are broadcast against each other.
+    """
+    if not (_is_array(lab1) or _is_array(lab2)):
+        return [delta_e_ciede2000(first, second)
+                for first, second in zip(lab1, lab2)]
+
+    np = _numpy()
+    lab1, lab2 = np.asarray(lab1, dtype=np.float64), np.asarray(lab2, dtype=np.float64)
+    lightness1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    lightness2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+    chroma_mean = (np.hypot(a1, b1) + np.hypot(a2, b2)) / 2
+    g = 0.5 * (1 - np.sqrt(chroma_mean ** 7 / (chroma_mean ** 7 + _POW25_7)))
+    a1, a2 = (1 + g) * a1, (1 + g) * a2
+    chroma1, chroma2 = np.hypot(a1, b1), np.hypot(a2, b2)
+    hue1 = np.where(chroma1 > 0, np.degrees(np.arctan2(b1, a1)) % 360, 0)
+    hue2 = np.where(chroma2 > 0, np.degrees(np.arctan2(b2, a2)) % 360, 0)
+
+    # see delta_e_ciede2000 for the case distinctions
+    colored = (chroma1 > 0) & (chroma2 > 0)
+    hue_delta = hue2 - hue1
+    hue_delta = np.where(hue_delta > 180, hue_delta - 360,
+                         np.where(hue_delta < -180, hue_delta + 360, hue_delta))
+    hue_delta = np.where(colored, hue_delta, 0)
+    hue_sum = hue1 + hue2
+    hue_mean = np.where(
+        colored & (np.abs(hue1 - hue2) > 180),
+        (hue_sum + np.where(hue_sum < 360, 360, -360)) / 2,
+        np.where(colored, hue_sum / 2, hue_sum))
+
+    lightness_delta = lightness2 - lightness1
+    chroma_delta = chroma2 - chroma1
+    hue_delta = (2 * np.sqrt(chroma1 * chroma2)
+                 * np.sin(np.radians(hue_delta) / 2))
+    lightness_mean = (lightness1 + lightness2) / 2 - 50
+    chroma_mean = (chroma1 + chroma2) / 2
+    weight = (1 - 0.17 * np.cos(np.radians(hue_mean - 30))
+              + 0.24 * np.cos(np.radians(2 * hue_mean))
+              + 0.32 * np.cos(np.radians(3 * hue_mean + 6))
+              - 0.20 * np.cos(np.radians(4 * hue_mean - 63)))
+    rotation = (-2 * np.sqrt(chroma_mean ** 7 / (chroma_mean ** 7 + _POW25_7))
+                * np.sin(np.radians(
+                    60 * np.exp(-((hue_mean - 275) / 25) ** 2))))
+    lightness_term = lightness_delta / (
+        1 + 0.015 * lightness_mean ** 2 / np.sqrt(20 + lightness_mean ** 2))
+    chroma_term = chroma_delta / (1 + 0.045 * chroma_mean)
+    hue_term = hue_delta / (1 + 0.015 * chroma_mean * weight)
+    return np.sqrt(lightness_term ** 2 + chroma_term ** 2 + hue_term ** 2
+                   + rotation * chroma_term * hue_term)
+
+
+def _is_array(values: t.Any) -> bool:
+    """Return True for NumPy arrays.
+
+    NumPy is not imported here: if it was not imported yet, values cannot be
+    an array.
+    """
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+
+def _numpy() -> t.Any:
+    """Return the numpy module, imported on first use (see :func:`_is_array`)."""
+    import numpy # pylint: disable=import-outside-toplevel
+    return numpy
+
+
+def _hex_digits() -> t.Any:
+    """Return the array mapping characters to hexadecimal digit values (255
+    for other characters)."""
+    if "hex_digits" not in _tables:
+        np = _numpy()
+        digits = np.full(256, 255, dtype=np.int32)
+        for digit in "0123456789abcdef":
+            digits[ord(digit)] = digits[ord(digit.upper())] = int(digit, 16)
+        _tables["hex_digits"] = digits
+    return _tables["hex_digits"]
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,161 @@
+"""Streaming reduction of the color depth of formatted text.
+
+:class:`.DepthFilter` rewrites the color parameters of the SGR sequences in
+text to colors a terminal with fewer colors can display (see
+:mod:`.terminal` for the color depths) and passes everything else through
+unchanged. Truecolor parameters are replaced by the closest 256-bit color,
+256-bit colors by the closest system color (see :attr:`.palette.ID_16` and
+:attr:`.palette.ID_8`), encoded like the colors of :func:`.color` at the same
+depth. Depth 0 removes the SGR sequences.
+
+Just like :class:`.AnsiParser`, the filter is fed chunks that can be split
+anywhere, also in the middle of an escape sequence.
+
+Examples:
+    >>> depth_filter = DepthFilter(16)
+    >>> line = "\\x1b[1;38;5;196mError\\x1b[0m\\n"
+    >>> depth_filter.feed(line[:6]) + depth_filter.feed(line[6:]) + depth_filter.close()
+    \'\\x1b[1;31;1mError\\x1b[0m\\n\'
+"""
+import re
+from functools import lru_cache
+from pyansiescapes import palette, parser, sgr, utils
+from pyansiescapes.enums import ColorDrawingLevel
+import pyansiescapes._types as t
+
+_SGR = re.compile(r"\x1b\[([0-9;]*)m")
+# bright 8-bit colors --> the 8-bit colors (for depth 8)
+_NOT_BRIGHT = dict(
+    [(str(code), str(code - 60)) for code in range(90, 98)]
+    + [(str(code), str(code - 60)) for code in range(100, 108)])
+
+
+class DepthFilter:
+    """Push filter reducing the color depth of formatted text.
+
+    Args:
+        depth: The color depth of the output. Any in :py:`(0, 8, 16, 256, 24,
+            "truecolor")`, e.g. :py:`terminal.color_depth(sys.stdout)`.
+
+    Raises:
+        ValueError: If depth is not valid.
+    """
+
+    def __init__(self, depth: t.Union[int, str]) -> None:
+        self.depth = utils.parse_color_depth(depth)
+        self._pending = ""
+
+    def feed(self, chunk: str) -> str:
+        """Return the next chunk of text with reduced colors.
+
+        An escape sequence at the end of the chunk that is not complete yet is
+        kept back until the next call.
+        """
+        if self._pending:
+            chunk = self._pending + chunk
+        if "\x1b" not in chunk:
+            self._pending = ""
+            return chunk
+        chunk, self._pending = parser.split_incomplete(chunk)
+        if self.depth == 24:
+            return chunk
+        if self.depth == 0:
+            return _SGR.sub("", chunk)
+
+        # text, SGR parameters, text, ...
+        parts = _SGR.split(chunk)
+        depth = self.depth
+        parts[1::2] = [_reduce_sequence(params, depth) for params in parts[1::2]]
+        return "".join(parts)
+
+    def close(self) -> str:
+        """Return the text kept back from the last chunk.
+
+        An incomplete escape sequence at the end of the input is returned
+        unchanged.
+        """
+        pending, self._pending = self._pending, ""
+        return pending
+
+
+def reduce_depth(chunks: t.Iterable[str],
+                 depth: t.Union[int, str]) -> t.Iterator[str]:
+    """Yield text read chunk by chunk (e.g. from a file object) with reduced
+    colors. Empty chunks are left out.
+
+    Examples:
+        >>> "".join(reduce_depth(["\\x1b[38;2;255;135;0", "mhot\\x1b[0m"], 256))
+        \'\\x1b[38;5;208mhot\\x1b[0m\'
+    """
+    depth_filter = DepthFilter(depth)
+    for chunk in chunks:
+        output = depth_filter.feed(chunk)
+        if output:
+            yield output
+    output = depth_filter.close()
+    if output:
+        yield output
+
+
+@lru_cache(maxsize=4096)
+def _reduce_sequence(params: str, depth: int) -> str:
+    """Return the SGR sequence for params with colors reduced to depth."""
+    if depth == 0:
+        return ""
+    codes = params.split(sgr.SEPARATOR)
+    output = []
+    index, count = 0, len(codes)
+    while index < count:
+        code = codes[index]
+        index += 1
+        if code in ("38", "48"):
+            color_id, length = _extended_color_id(codes, index)
+            if color_id is not None and (length == 4 or depth != 256):
+                output.append(_color_params(depth)[color_id][code == "48"])
+            else:
+                output.extend(codes[index - 1:index + length])
+            index += length
+            continue
+        if depth == 8 and code in _NOT_BRIGHT:
+            code = _NOT_BRIGHT[code]
+        output.append(code)
+
+    return sgr.sequence(sgr.SEPARATOR.join(output))
+
+
+def _extended_color_id(codes: t.List[str],
+                       index: int) -> t.Tuple[t.Optional[int], int]:
+    """Return the 256-bit color id and the number of parameters of the
+    extended color (:py:`5;<id>` or :py:`2;<r>;<g>;<b>`) at codes[index].
+
+    The color id is :py:`None` for invalid colors, which are left unchanged.
+    The number of parameters is counted as in :func:`.sgr.apply_params`.
+    """
+    mode = codes[index:index + 1]
+    length = 2 if mode == ["5"] else 4
+    values = codes[index + 1:index + length]
+    if (len(values) != length - 1 or mode not in (["5"], ["2"])
+            or not all(value.isdigit() and int(value) < 256 for value in values)):
+        return None, length
+    if length == 2:
+        return int(values[0]), length
+    return palette.nearest_color_id(*(int(value) for value in values)), length
+
+
+@lru_cache(maxsize=None)
+def _color_params(depth: int) -> t.Tuple[t.Tuple[str, str], ...]:
+    """Return the foreground and background parameters of every 256-bit color
+    id at depth, encoded just like :func:`.color` with this depth does (bright
+    system colors as :py:`"3x;1"`)."""
+    params = []
+    for color_id in range(256):
+        color_string = utils.get_color_string(
+            *utils.reduce_color_depth(str(color_id), 256, depth))
+        params.append((ColorDrawingLevel.foreground + color_string,
+                       ColorDrawingLevel.background + color_string))
+    return tuple(params)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,214 @@
+"""Conversion of formatted text to HTML.
+
+:class:`.HtmlConverter` parses the text with an :class:`.AnsiParser` and
+writes every span as a :py:`<span>` element, styled by CSS classes (see
+:func:`.stylesheet`) or by inline styles. Colors are taken from the 256-color
+hex table :data:`.palette.HEX`. The text is converted chunk by chunk, so
+logs of any size can be converted without reading them completely:
+
+    >>> import io
+    >>> log, html = io.StringIO("\\x1b[1;31mError\\x1b[0m\\n" * 3), io.StringIO()
+    >>> converter = HtmlConverter(html)
+    >>> for chunk in iter(lambda: log.read(8), ""):
+    ...     converter.feed(chunk)
+    >>> converter.close()
+    >>> print(html.getvalue())
+    <span class="ansi-bold ansi-fg-1">Error</span>
+    <span class="ansi-bold ansi-fg-1">Error</span>
+    <span class="ansi-bold ansi-fg-1">Error</span>
+    <BLANKLINE>
+"""
+from html import escape
+from pyansiescapes import palette
+from pyansiescapes.enums import TextAttributes
+from pyansiescapes.parser import AnsiParser, SpanStyle, PLAIN
+import pyansiescapes._types as t
+
+# attribute --> CSS declaration
+_ATTRIBUTE_CSS = {
+    TextAttributes.bold: "font-weight: bold",
+    TextAttributes.underline: "text-decoration: underline",
+    TextAttributes.blink: "text-decoration: blink",
+    TextAttributes.concealed: "visibility: hidden",
+}
+# attribute --> CSS class name (without prefix)
+_ATTRIBUTE_CLASSES = {
+    TextAttributes.bold: "bold",
+    TextAttributes.underline: "underline",
+    TextAttributes.blink: "blink",
+    TextAttributes.concealed: "concealed",
+}
+# colors reversed text is displayed in if the foreground/background is not set
+_REVERSED_FOREGROUND = 0 # black
+_REVERSED_BACKGROUND = 7 # white
+_MAX_CACHED_STYLES = 1024
+
+
+class HtmlConverter:
+    """Write formatted text as HTML to a text file object.
+
+    Adjacent spans with the same style are merged into one element, also
+    across chunks. Output is written to the stream once per :meth:`feed`, so
+    memory usage is bounded by the chunk size. The output is not wrapped into
+    a document or :py:`<pre>` element.
+
+    Reversed text swaps the foreground and background color; colors that are
+    not set are assumed to be white text on black.
+
+    Args:
+        stream: Any text file object with a :py:`write` method.
+        inline_styles: Style the elements with :py:`style` attributes instead
+            of CSS classes. Truecolor colors are always styled inline.
+            Default: False
+        class_prefix: Prefix of the CSS class names.
+            Default: "ansi-"
+
+    Examples:
+        >>> import io
+        >>> html = io.StringIO()
+        >>> converter = HtmlConverter(html, inline_styles=True)
+        >>> converter.feed("\\x1b[38;5;208m<b>\\x1b[0m & more")
+        >>> converter.close()
+        >>> html.getvalue()
+        '<span style="color: #ff8700">&lt;b&gt;</span> &amp; more'
+    """
+
+    def __init__(self, stream: t.Any, inline_styles: bool = False,
+                 class_prefix: str = "ansi-") -> None:
+        self.stream = stream
+        self.inline_styles = inline_styles
+        self.class_prefix = class_prefix
+        self._parser = AnsiParser()
+        self._style = PLAIN # style of the open element
+        self._tags = {} # type: t.Dict[SpanStyle, str]
+
+    def feed(self, chunk: str) -> None:
+        """Convert the next chunk of text and write it to the stream."""
+        output = [] # type: t.List[str]
+        style = self._style
+        for span in self._parser.feed(chunk):
+            if span.style != style:
+                if style != PLAIN:
+                    output.append("</span>")
+                style = span.style
+                if style != PLAIN:
+                    output.append(self._open_tag(style))
+            output.append(escape(span.text, quote=False))
+        self._style = style
+        if output:
+            self.stream.write("".join(output))
+
+    def close(self) -> None:
+        """Convert the rest of the text and close the open element.
+
+        The stream itself is not closed.
+        """
+        output = [escape(span.text, quote=False)
+                  for span in self._parser.close()]
+        if self._style != PLAIN:
+            output.append("</span>")
+            self._style = PLAIN
+        if output:
+            self.stream.write("".join(output))
+
+    def __enter__(self) -> "HtmlConverter":
+        return self
+
+    def __exit__(self, *exc_info: t.Any) -> None:
+        self.close()
+
+    def _open_tag(self, style: SpanStyle) -> str:
+        """Return the (cached) opening tag of the element for style."""
+        try:
+            return self._tags[style]
+        except KeyError:
+            tag = _open_tag(style, self.inline_styles, self.class_prefix)
+            if len(self._tags) >= _MAX_CACHED_STYLES:
+                self._tags.clear()
+            self._tags[style] = tag
+            return tag
+
+
+def convert(text: str, inline_styles: bool = False,
+            class_prefix: str = "ansi-") -> str:
+    """Return formatted text as HTML. See :class:`.HtmlConverter`.
+
+    Examples:
+        >>> convert("\\x1b[4;44mlink\\x1b[0m")
+        '<span class="ansi-underline ansi-bg-4">link</span>'
+    """
+    output = [] # type: t.List[str]
+    stream = _ListStream(output)
+    converter = HtmlConverter(stream, inline_styles, class_prefix)
+    converter.feed(text)
+    converter.close()
+    return "".join(output)
+
+
+def stylesheet(class_prefix: str = "ansi-") -> str:
+    """Return the CSS rules for the class names used by :class:`.HtmlConverter`.
+
+    Examples:
+        >>> print(stylesheet().splitlines()[0])
+        .ansi-bold { font-weight: bold }
+    """
+    rules = []
+    for attribute, name in _ATTRIBUTE_CLASSES.items():
+        rules.append(".{}{} {{ {} }}".format(
+            class_prefix, name, _ATTRIBUTE_CSS[attribute]))
+    for color_id, hexa in enumerate(palette.HEX):
+        rules.append(".{}fg-{} {{ color: {} }}".format(
+            class_prefix, color_id, hexa))
+    for color_id, hexa in enumerate(palette.HEX):
+        rules.append(".{}bg-{} {{ background-color: {} }}".format(
+            class_prefix, color_id, hexa))
+    return "\n".join(rules) + "\n"
+
+
+class _ListStream:
+    """Minimal text stream appending the written text to a list."""
+
+    def __init__(self, output: t.List[str]) -> None:
+        self.write = output.append
+
+
+def _open_tag(style: SpanStyle, inline_styles: bool, class_prefix: str) -> str:
+    """Return the opening tag of the element for style."""
+    foreground, background = style.foreground, style.background
+    if TextAttributes.reversed in style.attributes:
+        foreground, background = (
+            _REVERSED_FOREGROUND if background is None else background,
+            _REVERSED_BACKGROUND if foreground is None else foreground)
+
+    classes = [] # type: t.List[str]
+    declarations = [] # type: t.List[str]
+    attributes = sorted(_ATTRIBUTE_CLASSES.keys() & style.attributes, key=int)
+    if inline_styles:
+        declarations.extend(_ATTRIBUTE_CSS[attribute] for attribute in attributes)
+    else:
+        classes.extend(class_prefix + _ATTRIBUTE_CLASSES[attribute]
+                       for attribute in attributes)
+    for color, level, prop in ((foreground, "fg-", "color: "),
+                               (background, "bg-", "background-color: ")):
+        if color is None:
+            continue
+        if isinstance(color, tuple):
+            declarations.append(prop + "#{:02x}{:02x}{:02x}".format(*color))
+            continue
+        color_id = int(color) # Colors members are 8-bit color ids
+        if inline_styles:
+            declarations.append(prop + palette.HEX[color_id])
+        else:
+            classes.append(class_prefix + level + str(color_id))
+
+    tag = "<span"
+    if classes:
+        tag += ' class="{}"'.format(" ".join(classes))
+    if declarations:
+        tag += ' style="{}"'.format("; ".join(declarations))
+    return tag + ">"
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,138 @@
+"""Rendering of images (rgb arrays) with half-block characters.
+
+Every character cell shows two pixels: the upper half block "▀" is drawn in
+the color of the upper pixel (foreground) on the color of the lower pixel
+(background). Colors are set only when they change from one cell to the
+next, so the size of the output grows with the number of color changes,
+not with the number of pixels.
+
+Examples:
+    >>> red, blue = (255, 0, 0), (0, 0, 255)
+    >>> print(repr(render([[red, red, blue], [blue, blue, blue]])))
+    \'\\x1b[38;5;9;48;5;12m▀▀ \\x1b[0m\\n\'
+"""
+from functools import lru_cache
+from pyansiescapes import palette, sgr
+import pyansiescapes._types as t
+
+UPPER_HALF_BLOCK = "▀"
+FULL_BLOCK = "█"
+
+# color id --> foreground and background color parameters
+_PARAMS_256 = tuple(("38;5;" + str(color_id), "48;5;" + str(color_id))
+                    for color_id in range(256))
+
+
+def render(pixels: t.Any, colormode: t.Union[int, str] = 256) -> str:
+    """Return pixels as lines of half-block characters.
+
+    Each line shows two rows of pixels and ends with a reset and a line
+    break. If the number of rows is odd, the last line shows the last row on
+    the default background.
+
+    Args:
+        pixels: The rgb-values as nested lists (rows of (r, g, b) values) or
+            as array of shape :py:`(height, width, 3)`. Arrays are quantized
+            with :mod:`.batch` if NumPy is installed.
+        colormode: 256 to use the closest palette colors (see
+            :func:`.palette.nearest_color_id`), 24 or "truecolor" for the
+            exact rgb-values.
+            Default: 256
+
+    Raises:
+        ValueError: If the colormode is not supported or a rgb-value is
+            invalid.
+    """
+    if colormode == 256:
+        rows = [[_PARAMS_256[color_id] for color_id in row]
+                for row in _color_id_rows(pixels)]
+    elif colormode in (24, "truecolor"):
+        rows = [[_truecolor_params(*pixel) for pixel in row]
+                for row in _rows(pixels)]
+    else:
+        raise ValueError("{} is not a supported colormode!".format(colormode))
+
+    lines = []
+    for index in range(0, len(rows), 2):
+        upper = rows[index]
+        lower = (rows[index + 1] if index + 1 < len(rows)
+                 else [(None, None)] * len(upper))
+        lines.append(_render_line(upper, lower))
+    return "".join(lines)
+
+
+def _render_line(upper: t.List[t.Tuple[str, str]],
+                 lower: t.List[t.Tuple[t.Optional[str], t.Optional[str]]]) -> str:
+    """Return one line of cells from the color parameters of two pixel rows."""
+    output = []
+    foreground = background = None # type: t.Optional[str]
+    for (top, top_background), (_, bottom) in zip(upper, lower):
+        if top_background == bottom:
+            # both halves have the same color: reuse the current colors
+            if bottom == background:
+                output.append(" ")
+                continue
+            if top == foreground:
+                output.append(FULL_BLOCK)
+                continue
+            glyph, top = " ", foreground
+        else:
+            glyph = UPPER_HALF_BLOCK
+
+        params = []
+        if top != foreground:
+            params.append(top or sgr.DEFAULT_FOREGROUND)
+            foreground = top
+        if bottom != background:
+            params.append(bottom or sgr.DEFAULT_BACKGROUND)
+            background = bottom
+        if params:
+            output.append(sgr.sequence(sgr.SEPARATOR.join(params)))
+        output.append(glyph)
+    output.append(sgr.sequence(sgr.RESET) + "\n")
+    return "".join(output)
+
+
+@lru_cache(maxsize=4096)
+def _truecolor_params(red: int, green: int, blue: int) -> t.Tuple[str, str]:
+    """Return the foreground and background color parameters of a rgb-value."""
+    if (red | green | blue) >> 8:
+        raise ValueError(
+            "{} is not a valid rgb-value!".format((red, green, blue)))
+    rgb = "2;{};{};{}".format(red, green, blue)
+    return "38;" + rgb, "48;" + rgb
+
+
+def _rows(pixels: t.Any) -> t.List[t.Any]:
+    """Return pixels as list of rows of rgb-values (lists of int)."""
+    tolist = getattr(pixels, "tolist", None)
+    return tolist() if tolist is not None else list(pixels)
+
+
+def _color_id_rows(pixels: t.Any) -> t.List[t.List[int]]:
+    """Return the rows of palette color ids closest to the pixels."""
+    if hasattr(pixels, "shape"):
+        try:
+            from pyansiescapes import batch # pylint: disable=import-outside-toplevel
+            return batch.nearest_color_ids(pixels).tolist()
+        except ImportError:
+            pass
+
+    cache = {} # type: t.Dict[t.Tuple[int, ...], int]
+    rows = []
+    for row in _rows(pixels):
+        ids = []
+        for pixel in row:
+            pixel = tuple(pixel)
+            try:
+                ids.append(cache[pixel])
+            except KeyError:
+                color_id = cache[pixel] = palette.nearest_color_id(*pixel)
+                ids.append(color_id)
+        rows.append(ids)
+    return rows
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,131 @@
+"""Live display regions that only repaint what changed.
+
+:class:`.LiveRegion` keeps the previously rendered frame (a list of lines) and
+emits only the cursor movements and text needed to turn it into the next
+frame, instead of clearing and repainting every line on each update.
+"""
+from pyansiescapes import commands
+import pyansiescapes._types as t
+
+
+class LiveRegion:
+    """A block of lines at the bottom of the output that is updated in place.
+
+    After each render the cursor rests at the start of the line below the
+    region, just like after printing the lines. Lines must not contain line
+    breaks and must fit into the terminal width.
+
+    Changed lines are rewritten from the first changed column if both the old
+    and the new line are printable ASCII text (no escape sequences), and
+    completely otherwise.
+
+    Args:
+        stream: Text file object :meth:`update` writes to. Optional if only
+            :meth:`render` is used.
+
+    Examples:
+        >>> region = LiveRegion()
+        >>> region.render(["cpu  10%", "mem  20%"])
+        'cpu  10%\\nmem  20%\\n'
+
+        >>> # Only the changed column range is repainted.
+        >>> region.render(["cpu  10%", "mem  35%"])
+        '\\x1b[1A\\x1b[6G35\\x1b[1B\\r'
+
+        >>> region.render(["cpu  10%", "mem  35%"])
+        ''
+    """
+
+    def __init__(self, stream: t.Any = None) -> None:
+        self.stream = stream
+        self.frame = None # type: t.Optional[t.List[str]]
+
+    def render(self, lines: t.Sequence[str]) -> str:
+        """Return the escape sequences and text updating the region to lines."""
+        lines = list(lines)
+        old = self.frame
+        self.frame = lines
+        if old is None:
+            return "".join(line + "\n" for line in lines)
+
+        output = [] # type: t.List[str]
+        row = len(old) # the cursor rests below the region
+        for index, (old_line, line) in enumerate(zip(old, lines)):
+            if line != old_line:
+                output.append(_move(row, index))
+                output.append(_rewrite_line(old_line, line))
+                row = index
+
+        if len(lines) > len(old):
+            # append the additional lines below the old region
+            if output:
+                output.append(_move(row, len(old)) + "\r")
+            output.extend(line + "\n" for line in lines[len(old):])
+            return "".join(output)
+
+        # clear lines left over from the old region
+        for index in range(len(lines), len(old)):
+            output.append(_move(row, index))
+            output.append(commands.clear_line())
+            row = index
+        if output:
+            output.append(_move(row, len(lines)) + "\r")
+        return "".join(output)
+
+    def update(self, lines: t.Sequence[str]) -> None:
+        """Render lines to the stream and flush it."""
+        self.stream.write(self.render(lines))
+        self.stream.flush()
+
+    def clear(self) -> str:
+        """Return the sequences erasing the region and forget the frame.
+
+        The cursor ends at the start of the first line of the former region.
+        """
+        old, self.frame = self.frame or [], None
+        if not old:
+            return ""
+        return (commands.cursor_up(len(old)) + "\r"
+                + commands.clear_screen_until_end())
+
+
+def _move(row: int, target: int) -> str:
+    """Return the sequence moving the cursor from row to target row."""
+    if target < row:
+        return commands.cursor_up(row - target)
+    if target > row:
+        return commands.cursor_down(target - row)
+    return ""
+
+
+def _is_plain(line: str) -> bool:
+    """Return True if every character of line takes exactly one column."""
+    return line.isascii() and line.isprintable()
+
+
+def _rewrite_line(old: str, new: str) -> str:
+    """Return the sequence rewriting the old line as new line."""
+    if not (_is_plain(old) and _is_plain(new)):
+        return "\r" + new + commands.clear_to_end_of_line()
+
+    start = 0
+    end = min(len(old), len(new))
+    while start < end and old[start] == new[start]:
+        start += 1
+    if len(old) == len(new):
+        # skip the common tail as well
+        while end > start and old[end - 1] == new[end - 1]:
+            end -= 1
+        changed = new[start:end]
+    else:
+        changed = new[start:]
+        if len(new) < len(old):
+            changed += commands.clear_to_end_of_line()
+
+    position = commands.cursor_to_column(start + 1) if start else "\r"
+    return position + changed
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,200 @@
+"""Colored log output for the :py:`logging` package.
+
+:class:`.ColorFormatter` colors selected fields of the log format (by default
+the level name, in a style depending on the level of the record). The styles
+are resolved once into a format string per level, so formatting a record
+costs no more than with a plain :py:`logging.Formatter`.
+
+Examples:
+    >>> import logging, sys
+    >>> handler = ColorStreamHandler(sys.stdout, use_color=True)
+    >>> handler.setFormatter(ColorFormatter("%(levelname)s %(message)s"))
+    >>> logger = logging.getLogger("example")
+    >>> logger.propagate = False
+    >>> logger.addHandler(handler)
+    >>> logger.warning("disk almost full")
+    \x1b[33mWARNING\x1b[0m disk almost full
+"""
+import logging
+import re
+from pyansiescapes import commands, terminal
+import pyansiescapes._types as t
+
+DEFAULT_LEVEL_STYLES = {
+    logging.DEBUG: {"color": "blue"},
+    logging.INFO: {"color": "green"},
+    logging.WARNING: {"color": "yellow"},
+    logging.ERROR: {"color": "red"},
+    logging.CRITICAL: {"bold": True, "color": "red"},
+} # type: t.Dict[int, t.Any]
+
+# style --> pattern of a field (group 1: the field name) in the format string
+_FIELD_PATTERNS = {
+    "%": r"%\(({})\)[#0+ -]*\d*(?:\.\d+)?[diouxXeEfFgGcrsa]",
+    "{": r"\{{({})(?:![rsa])?(?::[^{{}}]*)?\}}",
+    "$": r"\$(?:({0})\b|\{{({0})\}})",
+}
+
+
+class ColorFormatter(logging.Formatter):
+    """A :py:`logging.Formatter` coloring fields of the log format.
+
+    Args:
+        fmt: The format string, see :py:`logging.Formatter`.
+        datefmt: The date format string, see :py:`logging.Formatter`.
+        style: The format string style (:py:`"%"`, :py:`"{"` or :py:`"$"`).
+            Default: "%"
+        level_styles: Dict of level to style for the `level_fields`. Records
+            of other levels use the style of the next lower level. Styles are
+            anything accepted as style by :func:`.format_many`, e.g.
+            :py:`{"bold": True, "color": "red"}`.
+            Default: :data:`.DEFAULT_LEVEL_STYLES`
+        level_fields: Names of the record fields styled by level.
+            Default: ("levelname",)
+        field_styles: Dict of record field name to a style that does not
+            depend on the level, e.g. :py:`{"name": {"color": "grey50"}}`.
+        use_color: Whether to emit escape sequences at all. :py:`None` colors
+            unless :attr:`stream` (set by :class:`.ColorStreamHandler`) is
+            not a terminal or color is disabled (see
+            :func:`.terminal.color_depth`). Colors are reduced to the color
+            depth of :attr:`stream`.
+            Default: None
+    """
+
+    def __init__(self, fmt: t.Optional[str] = None, # pylint: disable=too-many-arguments
+                 datefmt: t.Optional[str] = None, style: str = "%",
+                 level_styles: t.Optional[t.Dict[int, t.Any]] = None,
+                 level_fields: t.Sequence[str] = ("levelname",),
+                 field_styles: t.Optional[t.Dict[str, t.Any]] = None,
+                 use_color: t.Optional[bool] = None) -> None:
+        super().__init__(fmt, datefmt, style)
+        self._stream = None # type: t.Any
+        self._use_color = use_color
+        self._colored = None # type: t.Optional[bool]
+        self._depth = None # type: t.Optional[int]
+        self._format_style = style
+        self._level_styles = dict(
+            DEFAULT_LEVEL_STYLES if level_styles is None else level_styles)
+        self._level_fields = tuple(level_fields)
+        self._field_styles = dict(field_styles or {})
+        self._formatters = {} # type: t.Dict[int, logging.Formatter]
+
+    @property
+    def stream(self) -> t.Any:
+        """The stream the log output goes to. See :attr:`use_color`."""
+        return self._stream
+
+    @stream.setter
+    def stream(self, stream: t.Any) -> None:
+        self._stream = stream
+        self._colored = None
+
+    @property
+    def use_color(self) -> t.Optional[bool]:
+        """Whether escape sequences are emitted at all.
+
+        :py:`None` colors unless :attr:`stream` is set and is not a terminal.
+        """
+        return self._use_color
+
+    @use_color.setter
+    def use_color(self, use_color: t.Optional[bool]) -> None:
+        self._use_color = use_color
+        self._colored = None
+
+    @property
+    def level_styles(self) -> t.Dict[int, t.Any]:
+        """A copy of the level to style dict. See :meth:`set_level_style`."""
+        return dict(self._level_styles)
+
+    def set_level_style(self, level: int, style: t.Any) -> None:
+        """Set the style for level, :py:`None` removes it.
+
+        The format strings are compiled anew on the next record.
+        """
+        if style is None:
+            self._level_styles.pop(level, None)
+        else:
+            self._level_styles[level] = style
+        self._formatters.clear()
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        if self._colored is None:
+            depth = _color_depth(self.use_color, self.stream)
+            if depth != self._depth:
+                self._formatters.clear()
+            self._depth = depth
+            self._colored = depth != 0
+        if not self._colored:
+            return super().formatMessage(record)
+        try:
+            formatter = self._formatters[record.levelno]
+        except KeyError:
+            formatter = self._formatters[record.levelno] = \
+                self._compile(record.levelno)
+        return formatter.formatMessage(record)
+
+    def _compile(self, level: int) -> logging.Formatter:
+        """Return a formatter for records of level with the styles applied."""
+        styles = dict(self._field_styles)
+        levels = [key for key in self._level_styles if key <= level]
+        if levels:
+            level_style = self._level_styles[max(levels)]
+            styles.update((field, level_style) for field in self._level_fields)
+
+        fmt = self._fmt or ""
+        for field, spec in styles.items():
+            style = commands.compile_style(spec, self._depth)
+            pattern = _FIELD_PATTERNS[self._format_style].format(re.escape(field))
+            fmt = re.sub(pattern, lambda match, style=style: # type: ignore
+                         style.prefix + match.group() + style.suffix, fmt)
+        return logging.Formatter(fmt, self.datefmt, self._format_style)
+
+
+class ColorStreamHandler(logging.StreamHandler):
+    """A :py:`logging.StreamHandler` using a :class:`.ColorFormatter`.
+
+    The formatter learns the stream of the handler, so colors are only
+    emitted if the stream is a terminal (unless `use_color` is given).
+
+    Args:
+        stream: The stream, see :py:`logging.StreamHandler`.
+            Default: sys.stderr
+        use_color: Passed on to the default :class:`.ColorFormatter`.
+            Default: None
+    """
+
+    def __init__(self, stream: t.Any = None,
+                 use_color: t.Optional[bool] = None) -> None:
+        super().__init__(stream)
+        self._use_color = use_color
+        self.setFormatter(ColorFormatter(use_color=use_color))
+
+    def setStream(self, stream: t.Any) -> t.Any:
+        old = super().setStream(stream)
+        self.setFormatter(self.formatter)
+        return old
+
+    def setFormatter(self, fmt: t.Optional[logging.Formatter]) -> None:
+        if isinstance(fmt, ColorFormatter):
+            fmt.stream = self.stream
+            if fmt.use_color is None:
+                fmt.use_color = self._use_color
+        super().setFormatter(fmt)
+
+
+def _color_depth(use_color: t.Optional[bool],
+                 stream: t.Any) -> t.Optional[int]:
+    """Return the color depth of log output to stream (:py:`None` if
+    unrestricted)."""
+    if use_color is False:
+        return 0
+    depth = None if stream is None else terminal.color_depth(stream)
+    if use_color and depth == 0:
+        return None # colors forced on a stream that is no terminal
+    return depth
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,182 @@
+"""Inline style markup compiled into reusable templates.
+
+A template is text with style tags in square brackets and replacement fields
+in curly braces, e.g. :py:`"[bold red]Error[/] {msg}"`. A tag holds
+space-separated style words:
+
+    - a :class:`.TextAttributes` name (e.g. :py:`bold`, :py:`underline`)
+    - a color accepted by :func:`.color`: a :class:`.Colors` or
+      :class:`.Colors256` name or a hexadecimal value (e.g. :py:`#ff8700`),
+      or an rgb-/hsl-value written as :py:`rgb(255,135,0)`/:py:`hsl(32,100,50)`
+    - :py:`on` followed by a color sets the background color
+
+:py:`[/]` ends the most recent tag, :py:`[/<tag>]` the most recent tag with
+the same words. Styles of nested tags are combined. Tags still open at the
+end of the template are ended automatically. Write :py:`[[` for a literal
+:py:`[` and, as for :py:`str.format`, :py:`{{`/:py:`}}` for literal braces.
+
+:func:`.compile` turns a template into a :class:`.Template` once: the tags
+are replaced by the escape sequences changing from one style to the next,
+which leaves an ordinary format string. Rendering only fills in the
+replacement fields; values are inserted verbatim and never parsed as markup.
+
+Examples:
+    >>> render("[bold red]Error[/] {msg}", msg="disk full")
+    \'\\x1b[1;31mError\\x1b[0m disk full\'
+
+    >>> render("[white on blue] {0} [underline]{1}", "INFO", "started")
+    \'\\x1b[37;44m INFO \\x1b[4mstarted\\x1b[0m\'
+"""
+import re
+from functools import lru_cache, reduce
+from pyansiescapes import commands, sgr
+from pyansiescapes.enums import TextAttributes
+import pyansiescapes._types as t
+
+# escaped braces, replacement fields, escaped brackets and tags
+_TOKEN = re.compile(r"\{\{|\}\}|\{[^{}]*\}|\[\[|\[(/?)([^\[\]]*)\]")
+_COLOR_VALUE = re.compile(r"(rgb|hsl)\((\d+),(\d+),(\d+)\)")
+_DEFAULT_CACHE_SIZE = 256
+
+
+class Template:
+    """A compiled markup template. See :mod:`.markup`.
+
+    Attributes:
+        template: The markup template.
+        format_string: The template with tags replaced by escape sequences.
+    """
+    __slots__ = ("template", "format_string")
+
+    def __init__(self, template: str) -> None:
+        self.template = template
+        self.format_string = _compile_format_string(template)
+
+    def render(self, *args: t.Any, **kwargs: t.Any) -> str:
+        """Return the template with the replacement fields filled in.
+
+        Arguments are used just as by :py:`str.format`.
+        """
+        return self.format_string.format(*args, **kwargs)
+
+    __call__ = render
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(type(self).__name__, self.template)
+
+
+@lru_cache(maxsize=_DEFAULT_CACHE_SIZE)
+def compile(template: str) -> Template: # pylint: disable=redefined-builtin
+    """Return the (cached) compiled template.
+
+    Raises:
+        ValueError: If a tag contains an unknown style or if an end tag does
+            not match an open tag.
+
+    Examples:
+        >>> error = compile("[bold red]{level}[/] {msg}")
+        >>> error.render(level="ERROR", msg="[not markup]")
+        \'\\x1b[1;31mERROR\\x1b[0m [not markup]\'
+
+        >>> compile("[bold red]{level}[/] {msg}") is error
+        True
+    """
+    return Template(template)
+
+
+def render(template: str, *args: t.Any, **kwargs: t.Any) -> str:
+    """Return the markup template rendered with the given arguments.
+
+    Shortcut for :py:`compile(template).render(*args, **kwargs)`.
+    """
+    return compile(template).render(*args, **kwargs)
+
+
+def _compile_format_string(template: str) -> str:
+    """Return template as format string with tags replaced by SGR sequences.
+
+    Consecutive tags result in a single sequence.
+    """
+    parts = [] # type: t.List[str]
+    tags = [] # type: t.List[t.Tuple[str, str]]
+    state = emitted = sgr.EMPTY
+
+    def add(text: str) -> None:
+        nonlocal emitted
+        if text:
+            if state != emitted:
+                parts.append(sgr.sequence(sgr.transition(emitted, state)))
+                emitted = state
+            parts.append(text)
+
+    position = 0
+    for match in _TOKEN.finditer(template):
+        add(template[position:match.start()])
+        position = match.end()
+        token = match.group()
+        if token[0] != "[":
+            add(token)
+            continue
+        if token == "[[":
+            add("[")
+            continue
+
+        end, tag = match.group(1), " ".join(match.group(2).split())
+        if not end:
+            tags.append((tag, _tag_params(tag)))
+        elif not tags:
+            raise ValueError("End tag {!r} without open tag in template {!r}"
+                             .format(token, template))
+        elif not tag:
+            tags.pop()
+        else:
+            for index in range(len(tags) - 1, -1, -1):
+                if tags[index][0] == tag:
+                    del tags[index]
+                    break
+            else:
+                raise ValueError("End tag {!r} without open tag in template {!r}"
+                                 .format(token, template))
+        state = reduce(sgr.apply_params,
+                       (params for _, params in tags), sgr.EMPTY)
+
+    add(template[position:])
+    if emitted != sgr.EMPTY:
+        parts.append(commands.reset())
+    return "".join(parts)
+
+
+def _tag_params(tag: str) -> str:
+    """Return the SGR parameters for the style words of a tag."""
+    attributes = [] # type: t.List[str]
+    colors = {} # type: t.Dict[str, t.Any]
+    key = "color"
+    for word in tag.split():
+        if word == "on":
+            key = "background"
+        elif word in TextAttributes.__members__ and word != "reset": # pylint: disable=no-member
+            attributes.append(word)
+        else:
+            colors[key] = _color_argument(word)
+            key = "color"
+
+    try:
+        codes = commands.Style(*attributes, **colors).codes
+    except (KeyError, TypeError, ValueError) as error:
+        raise ValueError("Unknown style in tag [{}]: {}".format(tag, error)) from None
+    if not codes or key == "background":
+        raise ValueError("Unknown style in tag [{}]".format(tag))
+    return sgr.SEPARATOR.join(codes)
+
+
+def _color_argument(word: str) -> t.Any:
+    """Return the :func:`.color` argument for a color word of a tag."""
+    value = _COLOR_VALUE.fullmatch(word)
+    if value is None:
+        return word
+    return {value.group(1): tuple(int(number) for number in value.group(2, 3, 4))}
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,309 @@
+"""Precomputed lookup tables for the 256 xterm colors.
+
+All tables are built once at import and make lookups in both directions
+constant-time, instead of scanning the ~1000 members (names and ``hex_*``,
+``rgb_*``, ``hsl_*`` aliases) of :class:`.Colors256`.
+
+Tables indexed by color id (:py:`range(256)`):
+    - **NAMES**: the color name (e.g. :py:`"blue"`)
+    - **HEX**: the hexadecimal color value (e.g. :py:`"#0000ff"`)
+    - **RGB**: the rgb-value packed into one int (e.g. :py:`0x0000ff`)
+    - **HSL**: the hsl-value as int tuple (e.g. :py:`(240, 100, 50)`)
+    - **LAB**: the CIELAB value as float tuple (see
+      :func:`.conversions.rgb_to_lab`)
+    - **ID_16**, **ID_8**: the id of the closest of the 16 system colors
+      (and its non-bright variant), used to display colors on terminals with
+      fewer colors (see :mod:`.terminal`). The system colors keep their id;
+      all others are matched by CIE76 color difference.
+
+Dicts mapping a color value to its color id:
+    - **ID_BY_NAME** (all :class:`.Colors256` member names, including the
+      ``hex_*``, ``rgb_*`` and ``hsl_*`` aliases), **ID_BY_HEX**,
+      **ID_BY_RGB** (packed rgb-value), **ID_BY_HSL**
+
+Tables of the nearest color search (see :func:`.nearest_color_id`):
+    - **CUBE_INDEX**, **CUBE_ERROR**: per channel value (:py:`range(256)`)
+      the index of the closest of the **CUBE_LEVELS** and its squared error
+    - **GREY_INDEX**: per channel sum (:py:`range(766)`) the index of the
+      closest of the **GREY_LEVELS**
+
+**NAMES** and **ID_BY_NAME** are read from :class:`.Colors256` and therefore
+only built on first access, just as **ID_16** and **ID_8**.
+
+If several ids share the same color value the lowest id wins, just as for the
+aliases in :class:`.Colors256`.
+
+Arbitrary 24-bit colors are mapped to the closest palette entry by
+:func:`.nearest_color_id` (distance in rgb space) or
+:func:`.nearest_color_id_perceptual` (perceptual color difference).
+"""
+from pyansiescapes import conversions, enums
+import pyansiescapes._types as t
+
+# The 16 system colors, followed by the 6x6x6 color cube and the grey ramp.
+SYSTEM_COLORS = (
+    (0, 0, 0), (128, 0, 0), (0, 128, 0), (128, 128, 0),
+    (0, 0, 128), (128, 0, 128), (0, 128, 128), (192, 192, 192),
+    (128, 128, 128), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+    (0, 0, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+)
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+GREY_LEVELS = tuple(8 + 10 * i for i in range(24))
+
+
+def pack_rgb(red: int, green: int, blue: int) -> int:
+    """Return the rgb-value packed into a single int.
+
+    Examples:
+        >>> hex(pack_rgb(255, 135, 0))
+        '0xff8700'
+    """
+    return (red << 16) | (green << 8) | blue
+
+
+def unpack_rgb(packed: int) -> t.ColorValueTuple:
+    """Return the packed rgb-value as (red, green, blue) tuple.
+
+    Examples:
+        >>> unpack_rgb(0xff8700)
+        (255, 135, 0)
+    """
+    return (packed >> 16) & 0xff, (packed >> 8) & 0xff, packed & 0xff
+
+
+def _rgb_to_hsl(red: int, green: int, blue: int) -> t.ColorValueTuple:
+    """Return the hsl-value in the (truncated) format of the Colors256 keys."""
+    hue, saturation, lightness = conversions.rgb_to_hsl(red, green, blue)
+    return int(hue), int(saturation), int(lightness)
+
+
+def _make_rgb_table() -> t.Tuple[t.ColorValueTuple, ...]:
+    """Return the rgb-values of all 256 colors as tuples."""
+    cube = tuple((red, green, blue)
+                 for red in CUBE_LEVELS
+                 for green in CUBE_LEVELS
+                 for blue in CUBE_LEVELS)
+    greys = tuple((level, level, level) for level in GREY_LEVELS)
+    return SYSTEM_COLORS + cube + greys
+
+
+def _make_reverse_lookup(table: t.Iterable[t.Any]) -> t.Dict[t.Any, int]:
+    """Return dict mapping each value in table to its lowest index."""
+    lookup = {}
+    for color_id, value in enumerate(table):
+        lookup.setdefault(value, color_id)
+    return lookup
+
+
+_RGB_TUPLES = _make_rgb_table()
+
+HEX = tuple("#{:02x}{:02x}{:02x}".format(*rgb) for rgb in _RGB_TUPLES)
+RGB = tuple(pack_rgb(*rgb) for rgb in _RGB_TUPLES)
+HSL = tuple(_rgb_to_hsl(*rgb) for rgb in _RGB_TUPLES)
+LAB = tuple(conversions.rgb_to_lab(*rgb) for rgb in _RGB_TUPLES)
+
+ID_BY_HEX = _make_reverse_lookup(HEX)
+ID_BY_RGB = _make_reverse_lookup(RGB)
+ID_BY_HSL = _make_reverse_lookup(HSL)
+
+
+# Nearest color search:
+def _nearest_level_index(value: int, levels: t.Tuple[int, ...]) -> int:
+    """Return the index of the level closest to value (lower level on ties)."""
+    return min(range(len(levels)), key=lambda i: (abs(levels[i] - value), i))
+
+
+# per channel value: index of the closest cube level and its squared error
+CUBE_INDEX = tuple(_nearest_level_index(value, CUBE_LEVELS)
+                   for value in range(256))
+CUBE_ERROR = tuple((value - CUBE_LEVELS[index]) ** 2
+                   for value, index in enumerate(CUBE_INDEX))
+# per channel sum (r + g + b): the closest grey level is the one closest to
+# the mean of the channels, i.e. the i minimizing |30 * i + 24 - total|.
+GREY_INDEX = tuple(min(len(GREY_LEVELS) - 1, max(0, (total - 10) // 30))
+                   for total in range(3 * 255 + 1))
+
+
+def nearest_color_id(red: int, green: int, blue: int) -> int:
+    """Return the id of the palette color closest to the rgb-value.
+
+    Exact matches return the lowest id with this color value. All other colors
+    are matched (by euclidean distance in rgb space) against the 6x6x6 color
+    cube and the 24-step grey ramp. The 16 system colors are only returned on
+    exact matches since terminals commonly customize them.
+
+    Args:
+        red, green, blue: The channel values. Any int in :py:`range(256)`.
+
+    Raises:
+        ValueError: {value} is not a valid rgb-value!
+            If a channel value is out of range.
+
+    Examples:
+        >>> # Exact match
+        >>> nearest_color_id(255, 135, 0)
+        208
+
+        >>> # Closest color in the cube
+        >>> nearest_color_id(250, 130, 10)
+        208
+
+        >>> # Closest color in the grey ramp
+        >>> nearest_color_id(100, 102, 101)
+        241
+    """
+    if (red | green | blue) >> 8:
+        raise ValueError(
+            "{} is not a valid rgb-value!".format((red, green, blue)))
+    color_id = ID_BY_RGB.get((red << 16) | (green << 8) | blue)
+    if color_id is not None:
+        return color_id
+
+    cube_error = CUBE_ERROR[red] + CUBE_ERROR[green] + CUBE_ERROR[blue]
+    grey_index = GREY_INDEX[red + green + blue]
+    grey = GREY_LEVELS[grey_index]
+    grey_error = (red - grey) ** 2 + (green - grey) ** 2 + (blue - grey) ** 2
+    if grey_error < cube_error:
+        return 232 + grey_index
+    return 16 + 36 * CUBE_INDEX[red] + 6 * CUBE_INDEX[green] + CUBE_INDEX[blue]
+
+
+# Perceptual nearest color search:
+METRICS = ("rgb", "cie76", "ciede2000")
+_DELTA_E = {
+    "cie76": conversions.delta_e_cie76,
+    "ciede2000": conversions.delta_e_ciede2000,
+}
+# the candidates of the nearest color search: the color cube and grey ramp
+_LAB_CANDIDATES = tuple(enumerate(LAB))[16:]
+_MAX_CACHED_COLORS = 4096
+# per metric: packed rgb-value --> color id
+_perceptual_cache = {metric: {} for metric in _DELTA_E} # type: t.Dict[str, t.Dict[int, int]]
+
+
+def nearest_color_id_perceptual(red: int, green: int, blue: int,
+                                metric: str = "ciede2000") -> int:
+    """Return the id of the palette color that looks closest to the rgb-value.
+
+    Works just as :func:`.nearest_color_id` but compares the colors by their
+    perceptual difference (delta E of the :attr:`LAB` values) instead of
+    their distance in rgb space, which matches dark and greyish colors
+    noticeably better. Results are cached per rgb-value, so repeated lookups
+    cost one dict lookup.
+
+    Args:
+        red, green, blue: The channel values. Any int in :py:`range(256)`.
+        metric: :py:`"ciede2000"` (see :func:`.conversions.delta_e_ciede2000`)
+            or the faster but less accurate :py:`"cie76"` (see
+            :func:`.conversions.delta_e_cie76`). :py:`"rgb"` falls back to
+            :func:`.nearest_color_id`.
+            Default: "ciede2000"
+
+    Raises:
+        ValueError: {value} is not a valid rgb-value!
+            If a channel value is out of range.
+        ValueError: {metric} is not a supported metric!
+            If metric is not in :attr:`METRICS`.
+
+    Examples:
+        >>> # a dark blue is a dark blue, not a grey
+        >>> nearest_color_id(30, 30, 60), nearest_color_id_perceptual(30, 30, 60)
+        (235, 17)
+    """
+    try:
+        cache = _perceptual_cache[metric]
+    except KeyError:
+        if metric == "rgb":
+            return nearest_color_id(red, green, blue)
+        raise ValueError("{} is not a supported metric! Use one of {}."
+                         .format(metric, METRICS))
+    if (red | green | blue) >> 8:
+        raise ValueError(
+            "{} is not a valid rgb-value!".format((red, green, blue)))
+    packed = (red << 16) | (green << 8) | blue
+    try:
+        return cache[packed]
+    except KeyError:
+        pass
+
+    color_id = ID_BY_RGB.get(packed)
+    if color_id is None:
+        lab = conversions.rgb_to_lab(red, green, blue)
+        delta_e = _DELTA_E[metric]
+        color_id = min(_LAB_CANDIDATES,
+                       key=lambda candidate: delta_e(lab, candidate[1]))[0]
+    if len(cache) >= _MAX_CACHED_COLORS:
+        cache.clear()
+    cache[packed] = color_id
+    return color_id
+
+
+def nearest_color_id_from_hex(hex: str) -> int: # pylint: disable=redefined-builtin
+    """Return the id of the palette color closest to the hexadecimal value.
+
+    Args:
+        hex: A hexadecimal color value of format :py:`"#rrggbb"`.
+
+    Examples:
+        >>> nearest_color_id_from_hex("#fa820a")
+        208
+    """
+    color_id = ID_BY_HEX.get(hex)
+    if color_id is not None:
+        return color_id
+    return nearest_color_id(*conversions.hex_to_rgb(hex))
+
+
+def nearest_color_id_from_hsl(hue: float, saturation: float,
+                              lightness: float) -> int:
+    """Return the id of the palette color closest to the hsl-value.
+
+    Args:
+        hue: The hue in degrees.
+        saturation: The saturation in percent.
+        lightness: The lightness in percent.
+
+    Examples:
+        >>> nearest_color_id_from_hsl(240, 100, 50)
+        12
+
+        >>> nearest_color_id_from_hsl(0, 0, 40)
+        241
+    """
+    color_id = ID_BY_HSL.get((hue, saturation, lightness))
+    if color_id is not None:
+        return color_id
+    return nearest_color_id(*conversions.hsl_to_rgb(hue, saturation, lightness))
+
+
+def _make_system_color_table() -> t.Tuple[int, ...]:
+    """Return the id of the closest system color for every color id."""
+    candidates = tuple(enumerate(LAB[:16]))
+    delta_e = conversions.delta_e_cie76
+    return tuple(range(16)) + tuple(
+        min(candidates, key=lambda candidate: delta_e(lab, candidate[1]))[0]
+        for lab in LAB[16:])
+
+
+def __getattr__(name: str) -> t.Any:
+    """Build the name and system color tables on first access."""
+    if name in ("NAMES", "ID_BY_NAME"):
+        names = tuple(enums.Colors256(str(color_id)).name
+                      for color_id in range(256))
+        # all member names, including the hex_*, rgb_* and hsl_* aliases,
+        # which the enum already resolves to the lowest id
+        id_by_name = {member_name: int(member.value) for member_name, member
+                      in enums.Colors256.__members__.items()}
+        globals().update(NAMES=names, ID_BY_NAME=id_by_name)
+        return globals()[name]
+    if name in ("ID_16", "ID_8"):
+        ids = _make_system_color_table()
+        globals().update(ID_16=ids, ID_8=tuple(color_id % 8 for color_id in ids))
+        return globals()[name]
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name))
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
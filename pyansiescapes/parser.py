@@ -0,0 +1,205 @@
+"""Incremental parsing of formatted text into styled spans.
+
+:class:`.AnsiParser` is the inverse of :func:`.format`: it is fed chunks of
+text containing SGR sequences and returns :class:`.Span` objects, i.e. the
+text between the sequences together with the style it is displayed in.
+Chunks can be split anywhere, also in the middle of an escape sequence, so
+arbitrarily large input can be parsed without reading it completely.
+
+Examples:
+    >>> from pyansiescapes import commands
+    >>> parser = AnsiParser()
+    >>> line = commands.format("Error", "bold", color="red") + " ok\\n"
+    >>> spans = parser.feed(line[:3]) + parser.feed(line[3:]) + parser.close()
+    >>> spans[0].text, sorted(spans[0].style.attributes), spans[0].style.foreground
+    ('Error', [<TextAttributes.bold: '1'>], <Colors.red: '1'>)
+    >>> spans[1]
+    Span(text=' ok\\n', style=SpanStyle(attributes=frozenset(), foreground=None, background=None))
+"""
+import re
+from functools import lru_cache
+from pyansiescapes import sgr, text
+from pyansiescapes.enums import TextAttributes, Colors
+import pyansiescapes._types as t
+
+# SGR sequences (group 1: parameters) and all other escape sequences
+_SEQUENCE = re.compile(r"\x1b\[([0-9;]*)m|" + text.ESCAPE_SEQUENCE.pattern)
+# escape sequence at the end of the text that is not complete yet
+_INCOMPLETE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b]*\x1b?)?\Z")
+# longest incomplete escape sequence kept back for the next chunk
+MAX_PENDING = 4096
+
+_ATTRIBUTES = {member.value: member for member in TextAttributes}
+_COLORS = {member.value: member for member in Colors
+           if not member.name.startswith("_")}
+_TRUECOLOR, _256_BIT = "2", "5"
+
+
+class SpanStyle(t.NamedTuple):
+    """The style of a :class:`.Span`.
+
+    Colors are either a :class:`.Colors` member (8-bit colors), a
+    :class:`.Colors256` id (256-bit colors, the bright colors 90-97 map to ids
+    8-15) or a (r, g, b) tuple (truecolor).
+
+    Attributes:
+        attributes: The active :class:`.TextAttributes`. Attributes without a
+            member (e.g. italic) are left out.
+        foreground: The foreground color or :py:`None` (default).
+        background: The background color or :py:`None` (default).
+    """
+    attributes: t.FrozenSet[TextAttributes] = frozenset()
+    foreground: t.Optional[t.ParsedColor] = None
+    background: t.Optional[t.ParsedColor] = None
+
+
+class Span(t.NamedTuple):
+    """Text displayed in one style."""
+    text: str
+    style: SpanStyle
+
+
+PLAIN = SpanStyle()
+
+
+class AnsiParser:
+    """Push parser splitting formatted text into :class:`.Span` objects.
+
+    Text between two style changes is returned as one span, also if other
+    escape sequences or SGR sequences without effect are in between. Escape
+    sequences other than SGR sequences are dropped. The style carries over
+    from one chunk to the next.
+
+    Attributes:
+        state: The current :class:`.SGRState`.
+    """
+
+    def __init__(self) -> None:
+        self.state = sgr.EMPTY
+        self._pending = ""
+
+    def feed(self, chunk: str) -> t.List[Span]:
+        """Parse the next chunk of text.
+
+        Returns:
+            The spans of the chunk. An escape sequence at the end of the chunk
+            that is not complete yet is kept back until the next call.
+        """
+        chunk, self._pending = split_incomplete(self._pending + chunk)
+
+        # text, SGR parameters (None for other sequences), text, ...
+        parts = _SEQUENCE.split(chunk)
+        spans = [] # type: t.List[Span]
+        pieces = [parts[0]] if parts[0] else []
+        add_piece = pieces.append
+        apply_params = _apply_params
+        state = self.state
+        for index in range(1, len(parts), 2):
+            params = parts[index]
+            if params is not None:
+                new_state = apply_params(state, params)
+                if new_state is not state and new_state != state:
+                    if pieces:
+                        spans.append(Span("".join(pieces), span_style(state)))
+                        pieces.clear()
+                    state = new_state
+            if parts[index + 1]:
+                add_piece(parts[index + 1])
+        if pieces:
+            spans.append(Span("".join(pieces), span_style(state)))
+
+        self.state = state
+        return spans
+
+    def close(self) -> t.List[Span]:
+        """Return the text kept back from the last chunk and reset the parser.
+
+        An incomplete escape sequence at the end of the input is returned as
+        text.
+        """
+        pending, self._pending = self._pending, ""
+        state, self.state = self.state, sgr.EMPTY
+        return [Span(pending, span_style(state))] if pending else []
+
+
+def parse(chunks: t.Iterable[str]) -> t.Iterator[Span]:
+    """Yield the spans of text read chunk by chunk (e.g. from a file object).
+
+    Examples:
+        >>> list(parse(["\\x1b[38;5;2", "08mhot\\x1b[0m"]))
+        [Span(text='hot', style=SpanStyle(attributes=frozenset(), foreground=208, background=None))]
+    """
+    parser = AnsiParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def split_incomplete(chunk: str) -> t.Tuple[str, str]:
+    """Split chunk into the complete text and an escape sequence at its end
+    that is not complete yet.
+
+    Push parsers keep the incomplete sequence back and prepend it to the next
+    chunk. Only the last :data:`.MAX_PENDING` characters are searched, so
+    longer unterminated sequences count as text and the kept back text stays
+    bounded.
+
+    Examples:
+        >>> split_incomplete("hot\\x1b[38;5")
+        ('hot', '\\x1b[38;5')
+        >>> split_incomplete("hot\\x1b[0m")
+        ('hot\\x1b[0m', '')
+    """
+    if "\x1b" in chunk[-MAX_PENDING:]:
+        incomplete = _INCOMPLETE.search(chunk, max(0, len(chunk) - MAX_PENDING))
+        if incomplete is not None:
+            return chunk[:incomplete.start()], incomplete.group()
+    return chunk, ""
+
+
+_apply_params = lru_cache(maxsize=1024)(sgr.apply_params)
+
+
+@lru_cache(maxsize=1024)
+def span_style(state: sgr.SGRState) -> SpanStyle:
+    """Return the :class:`.SpanStyle` of an :class:`.SGRState`.
+
+    Examples:
+        >>> span_style(sgr.SGRState(frozenset({"4"}), "91", "48;2;0;95;255"))
+        SpanStyle(attributes=frozenset({<TextAttributes.underscore: '4'>}), foreground=9, background=(0, 95, 255))
+    """
+    if state == sgr.EMPTY:
+        return PLAIN
+    attributes = frozenset(_ATTRIBUTES[code] for code in state.attributes
+                           if code in _ATTRIBUTES)
+    return SpanStyle(attributes, _parse_color(state.foreground),
+                     _parse_color(state.background))
+
+
+def _parse_color(params: t.Optional[str]) -> t.Optional[t.ParsedColor]:
+    """Return the color set by the SGR color parameters (see :mod:`.sgr`)."""
+    if params is None:
+        return None
+    if sgr.SEPARATOR not in params:
+        if params[0] in ("9", "1"):
+            # bright colors 90-97/100-107 are the 256-bit colors 8-15
+            return int(params[-1]) + 8
+        return _COLORS.get(params[1:])
+
+    values = params.split(sgr.SEPARATOR)[1:]
+    try:
+        numbers = [int(value) for value in values[1:]]
+    except ValueError:
+        return None
+    if not all(0 <= number <= 255 for number in numbers):
+        return None
+    if values[0] == _256_BIT and len(numbers) == 1:
+        return numbers[0]
+    if values[0] == _TRUECOLOR and len(numbers) == 3:
+        return (numbers[0], numbers[1], numbers[2])
+    return None
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
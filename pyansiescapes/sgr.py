@@ -0,0 +1,164 @@
+"""Select Graphic Rendition (SGR) state tracking.
+
+An SGR sequence (:py:`"\\u001b[...m"`) carries a list of parameters separated
+by :attr:`.ANSICommands.separator`. :class:`.SGRState` is the rendition that
+results from applying such parameters: a set of text attribute codes and the
+foreground/background color parameters.
+
+Colors are kept in the parameter format they were written in:
+
+    - 8-bit: :py:`"31"` (foreground) / :py:`"41"` (background)
+    - bright 8-bit: :py:`"91"` / :py:`"101"`
+    - 256-bit: :py:`"38;5;12"` / :py:`"48;5;12"`
+    - truecolor: :py:`"38;2;255;0;0"` / :py:`"48;2;255;0;0"`
+"""
+from pyansiescapes.enums import ANSICommands, TextAttributes
+import pyansiescapes._types as t
+
+START = ANSICommands.start.value
+STOP = ANSICommands.stop.value
+SEPARATOR = ANSICommands.separator.value
+RESET = TextAttributes.reset.value
+DEFAULT_FOREGROUND = "39"
+DEFAULT_BACKGROUND = "49"
+
+_ATTRIBUTE_CODES = frozenset(("1", "2", "3", "4", "5", "6", "7", "8", "9"))
+# code --> attribute codes it turns off
+_ATTRIBUTE_OFF = {"21": ("1",), "22": ("1", "2"), "23": ("3",), "24": ("4",),
+                  "25": ("5", "6"), "27": ("7",), "28": ("8",), "29": ("9",)}
+_FOREGROUND_CODES = frozenset([str(code) for code in range(30, 38)]
+                              + [str(code) for code in range(90, 98)])
+_BACKGROUND_CODES = frozenset([str(code) for code in range(40, 48)]
+                              + [str(code) for code in range(100, 108)])
+
+
+class SGRState(t.NamedTuple):
+    """The graphic rendition after applying SGR parameters.
+
+    Attributes:
+        attributes: The active text attribute codes (e.g. :py:`{"1", "4"}`).
+        foreground: The foreground color parameters or :py:`None` (default).
+        background: The background color parameters or :py:`None` (default).
+    """
+    attributes: t.FrozenSet[str] = frozenset()
+    foreground: t.Optional[str] = None
+    background: t.Optional[str] = None
+
+    def apply(self, params: str) -> "SGRState":
+        """Return the state after applying the SGR parameters.
+
+        Unknown parameters are ignored. An empty parameter string resets,
+        just like :py:`"0"`.
+
+        Examples:
+            >>> state = SGRState().apply("1;38;5;12")
+            >>> state
+            SGRState(attributes=frozenset({'1'}), foreground='38;5;12', background=None)
+
+            >>> state.apply("22;44")
+            SGRState(attributes=frozenset(), foreground='38;5;12', background='44')
+        """
+        return apply_params(self, params)
+
+    def params(self) -> str:
+        """Return the SGR parameters that set this state from a reset state.
+
+        Examples:
+            >>> SGRState(frozenset({"4", "1"}), "31", "48;5;12").params()
+            '1;4;31;48;5;12'
+        """
+        params = sorted(self.attributes, key=int)
+        if self.foreground is not None:
+            params.append(self.foreground)
+        if self.background is not None:
+            params.append(self.background)
+        return SEPARATOR.join(params)
+
+
+EMPTY = SGRState()
+
+
+def apply_params(state: SGRState, params: str) -> SGRState:
+    """Return state after applying the SGR parameters. See :meth:`.SGRState.apply`."""
+    attributes, foreground, background = state
+    codes = params.split(SEPARATOR)
+    index, count = 0, len(codes)
+    while index < count:
+        code = codes[index].lstrip("0") or RESET
+        index += 1
+        if code == RESET:
+            attributes, foreground, background = frozenset(), None, None
+        elif code in _ATTRIBUTE_CODES:
+            attributes = attributes | {code}
+        elif code in _FOREGROUND_CODES:
+            foreground = code
+        elif code in _BACKGROUND_CODES:
+            background = code
+        elif code == "38" or code == "48":
+            # extended color: 5;<id> or 2;<r>;<g>;<b>
+            length = 2 if codes[index:index + 1] == ["5"] else 4
+            color = SEPARATOR.join([code] + codes[index:index + length])
+            index += length
+            if code == "38":
+                foreground = color
+            else:
+                background = color
+        elif code == DEFAULT_FOREGROUND:
+            foreground = None
+        elif code == DEFAULT_BACKGROUND:
+            background = None
+        elif code in _ATTRIBUTE_OFF:
+            attributes = attributes - frozenset(_ATTRIBUTE_OFF[code])
+
+    return SGRState(attributes, foreground, background)
+
+
+def transition(old: SGRState, new: SGRState) -> str:
+    """Return the SGR parameters changing the old into the new state.
+
+    Only changed attributes and colors are emitted. If an attribute has to be
+    turned off, or if it is shorter, the parameters start with a reset and set
+    the new state from scratch instead.
+
+    Returns:
+        The SGR parameters or an empty string if the states are equal.
+
+    Examples:
+        >>> bold_red = SGRState(frozenset({"1"}), "31")
+        >>> transition(bold_red, bold_red._replace(background="44"))
+        '44'
+
+        >>> transition(bold_red, SGRState(frozenset(), "31"))
+        '0;31'
+
+        >>> transition(bold_red, EMPTY)
+        '0'
+    """
+    if old == new:
+        return ""
+    from_reset = SEPARATOR.join(filter(None, (RESET, new.params())))
+    if not old.attributes <= new.attributes:
+        return from_reset
+
+    params = sorted(new.attributes - old.attributes, key=int)
+    if new.foreground != old.foreground:
+        params.append(new.foreground or DEFAULT_FOREGROUND)
+    if new.background != old.background:
+        params.append(new.background or DEFAULT_BACKGROUND)
+    delta = SEPARATOR.join(params)
+    return delta if len(delta) <= len(from_reset) else from_reset
+
+
+def sequence(params: str) -> str:
+    """Return the SGR escape sequence for params.
+
+    Examples:
+        >>> sequence("1;31")
+        '\\x1b[1;31m'
+    """
+    return START + params + STOP
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
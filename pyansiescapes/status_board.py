@@ -0,0 +1,125 @@
+"""A multi-line status display updated by worker threads.
+
+:class:`.StatusBoard` gives every worker a line (slot) of a
+:class:`.LiveRegion`. Workers only store their text in the slot; a single
+render thread repaints the changed lines at a capped frame rate, so the
+output of different threads never interleaves.
+
+Examples:
+    >>> import io
+    >>> out = io.StringIO()
+    >>> with StatusBoard(out, slots=2) as board:
+    ...     board[0] = "worker 0: done"
+    ...     board[1] = "worker 1: done"
+    >>> out.getvalue()
+    'worker 0: done\\nworker 1: done\\n'
+"""
+import collections
+import sys
+import threading
+from pyansiescapes.live import LiveRegion
+import pyansiescapes._types as t
+
+
+class StatusBoard:
+    """Status lines set from any thread and painted by one render thread.
+
+    Setting a slot (:py:`board[slot] = text`) is a single list assignment
+    and takes no lock. :meth:`print` queues text which the render thread
+    writes above the status lines. The render thread is started with
+    :meth:`start` (or by the context manager) and paints at most `fps`
+    frames per second and only if the lines changed.
+
+    Args:
+        stream: Text file object to paint to.
+            Default: sys.stdout
+        slots: Number of slots to start with, see :meth:`add_slot`.
+            Default: 0
+        fps: Maximum number of frames per second.
+            Default: 10
+    """
+
+    def __init__(self, stream: t.Any = None, slots: int = 0,
+                 fps: float = 10) -> None:
+        self.stream = sys.stdout if stream is None else stream
+        self.interval = 1 / fps
+        self._lines = [""] * slots
+        self._messages = collections.deque() # type: t.Deque[str]
+        self._lock = threading.Lock() # guards adding slots
+        self._region = LiveRegion()
+        self._stopped = threading.Event()
+        self._thread = None # type: t.Optional[threading.Thread]
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __getitem__(self, slot: int) -> str:
+        return self._lines[slot]
+
+    def __setitem__(self, slot: int, text: str) -> None:
+        self._lines[slot] = text
+
+    def add_slot(self, text: str = "") -> int:
+        """Add a line below the existing ones and return its slot."""
+        with self._lock:
+            self._lines.append(text)
+            return len(self._lines) - 1
+
+    def print(self, text: str) -> None:
+        """Write a line of text above the status lines."""
+        self._messages.append(text)
+
+    def start(self) -> None:
+        """Start the render thread."""
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="StatusBoard", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Paint the final frame and stop the render thread."""
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StatusBoard":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: t.Any) -> None:
+        self.stop()
+
+    def render(self) -> str:
+        """Return the output turning the painted frame into the current one.
+
+        Called by the render thread; only useful on its own if no render
+        thread runs.
+        """
+        lines = list(self._lines)
+        messages = self._messages
+        if not messages:
+            return self._region.render(lines)
+
+        output = [self._region.clear()]
+        while messages:
+            output.append(messages.popleft() + "\n")
+        output.append(self._region.render(lines))
+        return "".join(output)
+
+    def _run(self) -> None:
+        """Paint frames until stopped."""
+        while True:
+            stopped = self._stopped.wait(self.interval)
+            output = self.render()
+            if output:
+                self.stream.write(output)
+                self.stream.flush()
+            if stopped:
+                return
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
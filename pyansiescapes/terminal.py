@@ -0,0 +1,139 @@
+"""Detection of the colors a terminal (output stream) can display.
+
+The color depth is one of:
+    - **24**: truecolor (rgb-values)
+    - **256**: the 256 xterm colors
+    - **16**: the 8 colors plus their bright (bold) variants
+    - **8**: the 8 colors
+    - **0**: no escape sequences at all
+
+:func:`.color_depth` probes a stream once and caches the result, so compiled
+styles (see :class:`.Style`) can resolve their colors to the best supported
+depth up front.
+
+Examples:
+    >>> import io
+    >>> color_depth(io.StringIO()) # not a terminal
+    0
+    >>> detect_color_depth(None, {"TERM": "xterm-256color"}, isatty=True)
+    256
+"""
+import os
+import sys
+import weakref
+import pyansiescapes._types as t
+
+# FORCE_COLOR values turning color off or selecting a color depth
+_FORCE_COLOR_OFF = ("0", "false", "no", "off")
+_FORCE_COLOR_DEPTHS = {"1": 16, "2": 256, "3": 24}
+
+_cache = weakref.WeakKeyDictionary() # type: weakref.WeakKeyDictionary
+
+
+def color_depth(stream: t.Any = None) -> int:
+    """Return the color depth of stream, probed once per stream.
+
+    See :func:`.detect_color_depth` for the rules. Call :func:`.clear_cache`
+    after changing the environment variables to probe again.
+
+    Args:
+        stream: Any text file object.
+            Default: sys.stdout
+    """
+    if stream is None:
+        stream = sys.stdout
+    try:
+        return _cache[stream]
+    except KeyError:
+        depth = _cache[stream] = detect_color_depth(stream)
+    except TypeError:
+        # streams without weak reference support are probed every time
+        depth = detect_color_depth(stream)
+    return depth
+
+
+def clear_cache() -> None:
+    """Forget the probed color depths."""
+    _cache.clear()
+
+
+def detect_color_depth(stream: t.Any = None,
+                       environ: t.Optional[t.Mapping[str, str]] = None,
+                       isatty: t.Optional[bool] = None) -> int:
+    """Return the color depth of stream (uncached).
+
+    Rules, in this order:
+        - A non-empty ``NO_COLOR`` disables colors (depth 0).
+        - ``FORCE_COLOR`` set to 0/false/no/off disables colors, set to 1, 2
+          or 3 selects depth 16, 256 or 24. Any other value enables colors
+          even if stream is no terminal.
+        - Streams that are no terminal and ``TERM=dumb`` get depth 0.
+        - ``COLORTERM=truecolor`` or ``24bit`` and ``TERM=*-direct`` give
+          depth 24, ``TERM=*256color*`` gives depth 256, any other ``TERM``
+          depth 16. Without ``TERM`` the depth is 8 (16 on Windows, 24 in
+          the Windows Terminal).
+
+    Args:
+        stream: Any text file object.
+            Default: sys.stdout
+        environ: The environment variables.
+            Default: os.environ
+        isatty: Whether stream is a terminal. :py:`None` asks the stream.
+            Default: None
+
+    Examples:
+        >>> detect_color_depth(None, {"TERM": "xterm", "COLORTERM": "truecolor"},
+        ...                    isatty=True)
+        24
+        >>> detect_color_depth(None, {"TERM": "xterm", "NO_COLOR": "1"},
+        ...                    isatty=True)
+        0
+        >>> detect_color_depth(None, {"FORCE_COLOR": "2"}, isatty=False)
+        256
+    """
+    if environ is None:
+        environ = os.environ
+    if environ.get("NO_COLOR"):
+        return 0
+
+    forced = False
+    force_color = environ.get("FORCE_COLOR")
+    if force_color is not None:
+        force_color = force_color.strip().lower()
+        if force_color in _FORCE_COLOR_OFF:
+            return 0
+        if force_color in _FORCE_COLOR_DEPTHS:
+            return _FORCE_COLOR_DEPTHS[force_color]
+        forced = True
+
+    term = environ.get("TERM", "").lower()
+    if not forced:
+        if isatty is None:
+            isatty = _isatty(sys.stdout if stream is None else stream)
+        if not isatty or term == "dumb":
+            return 0
+
+    if (environ.get("COLORTERM", "").lower() in ("truecolor", "24bit")
+            or term.endswith("-direct")):
+        return 24
+    if "256color" in term:
+        return 256
+    if term and term != "dumb":
+        return 16
+    if os.name == "nt":
+        return 24 if environ.get("WT_SESSION") else 16
+    return 8
+
+
+def _isatty(stream: t.Any) -> bool:
+    """Return whether stream is an open terminal."""
+    isatty = getattr(stream, "isatty", None)
+    try:
+        return bool(isatty and isatty())
+    except ValueError: # closed stream
+        return False
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,111 @@
+"""Measuring and aligning formatted text.
+
+Escape sequences take no space on screen and East Asian wide characters and
+emojis take two columns, so :py:`len()` and :py:`str.ljust()` are wrong for
+formatted text. :func:`.visible_width` returns the on-screen column width
+instead.
+"""
+import re
+import unicodedata
+
+# CSI sequences (e.g. SGR), OSC sequences (terminated by BEL or ST) and two
+# character escape sequences.
+ESCAPE_SEQUENCE = re.compile(
+    r"\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[@-Z\\^_])")
+
+_VARIATION_SELECTOR_16 = "\ufe0f" # requests emoji presentation
+_ZERO_WIDTH_CATEGORIES = frozenset(("Mn", "Me", "Cf", "Cc"))
+
+
+class _WidthTable(dict):
+    """Dict of character to column width, filled on first lookup."""
+
+    def __missing__(self, char: str) -> int:
+        width = _char_width(char)
+        self[char] = width
+        return width
+
+
+def _char_width(char: str) -> int:
+    """Return the number of columns char takes on screen."""
+    if unicodedata.category(char) in _ZERO_WIDTH_CATEGORIES:
+        return 0
+    if "\u1160" <= char <= "\u11ff": # Hangul medial vowels/final consonants
+        return 0
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return 2
+    return 1
+
+
+_WIDTHS = _WidthTable()
+
+
+def strip_escapes(text: str) -> str:
+    """Return text without ANSI Escape sequences.
+
+    Examples:
+        >>> strip_escapes('\\x1b[1;31mError\\x1b[0m')
+        'Error'
+    """
+    if "\x1b" not in text:
+        return text
+    return ESCAPE_SEQUENCE.sub("", text)
+
+
+def visible_width(text: str) -> int:
+    """Return the number of columns text takes on screen.
+
+    Escape sequences, control characters, combining and other zero width
+    characters take no column; East Asian wide and fullwidth characters
+    (which includes most emojis) take two columns. A narrow character followed
+    by the emoji variation selector (U+FE0F) takes two columns.
+
+    Examples:
+        >>> visible_width('\\x1b[1;31mError\\x1b[0m')
+        5
+
+        >>> visible_width('\\x1b[1mdeploy 🚀 done\\x1b[0m')
+        14
+
+        >>> visible_width('日本語')
+        6
+    """
+    if text.isascii():
+        if "\x1b" in text:
+            text = ESCAPE_SEQUENCE.sub("", text)
+        if text.isprintable():
+            return len(text)
+    elif "\x1b" in text:
+        text = ESCAPE_SEQUENCE.sub("", text)
+
+    width = sum(map(_WIDTHS.__getitem__, text))
+    if _VARIATION_SELECTOR_16 in text:
+        width += sum(1 for index, char in enumerate(text[1:], 1)
+                     if char == _VARIATION_SELECTOR_16
+                     and _WIDTHS[text[index - 1]] == 1)
+    return width
+
+
+def ljust(text: str, width: int, fillchar: str = " ") -> str:
+    """Return text padded on the right to width visible columns.
+
+    Examples:
+        >>> ljust('\\x1b[1mab\\x1b[0m', 4) + '|'
+        '\\x1b[1mab\\x1b[0m  |'
+    """
+    return text + fillchar * max(0, width - visible_width(text))
+
+
+def rjust(text: str, width: int, fillchar: str = " ") -> str:
+    """Return text padded on the left to width visible columns.
+
+    Examples:
+        >>> rjust('日本', 6)
+        '  日本'
+    """
+    return fillchar * max(0, width - visible_width(text)) + text
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -5,14 +5,16 @@ ANSI-Enums, or checking for correct types, format etc.
 
 """
 
-from pyansiescapes.enums import ANSICommands, TextAttributes, ColorDrawingLevel, Colors, Colors256
+from pyansiescapes.enums import ANSICommands, TextAttributes, ColorDrawingLevel, Colors
+from pyansiescapes import conversions, palette
 import pyansiescapes._types as t
 from collections.abc import Iterable
-import logging
+from functools import partial
+
 
-_logger = logging.getLogger(__file__)
 #--------------------- Parsers ------------------------------
-def parsing_switcher(argc: int, arg: t.ColorArg) -> t.Callable[[t.ColorArg, int], t.Tuple[str, int]]:
+def parsing_switcher(argc: int, arg: t.ColorArg,
+                     metric: str = "rgb") -> t.Callable[[t.ColorArg, int], t.Tuple[str, int]]:
     """Return get color_id function for argument arg.
 
     If argument is 'name', parse name first to check if user did not
@@ -23,24 +25,38 @@ def parsing_switcher(argc: int, arg: t.ColorArg) -> t.Callable[[t.ColorArg, int]
 
         arg: The color argument.
 
+        metric: The matching metric for hexadecimal, rgb- and hsl-values (see
+            :func:`.parse_metric`).
+            Default: "rgb"
+
     Returns:
         The get_color_id_from_{type} function obj.
         Any of :func:`.get_color_id_from_id`, :func:`.get_color_id_from_name`,
         :func:`.get_color_id_from_hex` or
         :func:`.get_color_id_from_color_value`
     """
-    switcher = {
-        0: get_color_id_from_id,
-        1: get_color_id_from_name,
-        2: get_color_id_from_hex,
-        3: lambda x, y: get_color_id_from_color_value(x, y, "rgb"),
-        4: lambda x, y: get_color_id_from_color_value(x, y, "hsl"),
-    }
     if argc == 1:
         # parse color name and then check again
         argc, arg = parse_color_name(arg)
 
-    return switcher[argc]
+    get_color_id = _GET_COLOR_ID_FUNCTIONS[argc]
+    if metric != "rgb" and argc > 1:
+        # color ids and names are never matched
+        get_color_id = partial(get_color_id, metric=metric)
+    return get_color_id
+
+
+def parse_metric(metric: str) -> str:
+    """Check that metric is a matching metric of :attr:`.palette.METRICS`.
+
+    Raises:
+        ValueError: {metric} is not a supported metric!
+            If metric is not in :attr:`.palette.METRICS`.
+    """
+    if metric not in palette.METRICS:
+        raise ValueError("{} is not a supported metric! Use one of {}."
+                         .format(metric, palette.METRICS))
+    return metric
 
 
 def parse_drawing_level(drawing_level: t.DrawingLevelArg) -> str:
@@ -65,23 +81,31 @@ def parse_drawing_level(drawing_level: t.DrawingLevelArg) -> str:
     return drawing_level
 
 
-def parse_colormode(colormode: int, blink: bool,
+def parse_colormode(colormode: t.Union[int, str], blink: bool,
                     bright: bool, bold: bool) -> int:
     """Parse colormode setters into colormode.
 
     Returns the colormode in int. Blink and Bright will override colormode.
-    Bold overrides colormode if :py:`colormode == 8`.
+    Bold overrides colormode if :py:`colormode == 8`. Truecolor (24-bit)
+    colormode is never overridden.
 
     Args:
-        colormode: Colormode for colors. Any in :py:`[8, 16, 256]`.
+        colormode: Colormode for colors. Any in :py:`[8, 16, 256, 24]` or
+            :py:`"truecolor"` (same as :py:`24`).
         blink: Toggle blink/bright/256 bit mode.
         bright: Toggle blink/bright/256 bit mode.
         bold: Toggle bold/16-bit mode.
 
     Returns:
-        Either 8, 16 or 256 (as integer) corresponding to the colormode.
+        Either 8, 16, 256 or 24 (as integer) corresponding to the colormode.
+
+    Examples:
+        >>> parse_colormode("truecolor", blink=True, bright=False, bold=False)
+        24
     """
-    if blink or bright or colormode == 256:
+    if colormode == 24 or colormode == "truecolor":
+        return 24
+    elif blink or bright or colormode == 256:
         colormode = 256
         return colormode
     elif bold or colormode == 16:
@@ -91,6 +115,25 @@ def parse_colormode(colormode: int, blink: bool,
         return colormode
 
 
+def parse_color_depth(depth: t.Union[int, str]) -> int:
+    """Parse a color depth (see :mod:`.terminal`) into int.
+
+    Raises:
+        ValueError: {depth} is not a valid color depth!
+            If depth is not in :py:`(0, 8, 16, 256, 24, "truecolor")`.
+
+    Examples:
+        >>> parse_color_depth("truecolor")
+        24
+    """
+    if depth == "truecolor":
+        return 24
+    if depth not in _COLOR_DEPTHS:
+        raise ValueError("{} is not a valid color depth! Use one of {}."
+                         .format(depth, _COLOR_DEPTHS))
+    return int(depth)
+
+
 def parse_color_name(name: t.ColorArg) -> t.ColorArgTuple:
     """Parses the color name.
 
@@ -161,7 +204,7 @@ def parse_hex(hex: str) -> str:
     Args:
         hex: Hexadecimal color value. Must start with ``#``, be of length 7 and
             must be a valid hexadecimal value (all characters must be in
-            :py:`set("#abcdef0123456789")`).
+            :py:`set("#abcdef0123456789")`, in upper or lower case).
 
     Returns:
         The hexadecimal color value in Colors256-key-format (eg.
@@ -176,6 +219,10 @@ def parse_hex(hex: str) -> str:
         >>> parse_hex("#ffffff")
         'hex_ffffff'
 
+        >>> # Upper case digits are accepted just as by the batch functions.
+        >>> parse_hex("#FF8700")
+        'hex_ff8700'
+
         >>> # Raise TypeError with hexadecimal color value is wrong.
         >>> parse_hex("ffffff")
         Traceback (most recent call last):
@@ -189,8 +236,8 @@ def parse_hex(hex: str) -> str:
         TypeError: \"#gfffff\" is not a valid hexadecimal color value
 
     """
-    if is_valid_hex_string(hex):
-        hex = 'hex_' + hex[1:]
+    if is_valid_hex_string(hex.lower()):
+        hex = 'hex_' + hex[1:].lower()
     else:
         raise TypeError(
             "\"{}\" is not a valid hexadecimal color value".format(hex))
@@ -199,13 +246,33 @@ def parse_hex(hex: str) -> str:
 
 
 def parse_color_value(color_value: t.ColorValue, key: str) -> str:
-    """Parses color value to color key
+    """Parses color value to color key.
 
-    RGB-values will be cliped to their respective closest bin.
+    The color value is mapped to the closest palette color (see
+    :func:`.palette.nearest_color_id`) first.
+
+    Args:
+        color_value: A color value as :py:`list` or :py:`tuple` with
+            :py:`len(color_value) == 3`
+        key: The color space of color_value. Either :py:`"rgb"` or
+            :py:`"hsl"`.
+
+    Returns:
+        The color value in Colors256-key-format (e.g. :py:`"rgb_255_135_0"`).
+
+    Examples:
+        >>> parse_color_value((250, 130, 10), "rgb")
+        'rgb_255_135_0'
+
+        >>> parse_color_value((240, 100, 50), "hsl")
+        'hsl_240_100_50'
     """
+    color_id = int(get_color_id_from_color_value(color_value, 256, key)[0])
     if key == "rgb":
-        color_value = clip_to_closes_color(color)
-    return key + '_'.join((str(val) for val in rgb))
+        color_value = palette.unpack_rgb(palette.RGB[color_id])
+    else:
+        color_value = palette.HSL[color_id]
+    return key + '_' + '_'.join((str(val) for val in color_value))
 
 
 def parse_arguments(*args: t.Any) -> t.Iterator[t.ColorArgTuple]:
@@ -215,31 +282,20 @@ def parse_arguments(*args: t.Any) -> t.Iterator[t.ColorArgTuple]:
             yield (argc, arg)
 
 
-def clip_to_closes_color(color: t.ColorValue) -> t.Iterator[int]:
-    """Clips the rgb values to their respective closest bin."""
-    assert isinstance(color, Iterable)
-
-    bins = [0, 95, 135, 175, 215, 255]
-    color = (_round_to_next_bin(x, bins) for x in color)
-    return color
+def clip_to_closes_color(color: t.ColorValue) -> t.ColorValueTuple:
+    """Clips the rgb values to the closest palette color.
 
+    Examples:
+        >>> clip_to_closes_color((250, 130, 10))
+        (255, 135, 0)
+    """
+    assert isinstance(color, Iterable)
 
-def _round_to_next_bin(val: int, bins: t.ColorBins) -> int:
-    """Return the bin in bins closest to value."""
-    right = bisect_right(bins, val)
-    left = right - 1
-    ret = _get_closest(val, *bins[left:right+ 1]
-                       ) if right != len(bins) else bins[left]
-    return ret
+    color_id = palette.nearest_color_id(*(int(value) for value in color))
+    return palette.unpack_rgb(palette.RGB[color_id])
 
 
 # ---------------------- Getters ---------------------------------------
-def _get_closest(val: int, left: int, right: int) -> int:
-    """Return left or right depending on which is closer to val"""
-    ret = left if val - left < right - val else right
-    return ret
-
-
 def get_first_color_argument(*args: t.Any) -> t.ColorArgTuple:
     """Return first argument in args which is not None.
 
@@ -257,12 +313,40 @@ def get_first_color_argument(*args: t.Any) -> t.ColorArgTuple:
 
 
 def get_color_id_from_id(color_id: int, colormode: int) -> t.Tuple[str, int]:
-    """Return color_id as str and toggle colormode 256 if necessary."""
+    """Return color_id as str and toggle colormode 256 if necessary.
+
+    Raises:
+        ValueError: {color_id} is not a valid color id!
+            If color_id is not in :py:`range(256)`.
+    """
+    color_id = parse_color_id(color_id)
     if color_id > 8:
         colormode = 256
     return str(color_id), colormode
 
 
+def parse_color_id(color_id: t.Union[int, str]) -> int:
+    """Check a color id and return it as int.
+
+    Raises:
+        ValueError: {color_id} is not a valid color id!
+            If color_id is not in :py:`range(256)`.
+
+    Examples:
+        >>> parse_color_id("208")
+        208
+
+        >>> parse_color_id(-1)
+        Traceback (most recent call last):
+        ...
+        ValueError: -1 is not a valid color id!
+    """
+    color_id = int(color_id)
+    if not 0 <= color_id < 256:
+        raise ValueError("{} is not a valid color id!".format(color_id))
+    return color_id
+
+
 def get_color_id_from_color_enum(key: str, color_enum: t.ColorEnum) -> str:
     """Return color_id as str for key in color_enum
 
@@ -307,43 +391,48 @@ def get_color_id_from_name(name: str, colormode: int) -> t.Tuple[str, int]:
 
         colormode: Any integer in :py:`[8, 16, 256]`.
     """
-    if colormode == 256:
-        color_enum = Colors256
-    else: # colormode != 256
-        if not is_8bit_color(name):
-            colormode = 256
-            color_enum = Colors256
-        else:
-            color_enum = Colors
+    if colormode != 256 and is_8bit_color(name):
+        return get_color_id_from_color_enum(name.lower(), Colors), colormode
 
-    return get_color_id_from_color_enum(name.lower(), color_enum), colormode
+    return get_color_id_from_palette(name.lower(), palette.ID_BY_NAME), 256
 
 
-def get_color_id_from_hex(hex: str, colormode: int) -> t.Tuple[str, int]:
+def get_color_id_from_hex(hex: str, colormode: int,
+                          metric: str = "rgb") -> t.Tuple[str, int]:
     """Returns a color id and the correct colormode.
 
-    Parses hex str (e.g. :py:`"#ffffff"`) into valid key format (e.g. :py:`"hex_ffffff"`).
+    Checks hex str (e.g. :py:`"#ffffff"`) with :func:`.parse_hex` before
+    mapping it to the closest palette color (see
+    :func:`.palette.nearest_color_id_from_hex`).
 
     Args:
         hex: A hexadecimal color value.
             Format:
 
-                - :py:`"^hex_[0-9,a-f]{6}$"` (e.g. :py:`"hex_ffffff"`)
+                - :py:`"^#[0-9,a-f]{6}$"` (e.g. :py:`"#ffffff"`)
 
         colormode: Just provided for compatibility but is ignored since
             hexdecimalcolor value toogles colormode 256 automatically.
+
+        metric: The matching metric, see
+            :func:`.palette.nearest_color_id_perceptual`.
+            Default: "rgb"
     """
-    key = parse_hex(hex)
-    return get_color_id_from_color_enum(key, Colors256), 256
+    parse_hex(hex) # raises TypeError for invalid hexadecimal color values
+    if metric == "rgb":
+        return str(palette.nearest_color_id_from_hex(hex)), 256
+    return str(palette.nearest_color_id_perceptual(
+        *conversions.hex_to_rgb(hex), metric=metric)), 256
 
 
 def get_color_id_from_color_value(color_value: t.ColorValue,
-                                  colormode: int) -> t.Tuple[str, int]:
+                                  colormode: int,
+                                  key: str = "rgb",
+                                  metric: str = "rgb") -> t.Tuple[str, int]:
     """Returns a color id and the correct colormode.
 
-    Iterarble (eg. :py:`(255, 0, 0)` are parsed into valid key format (eg.
-    :py:`"rgb_255_0_0"`) before lookup. See :func:`.parse_color_value` for
-    details.
+    Iterarble (eg. :py:`(255, 0, 0)`) are mapped to the closest palette color
+    (see :func:`.palette.nearest_color_id`).
 
     Args:
         color_value: A color value as :py:`list` or :py:`tuple` with
@@ -351,18 +440,224 @@ def get_color_id_from_color_value(color_value: t.ColorValue,
 
         colormode: Just provided for compatibility but is ignored since rgb/hsl
             color values toogle colormode 256 automatically.
+
+        key: The color space of color_value. Either :py:`"rgb"` or
+            :py:`"hsl"`.
+            Default: :py:`"rgb"`
+
+        metric: The matching metric, see
+            :func:`.palette.nearest_color_id_perceptual`.
+            Default: :py:`"rgb"`
+
+    Raises:
+        ValueError: {value} is not a valid rgb-value!
+            If an rgb channel value is not in :py:`range(256)`.
+        ValueError: {value} is not a valid hsl-value!
+            If saturation or lightness is not within 0 and 100.
+
+    Examples:
+        >>> get_color_id_from_color_value((255, 135, 0), 8)
+        ('208', 256)
+
+        >>> get_color_id_from_color_value((250, 130, 10), 8)
+        ('208', 256)
+
+        >>> get_color_id_from_color_value((240, 100, 50), 8, "hsl")
+        ('12', 256)
+
+        >>> get_color_id_from_color_value((30, 30, 60), 8, metric="ciede2000")
+        ('17', 256)
+    """
+    if key != "rgb":
+        color_value = parse_hsl(color_value)
+    if metric != "rgb":
+        if key == "rgb":
+            red, green, blue = (int(value) for value in color_value)
+        else:
+            red, green, blue = conversions.hsl_to_rgb(*color_value)
+        color_id = palette.nearest_color_id_perceptual(red, green, blue, metric)
+    elif key == "rgb":
+        color_id = palette.nearest_color_id(*(int(value) for value in color_value))
+    else:
+        # computed (float) hsl-values are converted exactly, not truncated
+        color_id = palette.nearest_color_id_from_hsl(*color_value)
+    return str(color_id), 256
+
+
+def get_color_id_from_palette(key: t.Any, lookup: t.Dict[t.Any, int]) -> str:
+    """Return color_id as str for key in one of the :mod:`.palette` lookups.
+
+    Raises:
+        KeyError: {key} is not a valid 256-bit color!
+            If key is not in lookup.
     """
-    key = parse_color_value(color_value)
-    return get_color_id_from_color_enum(key, Colors256)
+    try:
+        color_id = lookup[key]
+    except KeyError:
+        raise KeyError("{} is not a valid 256-bit color!".format(key))
+    return str(color_id)
+
+
+def get_rgb(argc: int, arg: t.ColorArg) -> t.ColorValueTuple:
+    """Return the rgb-value for a color argument (used in truecolor mode).
+
+    Hexadecimal, rgb- and hsl-values are converted directly; color ids and
+    names are looked up in the :mod:`.palette`.
+
+    Args:
+        argc: The positional argument count [0-4] which specifies the argument
+            type (see :func:`.parsing_switcher`).
+        arg: The color argument.
+
+    Examples:
+        >>> get_rgb(2, "#123456")
+        (18, 52, 86)
+
+        >>> get_rgb(1, "orange1")
+        (255, 175, 0)
+    """
+    if argc == 1:
+        # parse color name and then check again
+        argc, arg = parse_color_name(arg)
+
+    return _GET_RGB_FUNCTIONS[argc](arg)
+
+
+def get_rgb_from_id(color_id: t.Union[int, str]) -> t.ColorValueTuple:
+    """Return the rgb-value of a palette color id.
+
+    Raises:
+        ValueError: {color_id} is not a valid color id!
+            If color_id is not in :py:`range(256)`.
+    """
+    return palette.unpack_rgb(palette.RGB[parse_color_id(color_id)])
+
+
+def get_rgb_from_name(name: str) -> t.ColorValueTuple:
+    """Return the rgb-value of a palette color name."""
+    return get_rgb_from_id(get_color_id_from_palette(name.lower(),
+                                                     palette.ID_BY_NAME))
+
+
+def get_rgb_from_hex(hex: str) -> t.ColorValueTuple:
+    """Return the rgb-value of a hexadecimal color value (e.g. "#ffffff")."""
+    parse_hex(hex) # raises TypeError for invalid hexadecimal color values
+    return conversions.hex_to_rgb(hex)
+
+
+def get_rgb_from_rgb(color_value: t.ColorValue) -> t.ColorValueTuple:
+    """Return the rgb-value as int tuple.
+
+    Raises:
+        ValueError: {value} is not a valid rgb-value!
+            If a channel value is not in :py:`range(256)`.
+    """
+    red, green, blue = (int(value) for value in color_value)
+    if (red | green | blue) >> 8:
+        raise ValueError(
+            "{} is not a valid rgb-value!".format((red, green, blue)))
+    return red, green, blue
+
+
+def get_rgb_from_hsl(color_value: t.ColorValue) -> t.ColorValueTuple:
+    """Return the rgb-value of an hsl-value.
+
+    Raises:
+        ValueError: {value} is not a valid hsl-value!
+            If saturation or lightness is not within 0 and 100.
+    """
+    return conversions.hsl_to_rgb(*parse_hsl(color_value))
+
+
+def parse_hsl(color_value: t.ColorValue) -> t.Tuple[float, float, float]:
+    """Check an hsl-value and return it as tuple.
+
+    Hues outside of :py:`range(360)` wrap around, saturation and lightness
+    are percentages.
+
+    Raises:
+        ValueError: {value} is not a valid hsl-value!
+            If saturation or lightness is not within 0 and 100.
+
+    Examples:
+        >>> parse_hsl([400, 100, 50])
+        (400, 100, 50)
+
+        >>> parse_hsl((0, 200, 50))
+        Traceback (most recent call last):
+        ...
+        ValueError: (0, 200, 50) is not a valid hsl-value!
+    """
+    hue, saturation, lightness = color_value
+    if not (0 <= saturation <= 100 and 0 <= lightness <= 100):
+        raise ValueError("{} is not a valid hsl-value!".format(
+            (hue, saturation, lightness)))
+    return hue, saturation, lightness
+
+
+_GET_RGB_FUNCTIONS = {
+    0: get_rgb_from_id,
+    1: get_rgb_from_name,
+    2: get_rgb_from_hex,
+    3: get_rgb_from_rgb,
+    4: get_rgb_from_hsl,
+}
+
+
+_GET_COLOR_ID_FUNCTIONS = {
+    0: get_color_id_from_id,
+    1: get_color_id_from_name,
+    2: get_color_id_from_hex,
+    3: lambda x, y, metric="rgb": get_color_id_from_color_value(x, y, "rgb", metric),
+    4: lambda x, y, metric="rgb": get_color_id_from_color_value(x, y, "hsl", metric),
+}
+
+
+# color depths (and colormodes) from lowest to highest
+_COLOR_DEPTHS = (0, 8, 16, 256, 24)
+
+
+def reduce_color_depth(color_id: str, colormode: int,
+                       depth: int) -> t.Tuple[str, int]:
+    """Return color id and colormode of the closest color with depth.
+
+    256-bit colors are replaced by the closest system color (see
+    :attr:`.palette.ID_16` and :attr:`.palette.ID_8`). 16-bit colors are
+    kept since they only add the bold attribute to 8-bit colors.
+
+    Args:
+        color_id: A color id of colormode 8, 16 or 256.
+        colormode: The colormode of color_id.
+        depth: The color depth. Any in :py:`(8, 16, 256, 24)`.
+
+    Examples:
+        >>> reduce_color_depth("208", 256, 16)
+        ('1', 16)
+
+        >>> reduce_color_depth("208", 256, 8)
+        ('1', 8)
+    """
+    if colormode != 256 or depth in (256, 24):
+        return color_id, colormode
+    if depth == 16:
+        system_id = palette.ID_16[int(color_id)]
+    else:
+        system_id = palette.ID_8[int(color_id)]
+    if system_id < 8:
+        return str(system_id), 8
+    return str(system_id - 8), 16
 
 
 def get_color_string(color_id: str, colormode: int) -> str:
     """Return get_color_string func for colormode."""
-    switcher = {8: get_color_string_8_bit,
-                16: get_color_string_16_bit,
-                256: get_color_string_256_bit
-                }
-    return switcher[colormode](color_id)
+    return _GET_COLOR_STRING_FUNCTIONS[colormode](color_id)
+
+
+def get_color_string_24_bit(rgb: t.ColorValueTuple) -> str:
+    """Return ANSI color command string for 24 bit (truecolor) colors"""
+    return Colors._blink + ANSICommands.separator + "2" + \
+        ANSICommands.separator + ANSICommands.separator.join(
+            str(int(value)) for value in rgb)
 
 
 def get_color_string_256_bit(color_id: str) -> str:
@@ -381,6 +676,13 @@ def get_color_string_8_bit(color_id: str) -> str:
     return color_id
 
 
+_GET_COLOR_STRING_FUNCTIONS = {
+    8: get_color_string_8_bit,
+    16: get_color_string_16_bit,
+    256: get_color_string_256_bit,
+}
+
+
 #--------------------- Checker ------------------------------
 def any_is_not_none(*args: t.Any) -> bool:
     return any(arg is not None for arg in args)
@@ -0,0 +1,168 @@
+"""Buffered output of styled text fragments.
+
+:class:`.AnsiWriter` keeps track of the current SGR state of the output, so
+consecutive fragments sharing (parts of) a style only emit the changed
+attributes instead of a full style sequence and a reset around each fragment.
+"""
+import io
+from time import monotonic
+from pyansiescapes import commands, sgr
+import pyansiescapes._types as t
+
+_MAX_CACHED_STATES = 1024
+
+
+class AnsiWriter:
+    """Write styled text fragments to a text or binary file object.
+
+    Fragments are collected in a buffer which is written to the stream in one
+    call once it holds at least `buffer_size` characters, once
+    `flush_interval` seconds passed since the last flush (checked on write),
+    or on :meth:`flush`/:meth:`close`.
+
+    Args:
+        stream: Any text or binary file object with a :py:`write` method.
+        buffer_size: Number of buffered characters that triggers a flush.
+            Default: 65536
+        flush_interval: Maximum age in seconds of buffered output, checked on
+            every write. :py:`None` disables the time threshold.
+            Default: None
+        encoding: Encoding used for binary streams.
+            Default: "utf-8"
+
+    Examples:
+        >>> import io
+        >>> out = io.StringIO()
+        >>> error = commands.Style('bold', color='red')
+        >>> with AnsiWriter(out) as writer:
+        ...     writer.write("Error: ", error)
+        ...     writer.write("disk full", error)
+        ...     writer.write(" (retrying)", commands.Style(color='red'))
+        ...     writer.write("\\n")
+        >>> out.getvalue()
+        '\\x1b[1;31mError: disk full\\x1b[0;31m (retrying)\\x1b[0m\\n'
+    """
+
+    def __init__(self, stream: t.Any, buffer_size: int = 65536,
+                 flush_interval: t.Optional[float] = None,
+                 encoding: str = "utf-8") -> None:
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.encoding = encoding
+        self.binary = (isinstance(stream, (io.RawIOBase, io.BufferedIOBase))
+                       or "b" in getattr(stream, "mode", ""))
+        self.state = sgr.EMPTY
+        self._buffer = [] # type: t.List[str]
+        self._buffered = 0
+        self._last_flush = monotonic()
+        self._states = {} # type: t.Dict[str, sgr.SGRState]
+        self._styles = {} # type: t.Dict[t.Any, commands.Style]
+        self._transitions = {} # type: t.Dict[t.Tuple[sgr.SGRState, sgr.SGRState], str]
+
+    def write(self, text: str, style: t.Any = None) -> None:
+        """Write text with style.
+
+        Args:
+            text: The text.
+            style: A :class:`.Style`, any style accepted by
+                :func:`.format_many` or :py:`None` for unstyled text.
+        """
+        if not text:
+            return
+        if style is not None:
+            if not isinstance(style, commands.Style):
+                style = self._compile(style)
+            state = self._get_state(style.prefix)
+            text = style.encode_emojis(text)
+        else:
+            state = sgr.EMPTY
+
+        buffer = self._buffer
+        if state is not self.state and state != self.state:
+            buffer.append(self._get_transition(self.state, state))
+            self.state = state
+        buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.buffer_size or (
+                self.flush_interval is not None
+                and monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def writelines(self, fragments: t.Iterable[t.Tuple[str, t.Any]]) -> None:
+        """Write (text, style) fragments. See :meth:`write`."""
+        for text, style in fragments:
+            self.write(text, style)
+
+    def flush(self) -> None:
+        """Write the buffered output to the stream in one call."""
+        if self._buffer:
+            output = "".join(self._buffer)
+            self._buffer.clear()
+            self._buffered = 0
+            self.stream.write(output.encode(self.encoding) if self.binary
+                              else output)
+        self._last_flush = monotonic()
+        flush = getattr(self.stream, "flush", None)
+        if flush is not None:
+            flush()
+
+    def reset(self) -> None:
+        """Reset all text attributes and colors of the output."""
+        if self.state != sgr.EMPTY:
+            self._buffer.append(commands.reset())
+            self.state = sgr.EMPTY
+
+    def close(self) -> None:
+        """Reset the output and flush. The stream itself is not closed."""
+        self.reset()
+        self.flush()
+
+    def __enter__(self) -> "AnsiWriter":
+        return self
+
+    def __exit__(self, *exc_info: t.Any) -> None:
+        self.close()
+
+    def _compile(self, spec: t.Any) -> commands.Style:
+        """Return the (cached) :class:`.Style` for a style spec."""
+        key = commands.style_key(spec)
+        try:
+            return self._styles[key]
+        except KeyError:
+            style = commands.compile_style(spec)
+            if len(self._styles) >= _MAX_CACHED_STATES:
+                self._styles.clear()
+            self._styles[key] = style
+            return style
+        except TypeError:
+            # unhashable (e.g. array-like) color values cannot be cached
+            return commands.compile_style(spec)
+
+    def _get_state(self, prefix: str) -> sgr.SGRState:
+        """Return the (cached) SGR state set by a style prefix."""
+        try:
+            return self._states[prefix]
+        except KeyError:
+            # strip ANSICommands.start and ANSICommands.stop
+            state = sgr.EMPTY.apply(prefix[2:-1])
+            if len(self._states) >= _MAX_CACHED_STATES:
+                self._states.clear()
+            self._states[prefix] = state
+            return state
+
+    def _get_transition(self, old: sgr.SGRState, new: sgr.SGRState) -> str:
+        """Return the (cached) SGR sequence changing the old into the new state."""
+        try:
+            return self._transitions[old, new]
+        except KeyError:
+            escape = sgr.sequence(sgr.transition(old, new))
+            if len(self._transitions) >= _MAX_CACHED_STATES:
+                self._transitions.clear()
+            self._transitions[old, new] = escape
+            return escape
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
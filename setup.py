@@ -23,13 +23,16 @@ setup(
     install_requires=[
           'emojis',
       ],
+    extras_require={
+          'numpy': ['numpy'],
+      },
     classifiers=[
         'Development Status :: 2 - Pre-Alpha',
         'License :: OSI Approved :: MIT License',
         'Programming Language :: Python :: 3 ',
         'Programming Language :: Python :: 3 :: Only',
     ],
-    python_requires='>=3.5',
+    python_requires='>=3.7',
     project_urls={  # Optional
         'Bug Reports': 'https://github.com/tillhainbach/' + name + '/issues',
         'Documentation': 'https://pyansiescapes.readthedocs.io/en/latest/',
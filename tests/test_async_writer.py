@@ -0,0 +1,169 @@
+import asyncio
+import pytest
+from pyansiescapes.async_writer import AsyncAnsiWriter
+
+
+class FailingStream:
+    """asyncio.StreamWriter whose connection is lost on the first drain."""
+
+    def __init__(self, lost=None):
+        self.written = []
+        self.lost = lost
+
+    def write(self, data):
+        self.written.append(data)
+
+    async def drain(self):
+        if self.lost is not None:
+            await self.lost.wait()
+        raise ConnectionResetError("connection lost")
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, 5))
+
+
+def test_write_raises_error_of_failed_task():
+    async def main():
+        writer = AsyncAnsiWriter(FailingStream())
+        await writer.write("first\n")
+        await asyncio.sleep(0)
+        with pytest.raises(ConnectionResetError):
+            await writer.write("second\n")
+        with pytest.raises(ConnectionResetError):
+            writer.write_nowait("third\n")
+        with pytest.raises(ConnectionResetError):
+            await writer.close()
+    run(main())
+
+
+def test_write_to_full_queue_raises_error_of_failed_task():
+    async def main():
+        lost = asyncio.Event()
+        writer = AsyncAnsiWriter(FailingStream(lost), max_queue=1)
+        await writer.write("draining\n")
+        await asyncio.sleep(0) # the task waits for the drain
+        await writer.write("queued\n")
+        waiting = asyncio.ensure_future(writer.write("waiting\n"))
+        await asyncio.sleep(0)
+        assert not waiting.done()
+        lost.set()
+        with pytest.raises(ConnectionResetError):
+            await waiting
+        with pytest.raises(ConnectionResetError):
+            await writer.close()
+    run(main())
+
+
+def test_close_after_failed_task_does_not_hang():
+    async def main():
+        writer = AsyncAnsiWriter(FailingStream(), max_queue=2)
+        writer.write_nowait("first\n")
+        writer.write_nowait("second\n")
+        await asyncio.sleep(0) # the task fails on the first batch
+        with pytest.raises(ConnectionResetError):
+            await writer.close()
+        await writer.close() # closed already
+    run(main())
+
+
+class SlowStream:
+    """asyncio.StreamWriter draining only while drained is set."""
+
+    def __init__(self):
+        self.written = []
+        self.drained = asyncio.Event()
+
+    def write(self, data):
+        self.written.append(data.decode())
+
+    async def drain(self):
+        await self.drained.wait()
+
+    def getvalue(self):
+        return "".join(self.written)
+
+
+def test_cancelled_write_is_not_queued():
+    async def main():
+        stream = SlowStream()
+        writer = AsyncAnsiWriter(stream, max_queue=1)
+        await writer.write("first\n")
+        await asyncio.sleep(0) # the task waits for the drain
+        await writer.write("second\n")
+        waiting = asyncio.ensure_future(writer.write("cancelled\n"))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        stream.drained.set()
+        await writer.write("third\n")
+        await writer.close()
+        return stream.getvalue()
+    assert run(main()) == "first\nsecond\nthird\n"
+
+
+def test_concurrent_producers_keep_their_order():
+    async def produce(writer, name):
+        for index in range(20):
+            await writer.write("{} {}\n".format(name, index))
+            await asyncio.sleep(0)
+
+    async def main():
+        stream = SlowStream()
+        stream.drained.set()
+        async with AsyncAnsiWriter(stream, max_queue=2) as writer:
+            await asyncio.gather(*(produce(writer, name) for name in "abc"))
+        return stream.getvalue().splitlines()
+    lines = run(main())
+    assert len(lines) == 60
+    for name in "abc":
+        assert ([line for line in lines if line.startswith(name)]
+                == ["{} {}".format(name, index) for index in range(20)])
+
+
+def test_replaced_status_frames_are_dropped():
+    async def main():
+        stream = SlowStream()
+        stream.drained.set()
+        async with AsyncAnsiWriter(stream) as writer:
+            for index in range(5):
+                writer.status(["frame {}".format(index)])
+        return writer.dropped_frames, stream.getvalue()
+    dropped_frames, output = run(main())
+    assert dropped_frames == 4
+    assert "frame 4" in output and "frame 3" not in output
+
+
+def test_write_racing_close():
+    async def main():
+        stream = SlowStream()
+        writer = AsyncAnsiWriter(stream, max_queue=1)
+        await writer.write("first\n")
+        await asyncio.sleep(0) # the task waits for the drain
+        await writer.write("second\n")
+        # waits for the full queue before close() does
+        waiting = asyncio.ensure_future(writer.write("waiting\n"))
+        closing = asyncio.ensure_future(writer.close())
+        await asyncio.sleep(0)
+        with pytest.raises(RuntimeError, match="closed"):
+            await writer.write("too late\n")
+        with pytest.raises(RuntimeError, match="closed"):
+            writer.write_nowait("too late\n")
+        stream.drained.set()
+        await asyncio.gather(waiting, closing, writer.close())
+        return stream.getvalue()
+    assert run(main()) == "first\nsecond\nwaiting\n"
+
+
+def test_write_after_close_restarts_writer():
+    async def main():
+        stream = SlowStream()
+        stream.drained.set()
+        writer = AsyncAnsiWriter(stream)
+        await writer.write("first\n")
+        await writer.close()
+        await writer.write("second\n")
+        await writer.close()
+        return stream.getvalue()
+    assert run(main()) == "first\nsecond\n"
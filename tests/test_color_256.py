@@ -1,4 +1,5 @@
-from pyansiescapes.pyansiescapes import ColorDrawingLevel, Colors, Colors256
+from pyansiescapes.enums import ColorDrawingLevel, Colors, Colors256
+from pyansiescapes import palette, text
 from itertools import chain
 from collections.abc import Iterable
 import sys
@@ -7,7 +8,7 @@ def _print_color(color = "0", colormode = "", color256 = "", drawing_level = "3"
     additional_attributes = (";" + ";".join((colormode, color256))).rstrip(";")
     ansi = "\u001b[{}{}{}m".format(drawing_level, color, additional_attributes)
     #print("{}{}{}m".format(drawing_level, color, additional_attributes), end="")
-    return print(ansi + display_name.ljust(display_string_length) + "\u001b[0m", end = "")
+    return print(ansi + text.ljust(display_name, display_string_length) + "\u001b[0m", end = "")
 
 def _break_line(counter, after):
     if (counter + 1) % after == 0:
@@ -35,17 +36,15 @@ def _make_display_name(
 
 def _find_value(color, prefix):
     if not isinstance(color, Colors256):
-        value = ""
+        return ""
+    color_id = int(color)
+    if prefix == "hex_":
+        return palette.HEX[color_id]
+    if prefix == "rgb_":
+        value = palette.unpack_rgb(palette.RGB[color_id])
     else:
-        try:
-            value = next((key for key, value in Colors256.__members__.items() if value == color.value and key.startswith(prefix)))[4:]
-            if prefix == "hex_":
-                value = "#" + value
-            else:
-                value = prefix[:-1] + "({},{},{})".format(*(val for val in value.split("_")))
-        except StopIteration:
-            value = ""
-    return value
+        value = palette.HSL[color_id]
+    return prefix[:-1] + "({},{},{})".format(*value)
 
 def print_colors(
         colormodes=[8],
@@ -0,0 +1,56 @@
+import pytest
+import pyansiescapes.commands as ansi
+
+
+@pytest.mark.parametrize("colormode", [256, 24])
+@pytest.mark.parametrize("hsl", [(0, 200, 50), (0, 50, -1), (120, 50, 101)])
+def test_invalid_hsl_value_raises_value_error(hsl, colormode):
+    with pytest.raises(ValueError, match="is not a valid hsl-value!"):
+        ansi.color(hsl=hsl, colormode=colormode)
+
+
+def test_hue_wraps_around():
+    assert (ansi.color(hsl=(480, 100, 50), colormode=24)
+            == ansi.color(hsl=(120, 100, 50), colormode=24))
+
+
+@pytest.mark.parametrize("kwargs", [{"color": "nosuchcolor"},
+                                    {"background": {"hsl": (0, 200, 50)}}])
+def test_style_validates_arguments_at_depth_0(kwargs):
+    with pytest.raises((KeyError, ValueError)):
+        ansi.Style(depth=0, **kwargs)
+
+
+def test_style_at_depth_0_returns_text():
+    style = ansi.Style("bold", color="red", depth=0)
+    assert style.codes == ()
+    assert style("text") == "text"
+
+
+@pytest.mark.parametrize("styles", [["bold"], ["bold"] * 4])
+def test_format_many_rejects_styles_of_other_length(styles):
+    with pytest.raises(ValueError, match="styles for 3 texts"):
+        ansi.format_many(["a", "b", "c"], styles=styles)
+
+
+def test_format_many_accepts_iterators():
+    styles = iter(["bold", "underline"])
+    assert (ansi.format_many(iter(["a", "b"]), styles=styles)
+            == ["\x1b[1ma\x1b[0m", "\x1b[4mb\x1b[0m"])
+
+
+@pytest.mark.parametrize("colormode", [8, 256, 24])
+@pytest.mark.parametrize("color_id", [-1, 256, "300"])
+def test_invalid_color_id_raises_value_error(color_id, colormode):
+    with pytest.raises(ValueError, match="is not a valid color id!"):
+        ansi.color(color_id=color_id, colormode=colormode)
+
+
+@pytest.mark.parametrize("hexa", ["#FF8700", "#Fa820A"])
+def test_upper_case_hex_matches_batch(hexa):
+    batch = pytest.importorskip("pyansiescapes.batch")
+    color_id = int(batch.nearest_color_ids_from_hex([hexa])[0])
+    assert ansi.color(hexa=hexa) == ansi.color(color_id=color_id)
+    assert ansi.color(hexa=hexa) == ansi.color(hexa=hexa.lower())
+    assert (ansi.color(hexa=hexa, colormode=24)
+            == ansi.color(hexa=hexa.lower(), colormode=24))
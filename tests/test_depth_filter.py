@@ -0,0 +1,25 @@
+import pytest
+import pyansiescapes.commands as ansi
+from pyansiescapes.depth_filter import DepthFilter, reduce_depth
+
+
+@pytest.mark.parametrize("depth", [8, 16, 256])
+@pytest.mark.parametrize("color_id", range(256))
+def test_filtered_colors_match_direct_colors(depth, color_id):
+    for drawing_level in ("foreground", "background"):
+        generated = ansi.color(color_id, drawing_level=drawing_level,
+                               colormode=256)
+        direct = ansi.color(color_id, drawing_level=drawing_level,
+                            colormode=256, depth=depth)
+        assert DepthFilter(depth).feed(generated) == direct
+
+
+def test_bright_colors_at_depth_16():
+    line = "\x1b[38;5;196mError\x1b[0m"
+    assert ("".join(reduce_depth([line], 16))
+            == ansi.format("Error", color="red1", depth=16))
+
+
+def test_depth_0_removes_sequences():
+    chunks = ["\x1b[1;38;5", ";196mError\x1b", "[0m\n"]
+    assert "".join(reduce_depth(chunks, 0)) == "Error\n"
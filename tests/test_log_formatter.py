@@ -0,0 +1,82 @@
+import io
+import logging
+import threading
+import pytest
+from pyansiescapes import terminal
+from pyansiescapes.log_formatter import ColorFormatter, ColorStreamHandler
+
+
+@pytest.fixture
+def log(monkeypatch):
+    monkeypatch.delenv("NO_COLOR", raising=False)
+    monkeypatch.delenv("FORCE_COLOR", raising=False)
+    terminal.clear_cache()
+
+    def log(stream, **kwargs):
+        handler = ColorStreamHandler(stream, **kwargs)
+        handler.setFormatter(ColorFormatter(
+            "%(levelname)s %(message)s",
+            level_styles={logging.INFO: {"color": "orange1"}}))
+        record = logging.LogRecord("test", logging.INFO, __file__, 1,
+                                   "message", None, None)
+        handler.emit(record)
+        return stream.getvalue()
+    yield log
+    terminal.clear_cache()
+
+
+def test_colors_are_reduced_to_stream_depth(log, monkeypatch):
+    monkeypatch.setenv("FORCE_COLOR", "1") # depth 16
+    assert log(io.StringIO()) == "\x1b[33mINFO\x1b[0m message\n"
+
+
+def test_stream_without_colors_gets_no_escape_sequences(log):
+    assert log(io.StringIO()) == "INFO message\n"
+
+
+def test_use_color_on_stream_without_colors(log):
+    assert (log(io.StringIO(), use_color=True)
+            == "\x1b[38;5;214mINFO\x1b[0m message\n")
+
+
+def test_set_stream_recompiles_for_new_depth(log, monkeypatch):
+    monkeypatch.setenv("FORCE_COLOR", "2") # depth 256
+    handler = ColorStreamHandler(io.StringIO())
+    handler.setFormatter(ColorFormatter(
+        "%(levelname)s %(message)s",
+        level_styles={logging.INFO: {"color": "orange1"}}))
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "message",
+                               None, None)
+    assert handler.format(record) == "\x1b[38;5;214mINFO\x1b[0m message"
+    monkeypatch.setenv("FORCE_COLOR", "1") # depth 16 for new streams
+    handler.setStream(io.StringIO())
+    assert handler.format(record) == "\x1b[33mINFO\x1b[0m message"
+    monkeypatch.setenv("FORCE_COLOR", "0")
+    handler.setStream(io.StringIO())
+    assert handler.format(record) == "INFO message"
+
+
+def test_records_from_threads_are_not_interleaved(log, monkeypatch):
+    monkeypatch.setenv("FORCE_COLOR", "1")
+    stream = io.StringIO()
+    logger = logging.getLogger("test_log_formatter.threads")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler = ColorStreamHandler(stream)
+    handler.setFormatter(ColorFormatter("%(levelname)s %(message)s"))
+    logger.addHandler(handler)
+    try:
+        def work(index):
+            for step in range(50):
+                logger.warning("thread %d step %d", index, step)
+        threads = [threading.Thread(target=work, args=(index,))
+                   for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        logger.removeHandler(handler)
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 400
+    assert all(line.startswith("\x1b[33mWARNING\x1b[0m") for line in lines)
@@ -0,0 +1,20 @@
+import pytest
+import pyansiescapes.commands as ansi
+from pyansiescapes import palette
+from pyansiescapes.enums import Colors256
+
+
+@pytest.mark.parametrize("name", ["hex_ff0000", "rgb_255_0_0", "hsl_0_100_50",
+                                  "HEX_FF0000"])
+def test_color256_alias_names_resolve(name):
+    assert ansi.color(name) == "\x1b[38;5;9m"
+
+
+def test_id_by_name_covers_all_members():
+    for name, member in Colors256.__members__.items():
+        assert palette.ID_BY_NAME[name] == int(member.value)
+
+
+def test_unknown_name_raises_key_error():
+    with pytest.raises(KeyError):
+        ansi.color("notacolor")
@@ -0,0 +1,45 @@
+import pytest
+from pyansiescapes import parser
+from pyansiescapes.parser import AnsiParser
+
+LINE = ("plain \x1b[1;38;5;208mhot\x1b[0m \x1b]8;;https://example.com\x07link"
+        "\x1b]8;;\x07 \x1b[48;2;0;0;255mblue\x1b[0m\n")
+
+
+def parse_chunks(chunks):
+    spans = list(parser.parse(chunks))
+    # merge spans split by the chunk boundaries
+    merged = []
+    for span in spans:
+        if merged and merged[-1].style == span.style:
+            merged[-1] = merged[-1]._replace(text=merged[-1].text + span.text)
+        else:
+            merged.append(span)
+    return merged
+
+
+@pytest.mark.parametrize("split", range(1, len(LINE)))
+def test_split_escape_sequence(split):
+    assert parse_chunks([LINE[:split], LINE[split:]]) == parse_chunks([LINE])
+
+
+def test_one_character_chunks():
+    assert parse_chunks(list(LINE)) == parse_chunks([LINE])
+
+
+def test_incomplete_sequence_at_end_is_returned_as_text():
+    feed = AnsiParser()
+    assert [span.text for span in feed.feed("end\x1b[38;5")] == ["end"]
+    assert [span.text for span in feed.close()] == ["\x1b[38;5"]
+
+
+def test_oversized_sequence_is_not_kept_back():
+    feed = AnsiParser()
+    chunks = ["a\x1b]0;"] + ["x" * 1000] * 10 + ["\x07b"]
+    texts = []
+    for chunk in chunks:
+        texts.extend(span.text for span in feed.feed(chunk))
+        assert len(feed._pending) <= parser.MAX_PENDING
+    texts.extend(span.text for span in feed.close())
+    # the unterminated sequence is passed on as text, nothing is lost
+    assert "".join(texts) == "".join(chunks)
@@ -0,0 +1,58 @@
+import io
+import threading
+from pyansiescapes.status_board import StatusBoard
+
+
+def run_threads(target, count):
+    threads = [threading.Thread(target=target, args=(index,))
+               for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_workers():
+    out = io.StringIO()
+    with StatusBoard(out, fps=1000) as board:
+        def work(index):
+            slot = board.add_slot()
+            for step in range(100):
+                board[slot] = "worker {}: {}".format(index, step)
+                if step % 10 == 0:
+                    board.print("worker {} step {}".format(index, step))
+        run_threads(work, 8)
+
+    assert len(board) == 8
+    assert sorted(board[slot] for slot in range(8)) == sorted(
+        "worker {}: 99".format(index) for index in range(8))
+    output = out.getvalue()
+    for index in range(8):
+        for step in range(0, 100, 10):
+            assert output.count("worker {} step {}\n".format(index, step)) == 1
+    # the final frame was painted, nothing is left to paint
+    assert board.render() == ""
+
+
+def test_add_slot_from_threads_gives_unique_slots():
+    board = StatusBoard(io.StringIO())
+    slots = []
+    run_threads(lambda index: slots.append(board.add_slot(str(index))), 16)
+    assert sorted(slots) == list(range(16))
+    assert sorted(board[slot] for slot in slots) == sorted(
+        str(index) for index in range(16))
+
+
+def test_restart_after_stop():
+    out = io.StringIO()
+    board = StatusBoard(out, slots=1)
+    board.start()
+    board[0] = "first"
+    board.stop()
+    board.stop() # stopped already
+    board.start()
+    board[0] = "second"
+    board.stop()
+    output = out.getvalue()
+    # the line is painted again in place by the second render thread
+    assert output.index("first") < output.index("\rsecond")
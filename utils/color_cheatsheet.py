@@ -1,6 +1,6 @@
 import json
 import pyansiescapes as ansi
-from pyansiescapes.pyansiescapesenums import Colors256
+from pyansiescapes import palette, text
 import logging
 import sys
 
@@ -35,7 +35,7 @@ def _color_value_to_string(color_value, key):
 def _print_color(ansi_code, display_name="", display_string_length=6):
     #print("{}{}{}m".format(drawing_level, color, additional_attributes), end="")
     print(ansi_code
-          + display_name.ljust(display_string_length)
+          + text.ljust(display_name, display_string_length)
           + ansi.reset(), end = "")
 
 def _get_display_string_legth(display_colorid=True,
@@ -45,8 +45,7 @@ def _get_display_string_legth(display_colorid=True,
                               display_hsl=True):
     display_string_length = 6
     if display_colorname:
-        name_keys = (key for key in Colors256.__members__.keys() if "_" not in key)
-        display_string_length += len(max(chain(name_keys), key=len))
+        display_string_length += len(max(palette.NAMES, key=len))
     if display_hex:
         display_string_length += 9
     if display_rgb:
@@ -105,12 +104,11 @@ def get_unique_values(color_data, key):
     return unqiues
 
 def get_unique_values_from_colors256(key):
-    unqiues = [set(), set(), set()]
-    color_data = (color[4:].split("_") for color in Colors256.__members__.keys() if color.startswith(key))
-    for color in color_data:
-        for i,value in enumerate(color):
-            unqiues[i].add(int(value))
-    return unqiues
+    if key == "rgb":
+        color_data = (palette.unpack_rgb(rgb) for rgb in palette.RGB)
+    else:
+        color_data = palette.HSL
+    return [set(values) for values in zip(*color_data)]
 
 if __name__ == '__main__':
     logger = logging.basicConfig(level=logging.WARN)